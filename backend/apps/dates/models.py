@@ -7,12 +7,32 @@ from django.utils.safestring import SafeString
 from django.utils.translation import ugettext_lazy as _
 
 from apps.dates.fields import HistoricDateTimeField
-from apps.dates.structures import HistoricDateTime
+from apps.dates.structures import (
+    DAY_PRECISION,
+    MONTH_PRECISION,
+    SEASON_PRECISION,
+    YEAR_PRECISION,
+    HistoricDateTime,
+)
 from core.models.model import ExtendedModel
 
 CIRCA_PREFIX = 'c. '
 
 
+def get_month_day(month: int, day: int) -> int:
+    """Return the value identifying a day of the year, e.g., 704 for 4 July."""
+    return month * 100 + day
+
+
+class DatePrecision(models.IntegerChoices):
+    """Levels of precision with which a date is known."""
+
+    YEAR = YEAR_PRECISION, _('year')
+    SEASON = SEASON_PRECISION, _('season')
+    MONTH = MONTH_PRECISION, _('month')
+    DAY = DAY_PRECISION, _('day')
+
+
 class DatedModel(ExtendedModel):
     """A model with a date (e.g., a quote or occurrence)."""
 
@@ -48,7 +68,42 @@ class DatedModel(ExtendedModel):
         editable=False,
         verbose_name=_('date string'),
     )
-    date_string.admin_order_field = 'date'  # type: ignore
+    date_string.admin_order_field = 'date_position'  # type: ignore
+
+    # Denormalized representations of the date, kept in sync on save, so that
+    # dated models (including those dated BCE) can be sorted and range-filtered
+    # by the database.
+    astronomical_year = models.IntegerField(
+        verbose_name=_('astronomical year'),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text='signed year of the date (1 BCE is year 0)',
+    )
+    date_position = models.FloatField(
+        verbose_name=_('date position'),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text='position of the date on a continuous scale increasing with time',
+    )
+    date_precision = models.PositiveSmallIntegerField(
+        verbose_name=_('date precision'),
+        choices=DatePrecision.choices,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    date_month_day = models.PositiveSmallIntegerField(
+        verbose_name=_('date month and day'),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text='month and day of the date (e.g., 704 for 4 July), if the day is known',
+    )
 
     # https://docs.djangoproject.com/en/dev/ref/models/options/#model-meta-options
     class Meta:
@@ -60,6 +115,7 @@ class DatedModel(ExtendedModel):
         if isinstance(self.end_date, str):
             self.end_date = HistoricDateTime.from_iso(self.end_date)
         self.date_string = self.get_date_string()
+        self.update_timeline_fields()
         super().clean()
 
     @property
@@ -73,6 +129,26 @@ class DatedModel(ExtendedModel):
             year_html = year_html.replace(f'{CIRCA_PREFIX}{CIRCA_PREFIX}', CIRCA_PREFIX)
         return format_html(year_html)
 
+    def update_timeline_fields(self):
+        """Update the denormalized representations of the model instance's date."""
+        date = self.get_date()
+        if isinstance(date, str):
+            date = HistoricDateTime.from_iso(date)
+        elif date and not isinstance(date, HistoricDateTime):
+            date = HistoricDateTime.from_datetime(date)
+        if date:
+            self.astronomical_year = date.astronomical_year
+            self.date_position = date.chronological_position
+            self.date_precision = date.precision
+            self.date_month_day = (
+                get_month_day(date.month, date.day)
+                if date.precision == DAY_PRECISION
+                else None
+            )
+        else:
+            self.astronomical_year = self.date_position = self.date_precision = None
+            self.date_month_day = None
+
     def get_date_string(self) -> str:
         """Return the string representation of the model instance's date."""
         date, date_string = self.get_date(), ''
@@ -46,6 +46,12 @@ MILLIFICATION_FLOOR = ONE_MILLION
 # Year values larger than this should be "prettified" with commas
 PRETTIFICATION_FLOOR = TEN_THOUSAND
 
+# Levels of precision with which a datetime is known
+YEAR_PRECISION = 1
+SEASON_PRECISION = 2
+MONTH_PRECISION = 3
+DAY_PRECISION = 4
+
 EXPONENT_INVERSION_BASIS = 30  # --> 20 for the Big Bang
 DECIMAL_INVERSION_BASIS = 100_000  # --> 986200 for the Big Bang
 
@@ -286,3 +292,42 @@ class HistoricDateTime(datetime):
             # 366 accounts for leap years, and the offset is otherwise insignificant
             timeline_position += (self.timetuple().tm_yday - 1) / 366
         return timeline_position
+
+    @property
+    def astronomical_year(self) -> int:
+        """
+        Return the signed year of the datetime, in astronomical year numbering.
+
+        1 BCE is year 0, 2 BCE is year -1, and so on, so that years (including
+        years BCE) are ordered numerically.
+        """
+        if self.year_bce:
+            return 1 - self.year_bce
+        return self.year
+
+    @property
+    def precision(self) -> int:
+        """Return the level of precision with which the datetime is known."""
+        if self.day_is_known:
+            return DAY_PRECISION
+        elif self.month_is_known:
+            return MONTH_PRECISION
+        elif self.season_is_known:
+            return SEASON_PRECISION
+        return YEAR_PRECISION
+
+    @property
+    def chronological_position(self) -> float:
+        """
+        Return the datetime's position on a continuous floating-point scale.
+
+        Unlike `timeline_position` (which is measured in years before present),
+        the position increases with time, so that datetimes are ordered by it.
+        """
+        position = float(self.astronomical_year)
+        if self.day_is_known:
+            # 366 accounts for leap years, and the offset is otherwise insignificant
+            position += (self.timetuple().tm_yday - 1) / 366
+        elif self.month_is_known:
+            position += (self.month - 1) / 12
+        return position
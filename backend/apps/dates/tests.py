@@ -1 +1,46 @@
-# Create your tests here.
+from apps.admin.widgets.historic_date_widget import BCE, CE
+from apps.admin.widgets.historic_date_widget import (
+    _datetime_from_datadict_values as historicdate_from_year,
+)
+from apps.dates.structures import DAY_PRECISION, YEAR_PRECISION, HistoricDateTime
+
+
+def test_astronomical_year():
+    """Test that years BCE are converted to signed astronomical years."""
+    assert historicdate_from_year(1, BCE).astronomical_year == 0
+    assert historicdate_from_year(500, BCE).astronomical_year == -499
+    assert historicdate_from_year(1500, CE).astronomical_year == 1500
+
+
+def test_chronological_position():
+    """Test that chronological positions are ordered like the dates they represent."""
+    dates = [
+        historicdate_from_year(10_000, BCE),
+        historicdate_from_year(500, BCE),
+        historicdate_from_year(1, CE),
+        historicdate_from_year(1500, CE),
+        HistoricDateTime(1500, 7, 4),
+    ]
+    positions = [date.chronological_position for date in dates]
+    assert positions == sorted(positions)
+    assert len(set(positions)) == len(positions)
+
+
+def test_chronological_position_across_years():
+    """Test that day-precision dates are ordered across year boundaries."""
+    dates = [
+        HistoricDateTime(1500, 7, 4),
+        HistoricDateTime(1500, 12, 31),
+        HistoricDateTime(1501, 1, 1),
+        HistoricDateTime(1501, 6, 1),
+        HistoricDateTime(1501, 12, 31),
+    ]
+    positions = [date.chronological_position for date in dates]
+    assert positions == sorted(positions)
+    assert all(1500 <= position < 1502 for position in positions)
+
+
+def test_precision():
+    """Test the precision with which dates are known."""
+    assert historicdate_from_year(1500, CE).precision == YEAR_PRECISION
+    assert HistoricDateTime(1500, 7, 4).precision == DAY_PRECISION
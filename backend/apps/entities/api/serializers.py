@@ -96,6 +96,11 @@ class EntitySerializer(WritableNestedModelSerializer, TypedModuleSerializer):
     class Meta(TypedModuleSerializer.Meta):
         model = Entity
         read_only_fields = ['truncated_description']
+        prefetch_related = TypedModuleSerializer.Meta.prefetch_related + [
+            'categorizations__category',
+            'birth__arguments___supports',
+            'death__arguments___supports',
+        ]
         fields = TypedModuleSerializer.Meta.fields + [
             'name',
             'unabbreviated_name',
@@ -3,6 +3,7 @@ from rest_framework.views import APIView
 
 from apps.entities.api.serializers import EntitySerializer
 from apps.entities.models.entity import Entity
+from apps.search import instant
 from apps.search.documents.entity import EntityInstantSearchDocument
 from core.api.views import ExtendedModelViewSet
 
@@ -27,9 +28,6 @@ class EntityInstantSearchAPIView(APIView):
         query = request.query_params.get('query', '')
         if len(query) == 0:
             return Response([])
-        results = (
-            EntityInstantSearchDocument.search()
-            .query('multi_match', query=query)
-            .source(['name'])
+        return Response(
+            instant.get_results(EntityInstantSearchDocument, query, source_fields=['name'])
         )
-        return Response([{'id': result.meta.id} | result.to_dict() for result in results])
@@ -0,0 +1,113 @@
+"""
+Categorization timelines of entities.
+
+An entity's categorization timeline lists its categorizations, with the date
+ranges in which they apply and their categories' parts of speech and weights.
+Timelines are stored in the entities' caches, so that an entity can be labeled
+(e.g., as a "liberal scholar") for any date without querying the database.
+"""
+
+from typing import TYPE_CHECKING, Iterable, Optional, TypedDict
+
+from apps.dates.structures import (
+    DAY_PRECISION,
+    MONTH_PRECISION,
+    SEASON_PRECISION,
+    HistoricDateTime,
+)
+from core.constants.strings import EMPTY_STRING
+from core.models.manager import get_date_position
+
+if TYPE_CHECKING:
+    from apps.entities.models import Categorization
+
+TIMELINE_CACHE_KEY = 'categorization_timeline'
+
+# Parts of speech in the order in which their words are prepended to a label
+PARTS_OF_SPEECH = ('noun', 'any', 'adj')
+
+# Spans (in years) of dates known with the precision of a day, month, or season
+PRECISION_SPANS = {
+    DAY_PRECISION: 1 / 366,
+    MONTH_PRECISION: 1 / 12,
+    SEASON_PRECISION: 1 / 4,
+}
+
+
+class TimelineEntry(TypedDict):
+    """A categorization in a categorization timeline."""
+
+    category: str
+    part_of_speech: str
+    weight: int
+    # Positions (see `HistoricDateTime.chronological_position`) of the start and end
+    # of the date range in which the categorization applies, if known
+    start: Optional[float]
+    end: Optional[float]
+
+
+def get_timeline_entry(categorization: 'Categorization') -> TimelineEntry:
+    """Return the timeline entry of a categorization."""
+    category = categorization.category
+    start_date: Optional[HistoricDateTime] = categorization.date
+    end_date: Optional[HistoricDateTime] = categorization.end_date
+    end = None
+    if end_date:
+        # The categorization applies until the end of its end date (e.g., until
+        # the end of its end year if the end date is only known to the year).
+        end = get_date_position(end_date) + PRECISION_SPANS.get(end_date.precision, 1)
+    return {
+        'category': str(category),
+        'part_of_speech': category.part_of_speech,
+        'weight': category.weight,
+        'start': get_date_position(start_date) if start_date else None,
+        'end': end,
+    }
+
+
+def build_timeline(categorizations: Iterable['Categorization']) -> list[TimelineEntry]:
+    """Return the timeline of an entity's categorizations (with their categories)."""
+    return [get_timeline_entry(categorization) for categorization in categorizations]
+
+
+def get_applicable_entries(
+    timeline: list[TimelineEntry], date: Optional[HistoricDateTime] = None
+) -> list[TimelineEntry]:
+    """Return the entries of a timeline that apply at the specified date (if any)."""
+    if not date:
+        return list(timeline)
+    position = get_date_position(date)
+    return [
+        entry
+        for entry in timeline
+        if (entry['start'] is None or entry['start'] <= position)
+        and (entry['end'] is None or position < entry['end'])
+    ]
+
+
+def get_sort_key(entry: TimelineEntry) -> tuple:
+    """Return a key by which entries are sorted in order of increasing applicability."""
+    # Entries with unknown start dates are sorted after entries with known start
+    # dates (like nulls in ascending database orderings).
+    start = float('inf') if entry['start'] is None else entry['start']
+    return entry['weight'], start
+
+
+def get_label(timeline: list[TimelineEntry], date: Optional[HistoricDateTime] = None) -> str:
+    """
+    Build a label (like `liberal scholar`) from a categorization timeline.
+
+    For each part of speech, the heaviest (and then latest) of the categorizations
+    that apply at the date is included in the label.
+    """
+    entries = get_applicable_entries(timeline, date)
+    words: list[str] = []
+    for part_of_speech in PARTS_OF_SPEECH:
+        pos_entries = [
+            entry for entry in entries if entry['part_of_speech'] == part_of_speech
+        ]
+        if pos_entries:
+            category = max(pos_entries, key=get_sort_key)['category']
+            words = [word for word in category.split(' ') if word not in words] + words
+    # Remove duplicate words
+    return ' '.join(dict.fromkeys(words)) or EMPTY_STRING
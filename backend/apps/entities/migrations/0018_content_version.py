@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entities', '0017_auto_20210825_2339'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entity',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+    ]
@@ -12,6 +12,12 @@ from rest_framework.serializers import Serializer
 from apps.collections.models import AbstractCollectionInclusion
 from apps.dates.fields import HistoricDateTimeField
 from apps.dates.structures import HistoricDateTime
+from apps.entities.categorizations import (
+    TIMELINE_CACHE_KEY,
+    TimelineEntry,
+    build_timeline,
+    get_label,
+)
 from apps.entities.models.model_with_related_entities import (
     AbstractEntityRelation,
     ModelWithRelatedEntities,
@@ -28,7 +34,6 @@ from apps.quotes.models.model_with_related_quotes import (
     RelatedQuotesField,
 )
 from apps.topics.models.taggable import AbstractTopicRelation, TaggableModel, TagsField
-from core.constants.strings import EMPTY_STRING
 from core.fields.array_field import ArrayField
 from core.fields.html_field import HTMLField
 from core.fields.json_field import JSONField
@@ -226,31 +231,22 @@ class Entity(
         )
         return categorizations.select_related('category')
 
-    @store(key='categorization_string')
+    @property
+    @store(key=TIMELINE_CACHE_KEY, depends_on=('categories', 'categorizations'))
+    def categorization_timeline(self) -> list[TimelineEntry]:
+        """Return the entity's categorizations, with the date ranges in which they apply."""
+        return build_timeline(self.categorizations.select_related('category'))
+
     def get_categorization_string(self, date: Optional[HistoricDateTime] = None) -> str:
-        """Intelligently build a categorization string, like `liberal scholar`."""
-        categorizations: 'QuerySet[Categorization]' = self.get_categorizations(date)
-        if categorizations:
-            # Build the string
-            categorization_words: list[str] = []
-            for part_of_speech in ('noun', 'any', 'adj'):
-                pos_categorizations = categorizations.filter(
-                    category__part_of_speech=part_of_speech
-                )
-                if pos_categorizations.exists():
-                    categorization_str = str(
-                        pos_categorizations.order_by('category__weight', 'date').last()
-                    )
-                    words = [
-                        word
-                        for word in categorization_str.split(' ')
-                        if word not in categorization_words
-                    ]
-                    categorization_words = words + categorization_words
-            # Remove duplicate words
-            categorization_words = list(dict.fromkeys(categorization_words))
-            return ' '.join(categorization_words)
-        return EMPTY_STRING
+        """
+        Intelligently build a categorization string, like `liberal scholar`.
+
+        The string is built from the entity's categorization timeline, which is
+        retrieved from the entity's cache, so that strings for different dates
+        (e.g., the dates of quotes attributed to the entity) are built without
+        querying the database.
+        """
+        return get_label(self.categorization_timeline or [], date)
 
     def validate_type(self, raises: type[Exception] = ValidationError):
         """Validate the entity's type."""
@@ -1,12 +1,12 @@
 """Classes for models with related entities."""
 
-import re
 from typing import TYPE_CHECKING, Union
 
 from django.db import models
 from django.db.models import QuerySet
 from django.utils.translation import ugettext_lazy as _
 
+from apps.entities.tagging import tag_entity_names
 from core.fields.custom_m2m_field import CustomManyToManyField
 from core.fields.m2m_foreign_key import ManyToManyForeignKey
 from core.models.model import ExtendedModel
@@ -92,27 +92,20 @@ class ModelWithRelatedEntities(ExtendedModel):
         return self.related_entities.all()
 
     @property  # type: ignore
-    @store(key='serialized_entities')
+    @store(
+        key='serialized_entities',
+        depends_on=(
+            'related_entities',
+            'entity_relations',
+            'attributees',
+            'attributions',
+        ),
+    )
     def serialized_entities(self) -> list[dict]:
         """Return a list of dictionaries representing the instance's images."""
-        return [entity.serialize() for entity in self._related_entities.all().iterator()]
+        return [entity.serialize() for entity in self._related_entities.all()]
 
     def preprocess_html(self, html: str) -> str:
         """Modify the value of an HTML field during cleaning."""
         # Wrap entity names in spans to identify them (so that links can be added if desired).
-        entities = self.serialized_entities
-        if entities:
-            for entity in entities:
-                aliases = entity.get('aliases') or []
-                for name in set([entity['name']] + aliases):
-                    opening_tag = (
-                        f'<span class="entity-name" data-entity-id="{entity["slug"]}">'
-                    )
-                    closing_tag = '</span>'
-                    html = re.sub(
-                        # match instances not in quotations
-                        rf'(^|^<p>|[^>])({name})(?:(?!\w|[^\ ]\"))',
-                        rf'\g<1>{opening_tag}\g<2>{closing_tag}',
-                        html,
-                    )
-        return html
+        return tag_entity_names(html, self.serialized_entities)
@@ -0,0 +1,124 @@
+"""
+Tagging of entity names in HTML.
+
+The names and aliases of an instance's related entities are compiled into a
+single trie-shaped regex, which is matched against the text of the HTML (but not
+against markup or already-tagged names) in one pass. Compiled taggers are reused
+for as long as the set of entity names is unchanged.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from apps.search.rewriting import MARKUP_PATTERN
+
+OPENING_TAG_TEMPLATE = '<span class="entity-name" data-entity-id="{}">'
+CLOSING_TAG = '</span>'
+
+# Entity names that have already been tagged are matched before other markup,
+# so that they are not tagged again.
+TAGGED_NAME_PATTERN = r'<span class="entity-name"[^>]*>[\s\S]*?</span>'
+TOKEN_REGEX = re.compile(rf'{TAGGED_NAME_PATTERN}|{MARKUP_PATTERN}', re.IGNORECASE)
+
+# Names must not be part of longer words, nor be followed by a closing quotation mark.
+NAME_PREFIX_PATTERN = r'(?<!\w)'
+NAME_SUFFIX_PATTERN = r'(?!\w|[^\ ]")'
+
+END = ''
+
+# Entity names, as a tuple of (key, names) pairs
+EntityNames = tuple[tuple[str, tuple[str, ...]], ...]
+
+
+def get_trie_pattern(words: Iterable[str]) -> str:
+    """
+    Return a regex pattern matching any of the words, structured as a trie.
+
+    Alternatives with common prefixes are merged (e.g., `Adams` and `Adamson` into
+    `Adams(?:on)?`), so that each position is matched with at most one branch per
+    character, rather than with every word. Longer words are preferred.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[END] = {}
+    return get_node_pattern(trie)
+
+
+def get_node_pattern(node: dict) -> str:
+    """Return the pattern matching the suffixes represented by a trie node."""
+    alternatives = [
+        f'{re.escape(char)}{get_node_pattern(child)}'
+        for char, child in sorted(node.items())
+        if char != END
+    ]
+    if not alternatives:
+        return ''
+    pattern = alternatives[0] if len(alternatives) == 1 else f'(?:{"|".join(alternatives)})'
+    if END in node:
+        pattern = f'(?:{pattern})?'
+    return pattern
+
+
+class EntityTagger:
+    """Tagger of the names of a set of entities."""
+
+    def __init__(self, entity_names: EntityNames):
+        """Compile the names and aliases of the entities."""
+        self.keys_by_name: dict[str, str] = {}
+        for key, names in entity_names:
+            for name in names:
+                if name:
+                    self.keys_by_name.setdefault(name, key)
+        self.regex: Optional[re.Pattern] = None
+        if self.keys_by_name:
+            trie_pattern = get_trie_pattern(self.keys_by_name)
+            self.regex = re.compile(
+                f'{NAME_PREFIX_PATTERN}(?:{trie_pattern}){NAME_SUFFIX_PATTERN}'
+            )
+
+    def tag_name(self, match: re.Match) -> str:
+        """Return a matched entity name, wrapped in a span identifying the entity."""
+        name = match.group(0)
+        opening_tag = OPENING_TAG_TEMPLATE.format(self.keys_by_name[name])
+        return f'{opening_tag}{name}{CLOSING_TAG}'
+
+    def tag(self, html: str) -> str:
+        """Wrap the entity names in the text of the HTML in spans identifying them."""
+        if not self.regex or not html:
+            return html
+        components: list[str] = []
+        position = 0
+        for match in TOKEN_REGEX.finditer(html):
+            components.append(self.regex.sub(self.tag_name, html[position : match.start()]))
+            components.append(match.group(0))
+            position = match.end()
+        components.append(self.regex.sub(self.tag_name, html[position:]))
+        return ''.join(components)
+
+
+def get_entity_names(serialized_entities: list[dict]) -> EntityNames:
+    """Return the keys, names, and aliases of serialized entities."""
+    return tuple(
+        (
+            entity['slug'],
+            tuple(sorted({entity['name'], *(entity.get('aliases') or [])})),
+        )
+        for entity in serialized_entities
+    )
+
+
+@lru_cache(maxsize=256)
+def get_tagger(entity_names: EntityNames) -> EntityTagger:
+    """Return the (compiled) tagger of a set of entity names."""
+    return EntityTagger(entity_names)
+
+
+def tag_entity_names(html: str, serialized_entities: list[dict]) -> str:
+    """Wrap the names of the entities in the HTML in spans identifying them."""
+    if not serialized_entities:
+        return html
+    return get_tagger(get_entity_names(serialized_entities)).tag(html)
@@ -5,8 +5,12 @@ import json
 import pytest
 from graphene_django.utils.testing import graphql_query
 
-from apps.entities.factories import EntityFactory
+from apps.dates.structures import HistoricDateTime
+from apps.entities.categorizations import TIMELINE_CACHE_KEY, get_label
+from apps.entities.factories import EntityFactory, ParentlessCategoryFactory
+from apps.entities.models import Categorization
 from apps.entities.models.entity import Entity
+from apps.entities.tagging import get_entity_names, get_tagger, tag_entity_names
 from core.tests import TestSuite
 
 
@@ -48,3 +52,90 @@ class EntitiesTestSuite(TestSuite):
         content = json.loads(response.content)
         assert 'errors' not in content
         assert 'entity' in f'{content}'
+
+
+def test_categorization_label():
+    """Test building date-specific labels from a categorization timeline."""
+
+    def entry(category: str, part_of_speech: str, weight: int, start=None, end=None):
+        return {
+            'category': category,
+            'part_of_speech': part_of_speech,
+            'weight': weight,
+            'start': start,
+            'end': end,
+        }
+
+    timeline = [
+        entry('scholar', 'noun', 1),
+        entry('senator', 'noun', 2, start=1850.0, end=1861.0),
+        entry('liberal', 'adj', 1),
+    ]
+    assert get_label(timeline) == 'liberal senator'
+    assert get_label(timeline, HistoricDateTime(1840, 1, 1)) == 'liberal scholar'
+    assert get_label(timeline, HistoricDateTime(1855, 1, 1)) == 'liberal senator'
+    assert get_label(timeline, HistoricDateTime(1870, 1, 1)) == 'liberal scholar'
+    assert get_label([]) == ''
+
+
+@pytest.mark.django_db()
+def test_categorization_timeline(django_assert_num_queries):
+    """Test storing an entity's categorization timeline in its cache."""
+    entity: Entity = EntityFactory.create()
+    scholar, senator, liberal = (
+        ParentlessCategoryFactory.create(
+            name=name, part_of_speech=part_of_speech, weight=weight
+        )
+        for name, part_of_speech, weight in (
+            ('scholar', 'noun', 1),
+            ('senator', 'noun', 2),
+            ('liberal', 'adj', 1),
+        )
+    )
+    Categorization.objects.create(entity=entity, category=scholar, verified=True)
+    Categorization.objects.create(
+        entity=entity,
+        category=senator,
+        date=HistoricDateTime(1850, 1, 1),
+        end_date=HistoricDateTime(1860, 12, 31),
+        verified=True,
+    )
+    entity = Entity.objects.get(pk=entity.pk)
+    timeline = entity.categorization_timeline
+    assert sorted(entry['category'] for entry in timeline) == ['scholar', 'senator']
+    assert entity.get_categorization_string(HistoricDateTime(1855, 1, 1)) == 'senator'
+    assert entity.get_categorization_string(HistoricDateTime(1870, 1, 1)) == 'scholar'
+
+    # The timeline is retrieved from the cache without querying the categorizations.
+    entity = Entity.objects.get(pk=entity.pk)
+    assert entity.cache[TIMELINE_CACHE_KEY] == timeline
+    with django_assert_num_queries(0):
+        assert entity.categorization_timeline == timeline
+
+    # Adding a categorization clears the cached timeline.
+    Categorization.objects.create(entity=entity, category=liberal, verified=True)
+    entity = Entity.objects.get(pk=entity.pk)
+    assert TIMELINE_CACHE_KEY not in (entity.cache or {})
+    assert entity.get_categorization_string(HistoricDateTime(1870, 1, 1)) == 'liberal scholar'
+
+
+def test_entity_tagging():
+    """Test tagging the names of entities in HTML."""
+    entities = [
+        {'slug': 'john-adams', 'name': 'John Adams', 'aliases': ['Adams']},
+        {'slug': 'john-quincy-adams', 'name': 'John Quincy Adams', 'aliases': []},
+    ]
+    html = (
+        '<p>John Adams and John Quincy Adams (not McAdams) '
+        '<a title="Adams">wrote</a> to Adams.</p>'
+    )
+    tagged_html = tag_entity_names(html, entities)
+    assert tagged_html == (
+        '<p><span class="entity-name" data-entity-id="john-adams">John Adams</span> and '
+        '<span class="entity-name" data-entity-id="john-quincy-adams">John Quincy Adams'
+        '</span> (not McAdams) <a title="Adams">wrote</a> to '
+        '<span class="entity-name" data-entity-id="john-adams">Adams</span>.</p>'
+    )
+    # Tagged names are not tagged again.
+    assert tag_entity_names(tagged_html, entities) == tagged_html
+    assert get_tagger(get_entity_names(entities)) is get_tagger(get_entity_names(entities))
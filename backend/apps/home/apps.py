@@ -5,3 +5,9 @@ class HomeConfig(AppConfig):
     """Config for the home app."""
 
     name = 'apps.home'
+
+    def ready(self) -> None:
+        """Perform initialization tasks for the home app."""
+        from . import signals  # noqa: F401
+
+        return super().ready()
@@ -0,0 +1,35 @@
+"""
+Responders to Django signals for the home app.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.home.today_in_history import invalidate_feed
+from apps.propositions.models import Proposition
+from apps.quotes.models import Quote
+
+
+@receiver(pre_save)
+def record_original_month_day(sender, instance, **kwargs):
+    """Record the month and day (in the db) of an instance that might be in a feed."""
+    if isinstance(instance, (Proposition, Quote)):
+        instance._original_date_month_day = None
+        if not instance._state.adding:
+            instance._original_date_month_day = (
+                sender._base_manager.filter(pk=instance.pk)
+                .values_list('date_month_day', flat=True)
+                .first()
+            )
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_today_in_history(sender, instance, **kwargs):
+    """Remove the cached "Today in History" feeds that might include the instance."""
+    if isinstance(instance, (Proposition, Quote)):
+        invalidate_feed(instance.date_month_day)
+        # If the instance was moved to another day, it must be removed from the
+        # feed of its original day.
+        original_month_day = getattr(instance, '_original_date_month_day', None)
+        if original_month_day != instance.date_month_day:
+            invalidate_feed(original_month_day)
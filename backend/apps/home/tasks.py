@@ -0,0 +1,19 @@
+from datetime import timedelta
+
+from celery import Task
+from django.utils import timezone
+
+from apps.home import today_in_history
+from core.celery import app
+
+
+@app.task(bind=True)
+def cache_today_in_history(self: Task, days_ahead: int = 1) -> int:
+    """
+    Build and cache the "Today in History" feed ahead of time.
+
+    By default, the feed is built for the following day, so that it is cached
+    before the first request of the day. Return the number of items in the feed.
+    """
+    day = timezone.localdate() + timedelta(days=days_ahead)
+    return len(today_in_history.cache_feed(day))
@@ -0,0 +1,36 @@
+"""Tests for the home app."""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.dates.structures import HistoricDateTime
+from apps.home import today_in_history
+from apps.quotes.factories import QuoteFactory
+
+
+@pytest.mark.django_db()
+class TestHome:
+    """Test the home app."""
+
+    def test_today_in_history(self):
+        """Test that cached feeds are invalidated when a module's date changes."""
+        cache.clear()
+        today = timezone.localdate()
+        tomorrow = today + timedelta(days=1)
+        quote = QuoteFactory.create(
+            date=HistoricDateTime(1776, today.month, today.day), date_is_circa=False
+        )
+        assert [item['pk'] for item in today_in_history.get_feed()] == [quote.pk]
+        assert today_in_history.get_feed(tomorrow) == []
+
+        # Moving the quote to another day invalidates the feeds of both days.
+        quote.date = HistoricDateTime(1776, tomorrow.month, tomorrow.day)
+        quote.save(moderate=False)
+        assert today_in_history.get_feed() == []
+        assert [item['pk'] for item in today_in_history.get_feed(tomorrow)] == [quote.pk]
+
+        quote.delete(hard=True)
+        assert today_in_history.get_feed(tomorrow) == []
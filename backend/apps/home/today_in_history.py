@@ -0,0 +1,72 @@
+"""
+Precomputed "Today in History" feed.
+
+The feed for each day of the year (i.e., the occurrences and quotes dated to that
+month and day) is serialized ahead of time by a nightly Celery task and cached
+until the end of the day, so that serving the feed requires a single cache read.
+"""
+
+from datetime import date, datetime, time, timedelta
+from itertools import chain
+from typing import Optional
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.dates.models import get_month_day
+from core.utils.models import serialize_instances
+
+CACHE_KEY_PREFIX = 'today_in_history'
+
+
+def get_cache_key(month_day: int) -> str:
+    """Return the key of the cached feed for a day of the year (e.g., 704 for 4 July)."""
+    return f'{CACHE_KEY_PREFIX}:{month_day}'
+
+
+def get_seconds_until_end_of_day(day: date) -> int:
+    """Return the number of seconds until the end (i.e., midnight) of the specified day."""
+    midnight = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+    return max(int((midnight - timezone.now()).total_seconds()), 0)
+
+
+def build_feed(day: date) -> list[dict]:
+    """Return the serialized modules dated to the month and day of the specified date."""
+    from apps.propositions.models import Occurrence
+    from apps.quotes.models import Quote
+
+    # Modules with unknown days (automatically set to the 1st of the month)
+    # have no `date_month_day` value.
+    date_filter = {
+        'date_month_day': get_month_day(day.month, day.day),
+        'date_is_circa': False,
+    }
+    occurrences = Occurrence.objects.filter(**date_filter)
+    quotes = Quote.objects.filter(**date_filter)
+    # Temporarily exclude entities until we have a better way of indicating
+    # that they were _born_ on this day.
+    return serialize_instances(chain(occurrences, quotes))
+
+
+def cache_feed(day: date) -> list[dict]:
+    """Build the feed for the specified date and cache it until the end of the day."""
+    feed = build_feed(day)
+    timeout = get_seconds_until_end_of_day(day)
+    if timeout:
+        cache.set(get_cache_key(get_month_day(day.month, day.day)), feed, timeout)
+    return feed
+
+
+def get_feed(day: Optional[date] = None) -> list[dict]:
+    """Return the feed for the specified date (today by default), from the cache if possible."""
+    day = day or timezone.localdate()
+    feed = cache.get(get_cache_key(get_month_day(day.month, day.day)))
+    if feed is None:
+        feed = cache_feed(day)
+    return feed
+
+
+def invalidate_feed(month_day: Optional[int]):
+    """Remove the cached feed for a day of the year, if any."""
+    if month_day:
+        cache.delete(get_cache_key(month_day))
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('images', '0011_date_month_day'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='image',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+    ]
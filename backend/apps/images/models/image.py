@@ -98,7 +98,7 @@ class Image(MediaModel):
     # https://docs.djangoproject.com/en/dev/ref/models/options/#model-meta-options
     class Meta:
         unique_together = [IMAGE_FIELD_NAME, 'caption']
-        ordering = ['date']
+        ordering = ['date_position']
 
     placeholder_regex = image_placeholder_regex
     searchable_fields = [
@@ -216,14 +216,19 @@ class Image(MediaModel):
         return 'center'
 
     @classmethod
-    def get_object_html(cls, match: Match, use_preretrieved_html: bool = False) -> str:
+    def get_object_html(
+        cls,
+        match: Match,
+        use_preretrieved_html: bool = False,
+        model_instance: Optional['Image'] = None,
+    ) -> str:
         """Return the image's HTML based on a placeholder in the admin."""
         if use_preretrieved_html:
             # Return the pre-retrieved HTML (already included in placeholder)
             preretrieved_html = match.group(PlaceholderGroups.HTML)
             if preretrieved_html:
                 return str(preretrieved_html).strip()
-        image = cls.objects.get(pk=match.group(PlaceholderGroups.PK))
+        image = model_instance or cls.objects.get(pk=match.group(PlaceholderGroups.PK))
         if isinstance(image, dict):
             width = image['width']
         elif isinstance(image, Image):
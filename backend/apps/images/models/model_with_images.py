@@ -107,7 +107,7 @@ class ModelWithImages(ExtendedModel):
         images = self.cache.get('images', [])
         if images or not self.images.exists():
             return images
-        images = [relation.image.serialize() for relation in self.image_relations.all()]
+        images = self.serialize_images()
         delay(
             cache_images,
             f'{self.__class__._meta.app_label}.{self.__class__.__name__.lower()}',
@@ -116,6 +116,10 @@ class ModelWithImages(ExtendedModel):
         )
         return images
 
+    def serialize_images(self) -> list:
+        """Return a list of dictionaries representing the instance's images."""
+        return [relation.image.serialize() for relation in self.image_relations.all()]
+
     @property
     def primary_image(self) -> Optional[dict]:
         """Return the image to represent the model instance by default."""
@@ -136,5 +140,4 @@ def cache_images(model: str, instance_id: int, images: list):
         logging.error(f'{Model} has no cache.')
         return
     model_instance: ModelWithImages = Model.objects.get(pk=instance_id)
-    model_instance.cache['images'] = images
-    model_instance.save(wipe_cache=False, moderate=False)
+    model_instance.write_cache(images=images)
@@ -1,13 +1,14 @@
 from typing import TYPE_CHECKING, Optional
 
 from django.contrib.admin import ModelAdmin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.contenttypes.models import ContentType
 from django.urls import NoReverseMatch, reverse
 
 from apps.admin.admin_site import admin_site
 from apps.admin.list_filters.autocomplete_filter import ManyToManyAutocompleteFilter
 from apps.admin.list_filters.type_filter import ContentTypeFilter
-from apps.moderation.diff import get_field_changes
+from apps.moderation.diff import get_rendered_field_changes
 from apps.moderation.models import Change
 from apps.moderation.models.moderated_model.model import ModeratedModel
 
@@ -32,6 +33,14 @@ class ContributorFilter(ManyToManyAutocompleteFilter):
         return reverse('admin:user_search')
 
 
+class ChangeChangeList(ChangeList):
+    """Admin change list of changes."""
+
+    def get_queryset(self, request: 'HttpRequest') -> 'ChangeQuerySet':
+        # Changes are listed without their serialized objects.
+        return super().get_queryset(request).for_list()
+
+
 class ChangeAdmin(ModelAdmin):
     """
     Admin for changes proposed to moderated model instances.
@@ -74,6 +83,10 @@ class ChangeAdmin(ModelAdmin):
             queryset = queryset.filter(parent__isnull=True)  # TODO
         return queryset
 
+    def get_changelist(self, request: 'HttpRequest', **kwargs) -> type[ChangeList]:
+        """Return the change list class used to list changes."""
+        return ChangeChangeList
+
     def get_actions(self, request: 'HttpRequest'):
         """Return the bulk actions available to the admin."""
         actions = super().get_actions(request)
@@ -96,7 +109,7 @@ class ChangeAdmin(ModelAdmin):
         object_after_change: ModeratedModel = change.changed_object
         object_before_change: ModeratedModel = change.unchanged_object
         changes = list(
-            get_field_changes(
+            get_rendered_field_changes(
                 change,
                 excluded_fields=object_before_change.Moderation.excluded_fields,
                 resolve_foreignkeys=True,
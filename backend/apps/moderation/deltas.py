@@ -0,0 +1,66 @@
+"""
+Field-level deltas between serialized versions of a model instance.
+
+Contributions to a change are stored as deltas against the preceding version of
+the changed object, rather than as full copies of the object. Every
+`CHECKPOINT_INTERVAL`th contribution also stores a full copy of the object (a
+checkpoint), so that any version can be reconstructed by applying a bounded
+number of deltas to the nearest preceding checkpoint.
+"""
+
+import json
+from copy import deepcopy
+from typing import Optional
+
+from django.db.models import Model
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.moderation.fields import SerializedModel, serialize_instance, unwrap
+
+# Deltas map field names to (before, after) pairs of serialized values.
+Delta = dict[str, list]
+
+CHECKPOINT_INTERVAL = 10
+
+
+def is_checkpoint(position: int) -> bool:
+    """Return whether the contribution at the specified position stores a full copy."""
+    return position % CHECKPOINT_INTERVAL == 0
+
+
+def to_serialized(value) -> Optional[SerializedModel]:
+    """Return the serialized form of a (possibly lazily deserialized) model instance."""
+    value = unwrap(value)
+    if value is None:
+        return value
+    elif isinstance(value, Model):
+        value = serialize_instance(value)
+    elif not isinstance(value, list):
+        raise TypeError(value)
+    # Normalize values (e.g., datetimes) to their JSON representations, so that
+    # new serializations can be compared with those loaded from the database.
+    return json.loads(json.dumps(value, cls=JSONEncoder))
+
+
+def get_fields(serialized_instance: Optional[SerializedModel]) -> dict:
+    """Return the serialized field values of a serialized model instance."""
+    return serialized_instance[0]['fields'] if serialized_instance else {}
+
+
+def get_delta(before: Optional[SerializedModel], after: Optional[SerializedModel]) -> Delta:
+    """Return the values of the fields that differ between two serialized versions."""
+    fields_before, fields_after = get_fields(before), get_fields(after)
+    return {
+        field_name: [fields_before.get(field_name), value]
+        for field_name, value in fields_after.items()
+        if fields_before.get(field_name) != value
+    }
+
+
+def apply_delta(serialized_instance: SerializedModel, delta: Delta) -> SerializedModel:
+    """Return a copy of the serialized model instance, with the delta applied."""
+    serialized_instance = deepcopy(serialized_instance)
+    fields = get_fields(serialized_instance)
+    for field_name, (_before, after) in delta.items():
+        fields[field_name] = after
+    return serialized_instance
@@ -1,23 +1,30 @@
 import difflib
+import hashlib
+import json
 import logging
 import re
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
+from django.core.cache import cache
 from django.core.exceptions import FieldError
-from django.db.models import ImageField, fields
+from django.db.models import ImageField, Model, fields
 from django.db.models.fields.related import ForeignObject, ManyToManyField, OneToOneField
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel, OneToOneRel
 from django.template.loader import render_to_string
 from django.utils.html import escape
+from rest_framework.utils.encoders import JSONEncoder
 
+from apps.moderation.deltas import get_fields, to_serialized
+from apps.moderation.fields import evaluate, unwrap
 from apps.moderation.models import Change
 
 if TYPE_CHECKING:
-    from django.db.models.query import QuerySet
-
     from apps.moderation.models.moderated_model import ModeratedModel
     from core.models.relations.moderated import ModeratedRelation
 
+RENDERED_DIFFS_KEY_PREFIX = 'moderation_diffs'
+RENDERED_DIFFS_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class FieldChange:
     """Base class for a change to a field's value."""
@@ -83,14 +90,124 @@ class RelationsChange(FieldChange):
         )
 
 
+class ChangeDiffData:
+    """
+    Data required to compute the field diffs of a change, loaded in batches.
+
+    The constituent changes of the change (i.e., changes to m2m relations) are
+    loaded in a single query, and the through-table rows of each m2m field are
+    loaded in a single query the first time they are needed, so that the number
+    of queries is independent of the number of relations and constituent changes.
+    The changed and unchanged objects are also only read once, since reading the
+    unchanged object of a merged change requires a query and a deserialization.
+    """
+
+    def __init__(self, change: 'Change'):
+        self.change = change
+        self.changed_object: 'ModeratedModel' = change.changed_object
+        self.unchanged_object: 'ModeratedModel' = change.unchanged_object
+        self.constituent_changes: list['Change'] = list(
+            Change.objects.filter(parent=change).order_by('pk')
+        )
+        self.changed_relation_ids: set[int] = set()
+        self.deleted_relation_ids: set[int] = set()
+        for constituent_change in self.constituent_changes:
+            self.changed_relation_ids.add(constituent_change.object_id)
+            if get_serialized_value(constituent_change.changed_object, 'deleted'):
+                self.deleted_relation_ids.add(constituent_change.object_id)
+        self._relations: dict[str, list['ModeratedRelation']] = {}
+
+    def get_relations(self, field: ManyToManyField) -> list['ModeratedRelation']:
+        """Return the through-table rows of an m2m field of the unchanged object."""
+        if field.name not in self._relations:
+            relation_kwargs = {f'{field.m2m_column_name()}': self.unchanged_object.pk}
+            self._relations[field.name] = list(
+                field.remote_field.through.objects.filter(**relation_kwargs)
+            )
+        return self._relations[field.name]
+
+    def get_hash(self, *args) -> str:
+        """
+        Return a hash of the changed objects of the change and its constituent changes.
+
+        The hash also reflects the current state of the unchanged object and the
+        through-table rows of its m2m fields (which may be modified by other changes),
+        whether the change has been merged or requires rebasing, and any additional
+        arguments (e.g., the fields to be diffed).
+        """
+        unchanged_object = evaluate(self.unchanged_object)
+        relations = []
+        if isinstance(unchanged_object, Model) and unchanged_object.pk:
+            relations = [
+                [to_serialized(relation) for relation in self.get_relations(field)]
+                for field in unchanged_object._meta.many_to_many
+            ]
+        components = [
+            [to_serialized(change.changed_object) for change in self.constituent_changes],
+            to_serialized(self.changed_object),
+            to_serialized(unchanged_object),
+            relations,
+            self.change.merged_date,
+            self.change.requires_rebase,
+            args,
+        ]
+        serialized_components = json.dumps(components, cls=JSONEncoder, sort_keys=True)
+        return hashlib.md5(serialized_components.encode()).hexdigest()
+
+
+def get_serialized_value(value, field_name: str):
+    """Return a field value of a serialized object, without deserializing it if possible."""
+    value = unwrap(value)
+    if isinstance(value, list):
+        return get_fields(value).get(field_name)
+    return getattr(value, field_name, None)
+
+
+def get_relations_change(
+    field: ManyToManyField, diff_data: ChangeDiffData
+) -> tuple[list[str], list[str]]:
+    """Return the relations of an m2m field before and after the change."""
+    relations = diff_data.get_relations(field)
+    changed_relation_ids = diff_data.changed_relation_ids
+    deleted_relation_ids = diff_data.deleted_relation_ids
+    # TODO: changed_relations
+    added_relation_ids = {
+        relation.pk
+        for relation in relations
+        if relation.pk in changed_relation_ids
+        and relation.deleted is None
+        and relation.pk not in deleted_relation_ids
+    }
+    value_before = [
+        str(relation) for relation in relations if relation.pk not in added_relation_ids
+    ]
+    value_after = [
+        str(relation) for relation in relations if relation.pk not in deleted_relation_ids
+    ]
+    return value_before, value_after
+
+
 def get_field_change(
     field: fields.Field,
     change: 'Change',
     resolve_foreignkeys: bool = True,
+    diff_data: Optional[ChangeDiffData] = None,
 ) -> FieldChange:
-    """Return a FieldChange object for the field."""
-    object_after_change: ModeratedModel = change.changed_object
-    object_before_change: ModeratedModel = change.unchanged_object
+    """
+    Return a FieldChange object for the field.
+
+    To compute the changes of multiple fields, pass the same `ChangeDiffData`
+    instance for each field, so that its data (including the changed and unchanged
+    objects) is only loaded once.
+    """
+    object_after_change: ModeratedModel
+    object_before_change: ModeratedModel
+    if diff_data:
+        object_after_change = diff_data.changed_object
+        object_before_change = diff_data.unchanged_object
+    else:
+        object_after_change = change.changed_object
+        object_before_change = change.unchanged_object
     try:
         value_before = getattr(object_before_change, f'get_{field.name}_display')()
         value_after = getattr(object_after_change, f'get_{field.name}_display')()
@@ -103,31 +220,10 @@ def get_field_change(
                 field=field,
                 before_and_after=(value_before, value_after),
             )
-        elif isinstance(field, (ManyToManyRel, ManyToManyField)):  # TODO: refactor
-            relation_kwargs = {f'{field.m2m_column_name()}': object_before_change.pk}
-            relations: 'QuerySet[ModeratedRelation]' = (
-                field.remote_field.through.objects.filter(**relation_kwargs)
-            )
-            relation_changes = Change.objects.filter(parent=change)
+        elif isinstance(field, (ManyToManyRel, ManyToManyField)):
+            diff_data = diff_data or ChangeDiffData(change)
             try:
-                changed_relation_ids = relation_changes.values_list('object_id', flat=True)
-                modified_relations = relations.filter(id__in=changed_relation_ids)
-                added_relations = modified_relations.filter(deleted__isnull=True)
-                # TODO: changed_relations
-                deleted_relations = field.remote_field.through.objects.filter(
-                    id__in=[
-                        change.object_id
-                        for change in relation_changes.all()
-                        if change.changed_object.deleted
-                    ]
-                )
-                added_relations = modified_relations.filter(deleted__isnull=True).difference(
-                    deleted_relations
-                )
-                relations_before = relations.difference(added_relations)
-                relations_after = relations.difference(deleted_relations)
-                value_before = [str(related_object) for related_object in relations_before]
-                value_after = [str(related_object) for related_object in relations_after]
+                value_before, value_after = get_relations_change(field, diff_data)
             except FieldError as err:
                 logging.error(err)
                 value_before = value_after = ''
@@ -164,6 +260,7 @@ def get_field_changes(
     excluded_fields: Optional[list] = None,
     included_fields: Optional[list] = None,
     resolve_foreignkeys: bool = True,
+    diff_data: Optional[ChangeDiffData] = None,
 ) -> dict:
     content_object: ModeratedModel = change.content_object
     changes = {}
@@ -171,6 +268,7 @@ def get_field_changes(
         excluded_fields = []
     if included_fields is None:
         included_fields = []
+    diff_data = diff_data or ChangeDiffData(change)
     field: fields.Field
     for field in content_object._meta.get_fields():
         if any(
@@ -183,10 +281,56 @@ def get_field_changes(
         ):
             continue
         name = f'{content_object.__class__.__name__.lower()}__{field.name}'
-        changes[name] = get_field_change(field, change, resolve_foreignkeys)
+        changes[name] = get_field_change(field, change, resolve_foreignkeys, diff_data)
     return changes
 
 
+class RenderedFieldChange(NamedTuple):
+    """A change to a field's value, with its diff rendered (e.g., for caching)."""
+
+    verbose_name: str
+    diff: str
+
+
+def get_rendered_diffs_cache_key(change: 'Change', digest: str) -> str:
+    """Return the cache key of the rendered diffs of a change."""
+    return f'{RENDERED_DIFFS_KEY_PREFIX}:{change.pk}:{digest}'
+
+
+def get_rendered_field_changes(
+    change: 'Change',
+    excluded_fields: Optional[list] = None,
+    included_fields: Optional[list] = None,
+    resolve_foreignkeys: bool = True,
+) -> dict[str, RenderedFieldChange]:
+    """
+    Return the field changes of a change, with their diffs rendered.
+
+    Rendered diffs are cached, keyed by the change's ID and a hash of the
+    changed objects of the change and its constituent changes and of the
+    unchanged object, so that the cached diffs are not reused once the change
+    or the object is updated.
+    """
+    diff_data = ChangeDiffData(change)
+    digest = diff_data.get_hash(excluded_fields, included_fields, resolve_foreignkeys)
+    key = get_rendered_diffs_cache_key(change, digest)
+    rendered_changes = cache.get(key)
+    if rendered_changes is None:
+        field_changes = get_field_changes(
+            change,
+            excluded_fields=excluded_fields,
+            included_fields=included_fields,
+            resolve_foreignkeys=resolve_foreignkeys,
+            diff_data=diff_data,
+        )
+        rendered_changes = {
+            name: RenderedFieldChange(str(field_change.verbose_name), field_change.diff)
+            for name, field_change in field_changes.items()
+        }
+        cache.set(key, rendered_changes, timeout=RENDERED_DIFFS_CACHE_TIMEOUT)
+    return rendered_changes
+
+
 def get_diff_operations(a: str, b: str) -> list:
     operations = []
     a_words = re.split(r'(\W+)', a)
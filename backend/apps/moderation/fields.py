@@ -1,9 +1,11 @@
+import copy
 import json
 from typing import Optional, Union
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.serializers.python import Deserializer as PythonDeserializer
 from django.db.models import JSONField, Model
+from django.utils.functional import SimpleLazyObject, empty
 from rest_framework.utils.encoders import JSONEncoder
 
 from apps.moderation.serializers import PythonSerializer
@@ -11,6 +13,67 @@ from apps.moderation.serializers import PythonSerializer
 SerializedModel = list[dict]
 
 
+class LazyDeserializedInstance(SimpleLazyObject):
+    """
+    Proxy for a serialized model instance, deserialized when it is first accessed.
+
+    The deserialized model instance is memoized, so that changes made to it are
+    retained. Until it is accessed, the serialized instance is kept as-is, so that
+    it can be saved again without being deserialized and reserialized.
+    """
+
+    def __init__(self, serialized_instance: SerializedModel):
+        # Bypass `LazyObject.__setattr__`, which would set the attribute on the
+        # wrapped (i.e., deserialized) model instance.
+        self.__dict__['serialized_instance'] = serialized_instance
+        super().__init__(lambda: deserialize_instance(serialized_instance))
+
+    @property
+    def is_deserialized(self) -> bool:
+        """Return whether the serialized instance has been deserialized."""
+        return self._wrapped is not empty
+
+    def __copy__(self):
+        # Django's implementation copies the setup function, which would not retain
+        # the serialized instance.
+        if self.is_deserialized:
+            return copy.copy(self._wrapped)
+        return type(self)(self.serialized_instance)
+
+    def __deepcopy__(self, memo: dict):
+        if self.is_deserialized:
+            return copy.deepcopy(self._wrapped, memo)
+        result = type(self)(copy.deepcopy(self.serialized_instance, memo))
+        memo[id(self)] = result
+        return result
+
+
+def unwrap(value):
+    """
+    Return the value proxied by a `LazyDeserializedInstance`, if applicable.
+
+    If the proxy has not been deserialized, return its serialized instance;
+    otherwise, return the deserialized model instance.
+    """
+    if isinstance(value, LazyDeserializedInstance):
+        return value._wrapped if value.is_deserialized else value.serialized_instance
+    return value
+
+
+def evaluate(value):
+    """
+    Return the value proxied by a `LazyDeserializedInstance`, if applicable.
+
+    Unlike `unwrap`, this deserializes the proxied model instance if necessary,
+    so that the result is a model instance (or None, if it cannot be deserialized).
+    """
+    if isinstance(value, LazyDeserializedInstance):
+        if not value.is_deserialized:
+            value._setup()
+        return value._wrapped
+    return value
+
+
 class SerializedObjectField(JSONField):
     """Model field for storing a serialized model instance."""
 
@@ -28,15 +91,17 @@ class SerializedObjectField(JSONField):
         return name, path, args, kwargs
 
     # https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.from_db_value
-    def from_db_value(self, value: str, *args) -> Optional[Model]:
+    def from_db_value(self, value: str, *args) -> Optional[LazyDeserializedInstance]:
         """
         Convert a value as returned by the database to a Python object.
 
-        This method is the reverse of `get_prep_value()`.
+        This method is the reverse of `get_prep_value()`. The model instance is
+        only deserialized when it is accessed, so that listing model instances
+        with serialized object fields is cheap.
         """
         if value is None:
             return value
-        return deserialize_instance(json.loads(value, cls=self.decoder))
+        return LazyDeserializedInstance(json.loads(value, cls=self.decoder))
 
     # https://docs.djangoproject.com/en/dev/ref/models/fields/#django.db.models.Field.get_prep_value
     def get_prep_value(self, value: Optional[Union[Model, SerializedModel, str]]) -> str:
@@ -45,6 +110,7 @@ class SerializedObjectField(JSONField):
 
         This method is the reverse of `from_db_value()`.
         """
+        value = unwrap(value)
         if isinstance(value, Model):
             value = serialize_instance(value)
         return super().get_prep_value(value)
@@ -58,6 +124,12 @@ class SerializedObjectField(JSONField):
         """Preprocess the field value immediately before saving."""
         # Convert the field value from a model instance to a serialized Python object.
         value: Optional[Model] = getattr(model_instance, self.attname, None)
+        value = unwrap(value)
+        if value is None and self.null:
+            return value
+        elif isinstance(value, list):
+            # The instance was not accessed (or modified) since it was loaded.
+            return value
         return serialize_instance(value)
 
     # https://docs.djangoproject.com/en/dev/howto/custom-model-fields/#converting-values-to-python-objects
@@ -69,6 +141,8 @@ class SerializedObjectField(JSONField):
 
         This method acts as the reverse of value_to_string(), and is also called in clean().
         """
+        if isinstance(value, LazyDeserializedInstance):
+            return value
         value = super().to_python(value)
         if not value:
             return None
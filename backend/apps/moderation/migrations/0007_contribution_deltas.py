@@ -0,0 +1,117 @@
+from copy import deepcopy
+
+from django.db import migrations, models
+
+import apps.moderation.fields
+
+# The helpers below are copied from `apps.moderation.deltas` (as of this
+# migration), so that the migration does not depend on live app code.
+
+CHECKPOINT_INTERVAL = 10
+
+CONTENT_FIELDS = ['position', 'delta', 'content_before', 'content_after']
+
+
+def is_checkpoint(position: int) -> bool:
+    """Return whether the contribution at the specified position stores a full copy."""
+    return position % CHECKPOINT_INTERVAL == 0
+
+
+def to_serialized(value):
+    """Return the serialized form of a lazily deserialized field value."""
+    # Field values loaded from the database retain their serialized instance.
+    return getattr(value, 'serialized_instance', value)
+
+
+def get_fields(serialized_instance) -> dict:
+    """Return the serialized field values of a serialized model instance."""
+    return serialized_instance[0]['fields'] if serialized_instance else {}
+
+
+def get_delta(before, after) -> dict:
+    """Return the values of the fields that differ between two serialized versions."""
+    fields_before, fields_after = get_fields(before), get_fields(after)
+    return {
+        field_name: [fields_before.get(field_name), value]
+        for field_name, value in fields_after.items()
+        if fields_before.get(field_name) != value
+    }
+
+
+def apply_delta(serialized_instance, delta: dict):
+    """Return a copy of the serialized model instance, with the delta applied."""
+    serialized_instance = deepcopy(serialized_instance)
+    fields = get_fields(serialized_instance)
+    for field_name, (_before, after) in delta.items():
+        fields[field_name] = after
+    return serialized_instance
+
+
+def compact_contributions(apps, schema_editor):
+    """Replace full copies of changed objects with deltas, except for checkpoints."""
+    ContentContribution = apps.get_model('moderation', 'ContentContribution')
+    contributions = ContentContribution.objects.order_by('change_id', 'date_created', 'pk')
+    change_id, position = None, 0
+    for contribution in contributions.iterator():
+        position = position + 1 if contribution.change_id == change_id else 0
+        change_id = contribution.change_id
+        content_before = to_serialized(contribution.content_before)
+        content_after = to_serialized(contribution.content_after)
+        contribution.position = position
+        contribution.delta = get_delta(content_before, content_after)
+        contribution.content_before = content_before if position == 0 else None
+        contribution.content_after = content_after if is_checkpoint(position) else None
+        contribution.save(update_fields=CONTENT_FIELDS)
+
+
+def restore_contributions(apps, schema_editor):
+    """Restore full copies of changed objects from checkpoints and deltas."""
+    ContentContribution = apps.get_model('moderation', 'ContentContribution')
+    contributions = ContentContribution.objects.order_by('change_id', 'position', 'pk')
+    change_id, content = None, None
+    for contribution in contributions.iterator():
+        if contribution.change_id != change_id:
+            change_id = contribution.change_id
+            content = to_serialized(contribution.content_before)
+        content_before = content
+        content = to_serialized(contribution.content_after) or apply_delta(
+            content_before, contribution.delta
+        )
+        contribution.content_before = content_before
+        contribution.content_after = content
+        contribution.save(update_fields=['content_before', 'content_after'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('moderation', '0006_auto_20211026_0129'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='contentcontribution',
+            options={'ordering': ['change', 'position']},
+        ),
+        migrations.AddField(
+            model_name='contentcontribution',
+            name='position',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contentcontribution',
+            name='delta',
+            field=models.JSONField(default=dict, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='contentcontribution',
+            name='content_before',
+            field=apps.moderation.fields.SerializedObjectField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='contentcontribution',
+            name='content_after',
+            field=apps.moderation.fields.SerializedObjectField(blank=True, null=True),
+        ),
+        migrations.RunPython(compact_contributions, restore_contributions),
+    ]
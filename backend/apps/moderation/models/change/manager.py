@@ -1,15 +1,28 @@
-from typing import TYPE_CHECKING
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.expressions import Combinable
 from django.db.models.manager import Manager
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
 
-from apps.moderation.constants import ModerationStatus
+from apps.moderation.constants import DraftState, ModerationStatus
+from apps.moderation.fields import evaluate
 from apps.moderation.models.change.queryset import ChangeQuerySet
+from apps.search import indexing
+from core.models.model_with_cache import ModelWithCache, _discard_pending_cache_writes
+from core.models.soft_deletable.signals import post_undelete
 
 if TYPE_CHECKING:
     from apps.moderation.models.change import Change
     from apps.moderation.models.moderated_model import ModeratedModel
 
+BULK_UPDATE_BATCH_SIZE = 500
+
 
 class ChangeManager(Manager):
 
@@ -26,3 +39,176 @@ class ChangeManager(Manager):
             moderation_status__gt=ModerationStatus.REJECTED,
             merged_date__isnull=True,
         )[0]
+
+    def apply_changes(self, changes: Iterable['Change']) -> list['Change']:
+        """
+        Apply approved changes to their referenced model instances, in bulk.
+
+        The changed objects are grouped by model and written with one bulk update
+        per model, the changes are marked as merged, and the other unmerged changes
+        to the same objects are marked as requiring rebasing with one update per
+        content type, all in a single transaction. Index updates of the changed
+        objects are queued in a single batch.
+
+        Changes that cannot be applied (e.g., because they require rebasing) are
+        skipped, so that they do not prevent the other changes from being applied.
+
+        Return the changes that were applied.
+        """
+        changes_to_apply: list['Change'] = []
+        instances_by_model: dict[type[Model], list['ModeratedModel']] = defaultdict(list)
+        for change in changes:
+            parent = change.parent
+            if change.requires_rebase:
+                logging.error(f'Ignored request to apply change requiring rebasing: {change}')
+                continue
+            if parent and parent.requires_rebase:
+                logging.error(
+                    f'Ignored request to apply change whose parent requires rebasing: {change}'
+                )
+                continue
+            if change.merged_date:
+                logging.info(f'Ignored request to apply merged change: {change}')
+                continue
+            if not change.is_approved:
+                logging.error(f'Ignored request to apply unapproved change: {change}')
+                continue
+            # Save the deserialized model instance, rather than its lazy proxy.
+            try:
+                instance: 'ModeratedModel' = evaluate(change.changed_object)
+            except Exception as err:
+                logging.error(f'Failed to deserialize object of change {change}: {err}')
+                continue
+            if not isinstance(instance, Model):
+                logging.error(f'Ignored request to apply change with no object: {change}')
+                continue
+            changes_to_apply.append(change)
+            instances_by_model[instance._meta.concrete_model].append(instance)
+        if not changes_to_apply:
+            return []
+        merged_date = timezone.now()
+        with indexing.batch(), transaction.atomic(using=self.db):
+            for model, instances in instances_by_model.items():
+                self._bulk_save(model, instances)
+            for change in changes_to_apply:
+                # Draft state should already be set to "ready".
+                change.draft_state = DraftState.READY
+                change.merged_date = merged_date
+            self.bulk_update(
+                changes_to_apply,
+                ['draft_state', 'merged_date', 'changed_object'],
+                batch_size=BULK_UPDATE_BATCH_SIZE,
+            )
+            # Update other changes that require rebasing on the applied changes.
+            object_ids_by_content_type: dict[int, set[int]] = defaultdict(set)
+            for change in changes_to_apply:
+                object_ids_by_content_type[change.content_type_id].add(change.object_id)
+            for content_type_id, object_ids in object_ids_by_content_type.items():
+                self.filter(
+                    content_type_id=content_type_id,
+                    object_id__in=object_ids,
+                    merged_date__isnull=True,
+                ).exclude(pk__in=[change.pk for change in changes_to_apply]).update(
+                    requires_rebase=True
+                )
+        return changes_to_apply
+
+    def _bulk_save(self, model: type[Model], instances: list['ModeratedModel']):
+        """
+        Save changed objects of the same model with a bulk update.
+
+        The instances are prepared and post-processed as they would be by `save()`
+        (which also wipes their cached computations), and the `pre_save`, `post_save`,
+        and `post_undelete` signals are sent for each of them. Instances of models
+        that override `save()` are saved individually, so that their overrides run.
+        """
+        for instance in instances:
+            # The changed objects are (deserialized) existing rows.
+            instance._state.adding = False
+            instance._state.db = self.db
+        if any(_overrides_save(type(instance)) for instance in instances):
+            for instance in instances:
+                instance.save(moderate=False)
+            return
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+        wipe_cache = issubclass(model, ModelWithCache)
+        pks = [instance.pk for instance in instances]
+        deleted_pks: set = set()
+        if any(field.name == 'deleted' for field in fields):
+            deleted_pks = set(
+                model._base_manager.using(self.db)
+                .filter(pk__in=pks, deleted__isnull=False)
+                .values_list('pk', flat=True)
+            )
+        for instance in instances:
+            if wipe_cache:
+                instance.cache = {}
+                _discard_pending_cache_writes(instance.__class__, pk=instance.pk)
+            instance.pre_save()
+            pre_save.send(
+                sender=instance.__class__,
+                instance=instance,
+                raw=False,
+                using=self.db,
+                update_fields=None,
+            )
+            for field in fields:
+                setattr(instance, field.attname, field.pre_save(instance, False))
+        model._base_manager.using(self.db).bulk_update(
+            instances,
+            [field.name for field in fields],
+            batch_size=BULK_UPDATE_BATCH_SIZE,
+        )
+        # Reload the values written as expressions (e.g., incremented content
+        # versions) with a single query, rather than one query per instance.
+        expression_fields = {
+            field.attname
+            for field in fields
+            for instance in instances
+            if isinstance(getattr(instance, field.attname), Combinable)
+        }
+        if expression_fields:
+            values_by_pk = {
+                values['pk']: values
+                for values in model._base_manager.using(self.db)
+                .filter(pk__in=pks)
+                .values('pk', *expression_fields)
+            }
+            for instance in instances:
+                for attname in expression_fields:
+                    setattr(instance, attname, values_by_pk[instance.pk][attname])
+        for instance in instances:
+            instance.post_save()
+            post_save.send(
+                sender=instance.__class__,
+                instance=instance,
+                created=False,
+                update_fields=None,
+                raw=False,
+                using=self.db,
+            )
+            if instance.pk in deleted_pks and instance.deleted is None:
+                post_undelete.send(
+                    sender=instance.__class__, instance=instance, using=self.db
+                )
+
+
+def _overrides_save(model: type[Model]) -> bool:
+    """Return whether a model's `save()` does more than `_bulk_save` reproduces."""
+    from apps.moderation.models.moderated_model import ModeratedModel
+    from core.models.model import ExtendedModel
+    from core.models.module import TypedModule
+    from core.models.soft_deletable import SoftDeletableModel
+    from core.models.typed import TypedModel
+
+    bulk_saved_classes = (
+        Model,
+        ExtendedModel,
+        ModelWithCache,
+        SoftDeletableModel,
+        ModeratedModel,
+        TypedModel,
+        TypedModule,
+    )
+    save_class = next(klass for klass in model.__mro__ if 'save' in vars(klass))
+    return save_class not in bulk_saved_classes
@@ -4,15 +4,20 @@ from typing import TYPE_CHECKING, Optional
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models, transaction
-from django.utils import timezone
+from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
-from apps.moderation.constants import DraftState, ModerationStatus
-from apps.moderation.fields import SerializedObjectField
+from apps.moderation.constants import ModerationStatus
+from apps.moderation.deltas import apply_delta
+from apps.moderation.fields import (
+    LazyDeserializedInstance,
+    SerializedModel,
+    SerializedObjectField,
+    unwrap,
+)
 from apps.moderation.models.changeset.model import AbstractChange
 from apps.moderation.models.moderation import Moderation
-from apps.moderation.tasks import handle_approval
+from apps.moderation.tasks import handle_approvals
 from core.utils.sync import delay
 
 from .manager import ChangeManager
@@ -151,6 +156,43 @@ class Change(AbstractChange):
         # assume that the initial object of change is the current content object.
         return self.content_object
 
+    def get_serialized_version(self, position: int) -> Optional[SerializedModel]:
+        """
+        Return the changed object as it was after the contribution at a position.
+
+        Position -1 refers to the version preceding the change's first contribution.
+        The version is reconstructed by applying the deltas of the contributions
+        following the nearest preceding checkpoint to the checkpoint's full copy.
+        """
+        contributions = self.contributions.all()
+        if position < 0:
+            base = contributions.filter(position=0).values_list('content_before', flat=True)
+            return unwrap(base.first())
+        checkpoint = (
+            contributions.filter(position__lte=position, content_after__isnull=False)
+            .order_by('-position')
+            .values_list('position', 'content_after')
+            .first()
+        )
+        if not checkpoint:
+            return None
+        checkpoint_position, serialized_version = checkpoint[0], unwrap(checkpoint[1])
+        deltas = (
+            contributions.filter(position__gt=checkpoint_position, position__lte=position)
+            .order_by('position')
+            .values_list('delta', flat=True)
+        )
+        for delta in deltas:
+            serialized_version = apply_delta(serialized_version, delta)
+        return serialized_version
+
+    def get_version(self, position: int) -> Optional[LazyDeserializedInstance]:
+        """Return the changed object as it was after the contribution at a position."""
+        serialized_version = self.get_serialized_version(position)
+        if serialized_version is None:
+            return None
+        return LazyDeserializedInstance(serialized_version)
+
     def get_n_remaining_approvals_required(self) -> int:
         """Return the number of remaining approvals required before the change is applied."""
         if self.is_approved:
@@ -203,27 +245,11 @@ class Change(AbstractChange):
             raise Exception(f'{self} cannot be applied; it requires rebasing.')
         elif parent and parent.requires_rebase:
             raise Exception(f'{self} cannot be applied; its parent change requires rebasing.')
-        elif self.is_approved:
-            # Draft state should already be set to "ready".
-            self.draft_state = DraftState.READY
-            try:
-                with transaction.atomic():
-                    model_instance: 'ModeratedModel' = self.changed_object
-                    model_instance.save(moderate=False)
-                    self.merged_date = timezone.now()
-                    self.save()
-            except Exception as err:
-                logging.error(err)
-                return False
-            # Update other changes that require rebasing on this one.
-            self.__class__.objects.filter(
-                content_type=self.content_type,
-                object_id=self.object_id,
-                merged_date__isnull=True,
-            ).exclude(pk=self.pk).update(requires_rebase=True)
-            return True
-        logging.error(f'Ignored request to apply unapproved change: {self}')
-        return False
+        try:
+            return bool(self.__class__.objects.apply_changes([self]))
+        except Exception as err:
+            logging.error(err)
+            return False
 
     def approve(
         self,
@@ -265,8 +291,12 @@ class Change(AbstractChange):
             reason=reason,
             force=force,
         )
-        self.constituent_changes.all().approve(moderator=moderator, reason=reason)
-        delay(handle_approval, approval.pk)
+        # Approvals of the change and its constituent changes are processed together.
+        constituent_approvals = self.constituent_changes.all().create_approvals(
+            moderator=moderator, reason=reason
+        )
+        approval_ids = [approval.pk, *(approval.pk for approval in constituent_approvals)]
+        delay(handle_approvals, approval_ids)
         return approval
 
     def moderate(
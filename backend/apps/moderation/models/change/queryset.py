@@ -1,13 +1,15 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from django.db import transaction
+from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from apps.moderation.constants import ModerationStatus
+from core.utils.sync import delay
 
 if TYPE_CHECKING:
     from apps.moderation.models.change import Change
+    from apps.moderation.models.moderation import Moderation
     from apps.users.models import User
 
 
@@ -16,18 +18,67 @@ class ChangeQuerySet(QuerySet):
 
     model: type['Change']
 
-    def apply(self):
-        """Apply the changes to their referenced model instances."""
-        change: 'Change'
-        with transaction.atomic():
-            for change in self.all():
-                change.apply()
+    def for_list(self) -> 'ChangeQuerySet':
+        """
+        Return the changes without their serialized objects, for listing.
+
+        Changes are listed without loading their (potentially large) serialized
+        objects, and the objects they affect are retrieved with one query per
+        content type.
+        """
+        return self.defer('changed_object').prefetch_related('content_object')
+
+    def apply(self) -> list['Change']:
+        """
+        Apply the changes to their referenced model instances, in bulk.
+
+        Return the changes that were applied.
+        """
+        # Load the changed objects, even if they were deferred for listing.
+        changes = self.defer(None).select_related('parent')
+        return self.model.objects.apply_changes(changes)
+
+    def create_approvals(
+        self, moderator: Optional['User'], reason: Optional[str] = None
+    ) -> list['Moderation']:
+        """
+        Add approvals by the moderator to the changes and their constituent changes.
+
+        The approvals are created in bulk, without being processed; changes already
+        approved by the moderator (in their current state) are not approved again.
+        """
+        from apps.moderation.models.moderation import Moderation
+
+        change_ids = self.values('pk')
+        changes = self.model.objects.filter(Q(pk__in=change_ids) | Q(parent__in=change_ids))
+        approved_change_ids = set(
+            Moderation.objects.filter(
+                change__in=changes,
+                moderator=moderator,
+                verdict=ModerationStatus.APPROVED,
+                stale=False,
+            ).values_list('change_id', flat=True)
+        )
+        return Moderation.objects.bulk_create(
+            [
+                Moderation(
+                    moderator=moderator,
+                    change_id=change_id,
+                    verdict=ModerationStatus.APPROVED,
+                    reason=reason,
+                )
+                for change_id in changes.values_list('pk', flat=True).distinct()
+                if change_id not in approved_change_ids
+            ]
+        )
 
     def approve(self, moderator: Optional['User'], reason: Optional[str] = None):
-        """Approve the changes."""
-        change: 'Change'
-        for change in self.all():
-            change.approve(moderator=moderator, reason=reason)
+        """Approve the changes, processing all of the approvals with a single task."""
+        from apps.moderation.tasks import handle_approvals
+
+        approvals = self.create_approvals(moderator=moderator, reason=reason)
+        if approvals:
+            delay(handle_approvals, [approval.pk for approval in approvals])
 
     def reject(self, moderator: Optional['User'], reason: Optional[str] = None):
         """Reject the changes."""
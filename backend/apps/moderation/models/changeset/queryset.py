@@ -13,9 +13,10 @@ class ChangeSetQuerySet(QuerySet):
 
     def approve(self, moderator: Optional['User'], reason: Optional[str] = None):
         """Approve the change sets."""
-        change_set: 'ChangeSet'
-        for change_set in self.all():
-            change_set.changes.all().approve(moderator=moderator, reason=reason)
+        from apps.moderation.models.change import Change
+
+        # Approvals of all changes in the sets are processed by a single task.
+        Change.objects.filter(set__in=self).approve(moderator=moderator, reason=reason)
 
     def reject(self, moderator: Optional['User'], reason=None):
         """Reject the change sets."""
@@ -1,7 +1,38 @@
+from typing import TYPE_CHECKING, Optional
+
 from django.conf import settings
 from django.db import models
 
-from apps.moderation.fields import SerializedObjectField
+from apps.moderation.deltas import get_delta, is_checkpoint, to_serialized
+from apps.moderation.fields import LazyDeserializedInstance, SerializedObjectField
+
+if TYPE_CHECKING:
+    from apps.moderation.models.change import Change
+
+
+class ContentContributionManager(models.Manager):
+    """Manager for content contributions."""
+
+    def create_for_change(
+        self, change: 'Change', contributor, content_before, content_after
+    ) -> 'ContentContribution':
+        """
+        Record a contribution to a change, as a delta against the preceding version.
+
+        Full copies of the changed object are only stored for checkpoints (and,
+        for a change's first contribution, for the version preceding the change).
+        """
+        position = change.contributions.count()
+        serialized_before = to_serialized(content_before)
+        serialized_after = to_serialized(content_after)
+        return self.create(
+            contributor=contributor,
+            change=change,
+            position=position,
+            delta=get_delta(serialized_before, serialized_after),
+            content_before=serialized_before if position == 0 else None,
+            content_after=serialized_after if is_checkpoint(position) else None,
+        )
 
 
 class ContentContribution(models.Model):
@@ -23,8 +54,27 @@ class ContentContribution(models.Model):
     )
     date_created = models.DateTimeField(auto_now_add=True, editable=False)
     date_modified = models.DateTimeField(auto_now=True, editable=False)
-    content_before = SerializedObjectField()
-    content_after = SerializedObjectField()
+    # The position of the contribution among the contributions to the change
+    position = models.PositiveIntegerField(default=0, editable=False)
+    # The fields modified by the contribution, mapped to their values before and after
+    delta = models.JSONField(default=dict, editable=False)
+    # Full copies of the changed object are only stored for checkpoints;
+    # see `apps.moderation.deltas`.
+    content_before = SerializedObjectField(null=True, blank=True)
+    content_after = SerializedObjectField(null=True, blank=True)
+
+    objects = ContentContributionManager()
+
+    class Meta:
+        ordering = ['change', 'position']
 
     def __str__(self) -> str:
         return f'Contribution by {self.contributor} to {self.change} ({self.date_created})'
+
+    def get_content_before(self) -> Optional[LazyDeserializedInstance]:
+        """Return the changed object as it was before the contribution."""
+        return self.change.get_version(self.position - 1)
+
+    def get_content_after(self) -> Optional[LazyDeserializedInstance]:
+        """Return the changed object as it was after the contribution."""
+        return self.change.get_version(self.position)
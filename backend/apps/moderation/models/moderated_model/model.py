@@ -86,9 +86,9 @@ class ModeratedModel(SoftDeletableModel):
         if change_in_progress:
             # Save the changes to the existing in-progress `Change` instance.
             _change = change_in_progress
-            ContentContribution.objects.create(
+            ContentContribution.objects.create_for_change(
+                _change,
                 contributor=contributor,
-                change=_change,
                 content_before=_change.changed_object,
                 content_after=self,
             )
@@ -113,9 +113,9 @@ class ModeratedModel(SoftDeletableModel):
                 set=set,
                 parent=parent_change,
             )
-            ContentContribution.objects.create(
+            ContentContribution.objects.create_for_change(
+                _change,
                 contributor=contributor,
-                change=_change,
                 content_before=_change.unchanged_object,
                 content_after=self,
             )
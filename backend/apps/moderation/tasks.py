@@ -1,11 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+import logging
+from typing import TYPE_CHECKING
 
 from apps.moderation.constants import ModerationStatus
 from apps.moderation.models.moderation import Approval
 from core.celery import app
 
 if TYPE_CHECKING:
-    from apps.moderation.models.change import Change
     from apps.moderation.models.changeset import ChangeSet
     from apps.moderation.models.moderated_model import ModeratedModel
 
@@ -13,45 +13,81 @@ if TYPE_CHECKING:
 @app.task
 def handle_approval(approval_id: int):
     """Post-process an approval."""
-    approval: Approval = Approval.objects.get(pk=approval_id)
-    change: 'Change' = approval.change
-    # If the change was force-approved by a superuser, update
-    # `n_remaining_approvals_required` to 0; otherwise, get the remaining number
-    # of approvals required before the moderation status is to be updated.
-    if change.moderation_status == ModerationStatus.APPROVED:
-        n_remaining_approvals_required = 0
-    else:
-        n_remaining_approvals_required = change.get_n_remaining_approvals_required()
-    if n_remaining_approvals_required != change.n_remaining_approvals_required:
-        change.n_remaining_approvals_required = n_remaining_approvals_required
-        change.save()
-    # If `n_remaining_approvals_required` is 0, apply the change.
-    if change.n_remaining_approvals_required == 0:
-        # Update moderation status to "approved".
-        change.moderation_status = ModerationStatus.APPROVED
-        # Set `verified=True` on the changed object.
-        changed_object: 'ModeratedModel' = change.changed_object
-        changed_object.verified = True
-        change.changed_object = changed_object
-        change.save()
-
-        # Check if the status of the change's associated change set can also be updated.
-        change_set: Optional['ChangeSet'] = change.set
-        if change_set:
-            if change_set.changes.exclude(
-                moderation_status=ModerationStatus.APPROVED
-            ).exists():
-                pass
-            else:
-                # All changes in the set have been approved; update the set accordingly.
-                change_set.moderation_status = ModerationStatus.APPROVED
-                change_set.save()
-                # Apply the change set.
-                change_set.apply()
+    handle_approvals([approval_id])
+
+
+@app.task
+def handle_approvals(approval_ids: list[int]):
+    """
+    Post-process approvals.
+
+    The changes that have received their required approvals are applied in bulk:
+    each change set that has been fully approved is applied in its own transaction,
+    and the approved changes that do not belong to change sets are applied together.
+    """
+    from apps.moderation.models.change import Change
+
+    approvals: list[Approval] = list(
+        Approval.objects.filter(pk__in=approval_ids).select_related(
+            'change', 'change__parent', 'change__set'
+        )
+    )
+    changes: dict[int, 'Change'] = {
+        approval.change_id: approval.change for approval in approvals
+    }
+    changes_to_update: list['Change'] = []
+    approved_changes: list['Change'] = []
+    for change in changes.values():
+        # If the change was force-approved by a superuser, update
+        # `n_remaining_approvals_required` to 0; otherwise, get the remaining number
+        # of approvals required before the moderation status is to be updated.
+        if change.moderation_status == ModerationStatus.APPROVED:
+            n_remaining_approvals_required = 0
+        else:
+            n_remaining_approvals_required = change.get_n_remaining_approvals_required()
+        if n_remaining_approvals_required != change.n_remaining_approvals_required:
+            change.n_remaining_approvals_required = n_remaining_approvals_required
+            changes_to_update.append(change)
+        # If `n_remaining_approvals_required` is 0, apply the change.
+        if change.n_remaining_approvals_required == 0:
+            # Update moderation status to "approved".
+            change.moderation_status = ModerationStatus.APPROVED
+            # Set `verified=True` on the changed object.
+            changed_object: 'ModeratedModel' = change.changed_object
+            changed_object.verified = True
+            change.changed_object = changed_object
+            if change not in changes_to_update:
+                changes_to_update.append(change)
+            approved_changes.append(change)
+    Change.objects.bulk_update(
+        changes_to_update,
+        ['n_remaining_approvals_required', 'moderation_status', 'changed_object'],
+    )
+
+    # Check if the statuses of the changes' associated change sets can also be updated.
+    change_sets: dict[int, 'ChangeSet'] = {}
+    unset_changes: list['Change'] = []
+    for change in approved_changes:
+        if change.set:
+            change_sets[change.set_id] = change.set
         else:
-            # Apply the change.
-            change.apply()
+            unset_changes.append(change)
+    for change_set in change_sets.values():
+        if change_set.changes.exclude(moderation_status=ModerationStatus.APPROVED).exists():
+            continue
+        # All changes in the set have been approved; update the set accordingly.
+        change_set.moderation_status = ModerationStatus.APPROVED
+        change_set.save()
+        # Apply the change set.
+        change_set.apply()
+    if unset_changes:
+        # Apply the changes.
+        try:
+            Change.objects.apply_changes(unset_changes)
+        except Exception as err:
+            logging.error(err)
 
-    # Notify users of the approval.
-    if not change.parent:
-        approval.notify_users()
+    # Notify users of the approvals.
+    for approval in approvals:
+        if not approval.change.parent:
+            approval.notify_users()
@@ -1,12 +1,30 @@
+import copy
 import sys
+from datetime import timedelta
 
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.utils import timezone
 
 from apps.dates.structures import HistoricDateTime
+from apps.home import today_in_history
+from apps.moderation.constants import ModerationStatus
+from apps.moderation.deltas import CHECKPOINT_INTERVAL
+from apps.moderation.diff import (
+    ChangeDiffData,
+    get_field_changes,
+    get_rendered_diffs_cache_key,
+    get_rendered_field_changes,
+)
+from apps.moderation.fields import LazyDeserializedInstance, unwrap
 from apps.moderation.models.change import Change
+from apps.moderation.models.changeset import ChangeSet
 from apps.moderation.tasks import handle_approval
+from apps.propositions.factories import PropositionFactory
 from apps.propositions.models import Proposition, TopicRelation
+from apps.quotes.factories import QuoteFactory
+from apps.sources.factories import WebpageFactory, WebsiteFactory
 from apps.topics.models import Topic
 from apps.users.factories import UserFactory
 from core.environment import TESTING
@@ -85,3 +103,205 @@ class TestModeration:
         ), f'{relation_change.n_remaining_approvals_required=}'
         assert p.topic_relations.exists()
         assert p.topic_relations.first().topic == topic
+
+    def test_lazy_deserialization(self):
+        """Test that changed objects are only deserialized when accessed."""
+        p = PropositionFactory.create(type='propositions.conclusion')
+        p.summary = 'changed summary'
+        change = Change(
+            content_type=ContentType.objects.get_for_model(Proposition),
+            object_id=p.pk,
+            changed_object=p,
+        )
+        change.save()
+
+        # Saving an unaccessed changed object does not modify it.
+        change = Change.objects.get(pk=change.pk)
+        assert isinstance(change.changed_object, LazyDeserializedInstance)
+        assert not change.changed_object.is_deserialized
+        change.save()
+        change = Change.objects.get(pk=change.pk)
+        # Copies of an unaccessed changed object retain its serialized instance.
+        for copy_function in (copy.copy, copy.deepcopy):
+            copied_object = copy_function(change.changed_object)
+            assert isinstance(copied_object, LazyDeserializedInstance)
+            assert copied_object.serialized_instance == unwrap(change.changed_object)
+            assert copied_object.summary == 'changed summary'
+        assert not change.changed_object.is_deserialized
+        assert change.changed_object.summary == 'changed summary'
+        assert change.changed_object.is_deserialized
+
+        # Listed changes do not load their changed objects.
+        listed_change = Change.objects.filter(pk=change.pk).for_list().get()
+        assert 'changed_object' in listed_change.get_deferred_fields()
+        assert listed_change.changed_object.summary == 'changed summary'
+
+    def test_contribution_versions(self):
+        """Test reconstructing the versions of a changed object from contributions."""
+        contributor = UserFactory.create()
+        p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+        n_contributions = CHECKPOINT_INTERVAL + 2
+        for index in range(n_contributions):
+            p.summary = f'summary {index}'
+            change = p.save_change(contributor=contributor)
+        contributions = change.contributions.all()
+        assert contributions.count() == n_contributions
+        # Full copies are only stored for checkpoints.
+        assert contributions.filter(content_after__isnull=False).count() == 2
+        assert contributions.filter(content_before__isnull=False).count() == 1
+        assert change.get_version(-1).summary == 'summary'
+        for index, contribution in enumerate(contributions):
+            assert contribution.delta['summary'][1] == f'summary {index}'
+            assert contribution.get_content_after().summary == f'summary {index}'
+        assert change.get_version(n_contributions - 1).summary == p.summary
+
+    def test_rendered_field_changes(self):
+        """Test computing and caching the field diffs of a change."""
+        p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+        p.summary = 'changed summary'
+        change = p.save_change(contributor=UserFactory.create())
+        topic = Topic.objects.create(name='test topic', verified=True)
+        TopicRelation(topic=topic, content_object=p).save_change(parent_change=change)
+
+        change = Change.objects.get(pk=change.pk)
+        diff_data = ChangeDiffData(change)
+        assert len(diff_data.constituent_changes) == 1
+        assert not change.changed_object.is_deserialized
+        field_changes = get_field_changes(change, diff_data=diff_data)
+        assert field_changes['proposition__summary'].before == 'summary'
+        assert field_changes['proposition__summary'].after == 'changed summary'
+
+        cache.clear()
+        rendered_changes = get_rendered_field_changes(change)
+        assert 'changed' in rendered_changes['proposition__summary'].diff
+        key = get_rendered_diffs_cache_key(
+            change, ChangeDiffData(change).get_hash(None, None, True)
+        )
+        assert cache.get(key) == rendered_changes
+        # Updating the change invalidates its cached diffs.
+        change.changed_object.summary = 'updated summary'
+        change.save()
+        change = Change.objects.get(pk=change.pk)
+        rendered_changes = get_rendered_field_changes(change)
+        assert 'updated' in rendered_changes['proposition__summary'].diff
+        # Updating the unchanged object (e.g., by applying another change) also does.
+        digest = ChangeDiffData(change).get_hash(None, None, True)
+        Proposition.objects.filter(pk=p.pk).update(summary='summary updated elsewhere')
+        change = Change.objects.get(pk=change.pk)
+        assert ChangeDiffData(change).get_hash(None, None, True) != digest
+        rendered_changes = get_rendered_field_changes(change)
+        assert 'elsewhere' in rendered_changes['proposition__summary'].diff
+
+    def test_field_changes_of_merged_change(self, django_assert_num_queries):
+        """Test that the objects of a merged change are only read once when diffed."""
+        p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+        for summary in ('first summary', 'second summary'):
+            p.summary = summary
+            change = p.save_change(contributor=UserFactory.create())
+            for _ in range(change.n_required_approvals):
+                approval = change.approve(moderator=UserFactory.create())
+                handle_approval(approval.pk)
+            change.refresh_from_db()
+            assert change.merged_date
+
+        change = Change.objects.get(pk=change.pk)
+        assert change.content_object.pk == p.pk
+        diff_data = ChangeDiffData(change)
+        # The unchanged object of a merged change is the changed object of the
+        # previously merged change, which is not queried again.
+        with django_assert_num_queries(0):
+            field_changes = get_field_changes(
+                change, included_fields=['title', 'summary'], diff_data=diff_data
+            )
+        assert field_changes['proposition__summary'].before == 'first summary'
+        assert field_changes['proposition__summary'].after == 'second summary'
+
+    def test_bulk_application(self):
+        """Test approving and applying a change set in bulk."""
+        contributor = UserFactory.create()
+        change_set = ChangeSet.objects.create(initiator=contributor)
+        propositions = []
+        for index in range(3):
+            p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+            p.summary = f'changed summary {index}'
+            p.save_change(contributor=contributor, set=change_set)
+            propositions.append(p)
+        for _ in range(change_set.n_required_approvals):
+            ChangeSet.objects.filter(pk=change_set.pk).approve(moderator=UserFactory.create())
+        changes = Change.objects.filter(set=change_set)
+        assert changes.count() == len(propositions)
+        assert not changes.filter(merged_date__isnull=True).exists()
+        for index, p in enumerate(propositions):
+            p.refresh_from_db()
+            assert p.summary == f'changed summary {index}'
+
+    def test_bulk_application_skips_changes_requiring_rebase(self):
+        """Test that changes requiring rebasing do not prevent others from being applied."""
+        contributor = UserFactory.create()
+        propositions, change_ids = [], []
+        for index in range(2):
+            p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+            p.summary = f'changed summary {index}'
+            change_ids.append(p.save_change(contributor=contributor).pk)
+            propositions.append(p)
+        Change.objects.filter(pk__in=change_ids).update(
+            moderation_status=ModerationStatus.APPROVED
+        )
+        Change.objects.filter(pk=change_ids[0]).update(requires_rebase=True)
+        Proposition.objects.filter(pk=propositions[1].pk).update(cache={'stale': True})
+        changes = list(Change.objects.filter(pk__in=change_ids).order_by('pk'))
+        assert Change.objects.apply_changes(changes) == [changes[1]]
+        for p in propositions:
+            p.refresh_from_db()
+        assert propositions[0].summary == 'summary'
+        assert propositions[1].summary == 'changed summary 1'
+        # Values cached before the change was applied are wiped.
+        assert 'stale' not in propositions[1].cache
+
+    def test_bulk_application_runs_save_hooks(self):
+        """Test that applying changes runs the models' save overrides and signals."""
+        cache.clear()
+        today = timezone.localdate()
+        tomorrow = today + timedelta(days=1)
+        quote = QuoteFactory.create(
+            date=HistoricDateTime(1776, today.month, today.day), date_is_circa=False
+        )
+        webpage = WebpageFactory.create()
+        assert [item['pk'] for item in today_in_history.get_feed()] == [quote.pk]
+
+        contributor = UserFactory.create()
+        change_set = ChangeSet.objects.create(initiator=contributor)
+        quote.date = HistoricDateTime(1776, tomorrow.month, tomorrow.day)
+        quote.save_change(contributor=contributor, set=change_set)
+        # `Webpage.save()` derives the website name from the website.
+        webpage.website = WebsiteFactory.create()
+        webpage.save_change(contributor=contributor, set=change_set)
+        for _ in range(change_set.n_required_approvals):
+            ChangeSet.objects.filter(pk=change_set.pk).approve(moderator=UserFactory.create())
+        assert not Change.objects.filter(set=change_set, merged_date__isnull=True).exists()
+
+        webpage.refresh_from_db()
+        assert webpage.website_name == webpage.website.name
+        # The `pre_save` receivers recorded the quote's original day, so that the
+        # feeds of both days were invalidated.
+        assert today_in_history.get_feed() == []
+        assert [item['pk'] for item in today_in_history.get_feed(tomorrow)] == [quote.pk]
+
+    def test_bulk_application_skips_undeserializable_changes(self):
+        """Test that changes whose objects cannot be deserialized are skipped."""
+        contributor = UserFactory.create()
+        change_ids = []
+        for _ in range(2):
+            p = PropositionFactory.create(type='propositions.conclusion', summary='summary')
+            p.summary = 'changed summary'
+            change_ids.append(p.save_change(contributor=contributor).pk)
+        Change.objects.filter(pk__in=change_ids).update(
+            moderation_status=ModerationStatus.APPROVED
+        )
+        Change.objects.filter(pk=change_ids[0]).update(
+            changed_object=[{'model': 'propositions.nonexistent', 'pk': 1, 'fields': {}}]
+        )
+        changes = list(Change.objects.filter(pk__in=change_ids).order_by('pk'))
+        assert Change.objects.apply_changes(changes) == [changes[1]]
+        p.refresh_from_db()
+        assert p.summary == 'changed summary'
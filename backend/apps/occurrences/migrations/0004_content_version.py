@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('occurrences', '0003_remove_occurrence_tags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='occurrence',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0005_auto_20211025_0054'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+    ]
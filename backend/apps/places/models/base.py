@@ -98,7 +98,7 @@ class Place(TypedModule):
         return self.name
 
     @property  # type: ignore
-    @store(key='string')
+    @store(key='string', depends_on=('location',))
     def string(self) -> str:
         """Presentable string to display in HTML."""
         location = self.location
@@ -78,7 +78,7 @@ class PropositionAdmin(AbstractPropositionAdmin):
 
     list_display = [*AbstractPropositionAdmin.list_display, 'date_string', 'type']
     list_filter = ['type', *AbstractPropositionAdmin.list_filter]
-    ordering = ['date', 'type']
+    ordering = ['date_position', 'type']
     search_fields = model.searchable_fields
 
 
@@ -132,6 +132,9 @@ class PropositionSerializer(_PropositionSerializer):
     class Meta(_PropositionSerializer.Meta):
         model = Proposition
         fields = _PropositionSerializer.Meta.fields + ['arguments']
+        prefetch_related = _PropositionSerializer.Meta.prefetch_related + [
+            'arguments___supports',
+        ]
 
 
 class OccurrenceSerializer(PropositionSerializer):
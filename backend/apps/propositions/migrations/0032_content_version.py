@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('propositions', '0031_date_month_day'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proposition',
+            name='content_version',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='content version'
+            ),
+        ),
+    ]
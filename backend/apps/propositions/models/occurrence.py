@@ -37,7 +37,7 @@ class Occurrence(Proposition):
         """Meta options for the `Occurrence` model."""
 
         proxy = True
-        ordering = ['date']
+        ordering = ['date_position']
 
     objects = OccurrenceManager()
 
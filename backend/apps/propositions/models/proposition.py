@@ -327,7 +327,12 @@ class Proposition(  # noqa: WPS215
         return self.summary
 
     @classmethod
-    def get_object_html(cls, match: Match, use_preretrieved_html: bool = False) -> str:
+    def get_object_html(
+        cls,
+        match: Match,
+        use_preretrieved_html: bool = False,
+        model_instance: Optional['Proposition'] = None,
+    ) -> str:
         """Return the proposition's HTML based on a placeholder in the admin."""
         if not match:
             logging.error('proposition.get_object_html was called without a match')
@@ -338,11 +343,13 @@ class Proposition(  # noqa: WPS215
             if preretrieved_html:
                 return str(preretrieved_html).strip()
         pk = int(match.group(PlaceholderGroups.PK))
-        proposition: Proposition = cls.objects.get(pk=pk)
+        proposition: Proposition = model_instance or cls.objects.get(pk=pk)
         return proposition.summary_link
 
     @classmethod
-    def get_updated_placeholder(cls, match: Match) -> str:
+    def get_updated_placeholder(
+        cls, match: Match, model_instance: Optional['Proposition'] = None
+    ) -> str:
         """Return a placeholder for a model instance depicted in an HTML field."""
         placeholder: str = str(match.group(0))
         logging.debug(f'Looking at {truncate(placeholder)}')
@@ -353,7 +360,7 @@ class Proposition(  # noqa: WPS215
         )
         if extant_html:
             if '<a ' not in extant_html:
-                html = cls.get_object_html(match)
+                html = cls.get_object_html(match, model_instance=model_instance)
                 html = re.sub(
                     r'(.+?">).+?(<\/a>)',  # TODO
                     rf'\g<1>{extant_html}\g<2>',
@@ -364,7 +371,7 @@ class Proposition(  # noqa: WPS215
                 logging.info('Returning extant placeholder')
                 return placeholder
         else:
-            html = cls.get_object_html(match)
+            html = cls.get_object_html(match, model_instance=model_instance)
             model_name = match.group(PlaceholderGroups.MODEL_NAME)
             pk = match.group(PlaceholderGroups.PK)
             placeholder = f'[[ {model_name}: {pk}: {html} ]]'
@@ -1,7 +1,12 @@
+from unittest.mock import patch
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.propositions.factories import PropositionFactory
 from apps.propositions.models import Proposition
+from core.models.model_with_cache import batched_cache_writes
 from core.tests import TestSuite
 
 
@@ -21,3 +26,26 @@ class TestPropositions(TestSuite):
         assert proposition.slug
         # Confirm cache was wiped.
         assert not proposition.cache
+
+    def test_storing_computed_values(self):
+        """Verify computed values are written to the cache without a full save."""
+        proposition: Proposition = PropositionFactory.create()
+        proposition.refresh_from_db()
+        assert 'truncated_elaboration' not in proposition.cache
+        with patch.object(Proposition, 'save') as save:
+            truncated_elaboration = proposition.truncated_elaboration
+        save.assert_not_called()
+        proposition.refresh_from_db()
+        assert proposition.cache['truncated_elaboration'] == truncated_elaboration
+
+    def test_batching_cache_writes(self):
+        """Verify batched cache writes are flushed with a single query."""
+        propositions = PropositionFactory.create_batch(3)
+        with CaptureQueriesContext(connection) as context:
+            with batched_cache_writes():
+                for index, proposition in enumerate(propositions):
+                    proposition.write_cache(testing=index)
+        assert len(context.captured_queries) == 1
+        for index, proposition in enumerate(propositions):
+            proposition.refresh_from_db()
+            assert proposition.cache['testing'] == index
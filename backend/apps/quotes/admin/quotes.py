@@ -88,7 +88,7 @@ class QuoteAdmin(SearchableModelAdmin):
         AttributeeCountFilter,
         ('date', DateRangeFilter),
     ]
-    ordering = ['date']
+    ordering = ['date_position']
     readonly_fields = SearchableModelAdmin.readonly_fields + [
         'attributee_html',
         'citation_html',
@@ -0,0 +1,67 @@
+from django.db import migrations, models
+
+TIMELINE_FIELDS = ['astronomical_year', 'date_position', 'date_precision']
+
+BATCH_SIZE = 1000
+
+
+def populate_timeline_fields(apps, schema_editor):
+    for model_name in ('Quote',):
+        model = apps.get_model('quotes', model_name)
+        instances = []
+        for instance in model.objects.exclude(date=None).only('pk', 'date').iterator():
+            instance.astronomical_year = instance.date.astronomical_year
+            instance.date_position = instance.date.chronological_position
+            instance.date_precision = instance.date.precision
+            instances.append(instance)
+        model.objects.bulk_update(instances, TIMELINE_FIELDS, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0016_merge_20211025_2139'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quote',
+            name='astronomical_year',
+            field=models.IntegerField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text='signed year of the date (1 BCE is year 0)',
+                null=True,
+                verbose_name='astronomical year',
+            ),
+        ),
+        migrations.AddField(
+            model_name='quote',
+            name='date_position',
+            field=models.FloatField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text='position of the date on a continuous scale increasing with time',
+                null=True,
+                verbose_name='date position',
+            ),
+        ),
+        migrations.AddField(
+            model_name='quote',
+            name='date_precision',
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                choices=[(1, 'year'), (2, 'season'), (3, 'month'), (4, 'day')],
+                editable=False,
+                null=True,
+                verbose_name='date precision',
+            ),
+        ),
+        migrations.AlterModelOptions(
+            name='quote',
+            options={'ordering': ['date_position']},
+        ),
+        migrations.RunPython(populate_timeline_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+from datetime import timezone
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+DAY_PRECISION = 4
+
+
+def populate_date_month_day(apps, schema_editor):
+    for model_name in ('Quote',):
+        model = apps.get_model('quotes', model_name)
+        model.objects.filter(date_precision=DAY_PRECISION).update(
+            date_month_day=(
+                ExtractMonth('date', tzinfo=timezone.utc) * 100
+                + ExtractDay('date', tzinfo=timezone.utc)
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quotes', '0017_timeline_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quote',
+            name='date_month_day',
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text='month and day of the date (e.g., 704 for 4 July), if the day is known',
+                null=True,
+                verbose_name='date month and day',
+            ),
+        ),
+        migrations.RunPython(populate_date_month_day, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,7 @@
 """Model classes for the quotes app."""
 
 import logging
-from typing import TYPE_CHECKING, Match
+from typing import TYPE_CHECKING, Match, Optional
 
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
@@ -158,7 +158,7 @@ class Quote(
 
     # https://docs.djangoproject.com/en/dev/ref/models/options/#model-meta-options
     class Meta:
-        ordering = ['date']
+        ordering = ['date_position']
 
     placeholder_regex = quote_placeholder_regex
     searchable_fields = [
@@ -328,14 +328,19 @@ class Quote(
         return Occurrence.objects.filter(related_quotes__pk=self.pk)
 
     @classmethod
-    def get_object_html(cls, match: Match, use_preretrieved_html: bool = False) -> str:
+    def get_object_html(
+        cls,
+        match: Match,
+        use_preretrieved_html: bool = False,
+        model_instance: Optional['Quote'] = None,
+    ) -> str:
         """Return the quote's HTML based on a placeholder in the admin."""
         if use_preretrieved_html:
             # Return the pre-retrieved HTML (already included in placeholder)
             preretrieved_html = str(match.group(PlaceholderGroups.HTML))
             if preretrieved_html:
                 return str(preretrieved_html).strip()
-        quote = cls.objects.get(pk=match.group(PlaceholderGroups.PK))
+        quote = model_instance or cls.objects.get(pk=match.group(PlaceholderGroups.PK))
         if isinstance(quote, dict):
             body = quote['text']
             footer = quote.get('citation_html') or quote.get('attributee_string')
@@ -4,6 +4,16 @@ import pytest
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from apps.entities.factories import EntityFactory
+from apps.images.factories import ImageFactory
+from apps.quotes.factories import QuoteFactory
+from apps.quotes.models import Citation, Quote
+from apps.sources.factories import SourceFactory
+from apps.sources.models import SourceAttribution
+from apps.sources.models.citation import render_citations
+from core import warming
+from core.utils.models import serialize_instances
+
 
 @pytest.mark.django_db()
 class TestQuotes:
@@ -14,3 +24,57 @@ class TestQuotes:
         url = reverse('quotes_api:quote-list')
         response = api_client.get(url)
         assert response.status_code == 200
+
+    def test_serialize_instances(self):
+        """Test serializing a mixed list of modules in bulk."""
+        instances = [
+            QuoteFactory.create(),
+            ImageFactory.create(),
+            {'model': 'quotes.quote', 'pk': 0},
+            QuoteFactory.create(),
+        ]
+        serialized_instances = serialize_instances(instances)
+        assert serialized_instances[2] == instances[2]
+        for instance, serialized_instance in zip(instances, serialized_instances):
+            if not isinstance(instance, dict):
+                assert serialized_instance == instance.serialize()
+
+    def test_render_citations(self):
+        """Test that citations rendered in bulk match citations rendered individually."""
+        quote = QuoteFactory.create()
+        attributee = EntityFactory.create()
+        for position in range(3):
+            source = SourceFactory.create()
+            SourceAttribution(source=source, attributee=attributee, verified=True).save()
+            Citation(
+                content_object=quote,
+                source=source,
+                position=position,
+                pages=[[position + 1, position + 2]],
+                verified=True,
+            ).save()
+        citations = list(Citation.objects.filter(content_object=quote))
+        rendered_html = render_citations(citations)
+        for citation, html in zip(citations, rendered_html):
+            assert html == Citation.objects.get(pk=citation.pk).html
+        assert all('quoted in' in html for html in rendered_html)
+
+    def test_cache_warming(self):
+        """Test warming the caches of quotes in a resumable run."""
+        quotes = QuoteFactory.create_batch(3)
+        Quote._base_manager.update(cache={})
+        run_id, chunks = warming.start_run([Quote], chunk_size=2)
+        assert [len(chunk.pks) for chunk in chunks] == [2, 1]
+        first, last = chunks
+        warming.warm_chunk(first.model_label, first.pks, run_id=run_id, index=first.index)
+        # Rows added after the run starts do not shift its chunks.
+        QuoteFactory.create()
+        assert warming.get_pending_chunks(run_id) == [last]
+        warming.warm_chunk(last.model_label, last.pks, run_id=run_id, index=last.index)
+        assert all(Quote.objects.get(pk=quote.pk).cache for quote in quotes)
+        # The run's checkpoints are cleared when its last chunk is completed.
+        with pytest.raises(ValueError):
+            warming.get_pending_chunks(run_id)
+        # New runs warm every chunk.
+        _run_id, chunks = warming.start_run([Quote], chunk_size=2)
+        assert len(chunks) == 2
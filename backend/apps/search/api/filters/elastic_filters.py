@@ -10,6 +10,7 @@ from apps.admin.widgets.historic_date_widget import (
 from apps.dates.structures import HistoricDateTime
 
 QUERY_PARAM = 'query'
+SORT_BY_PARAM = 'ordering'
 START_YEAR_PARAM = 'start_year'
 START_YEAR_TYPE_PARAM = 'start_year_type'
 END_YEAR_PARAM = 'end_year'
@@ -18,6 +19,14 @@ ENTITIES_PARAM = 'entities'
 QUALITY_PARAM = 'quality'
 TOPICS_PARAM = 'topics'
 
+# Sort values are precomputed in search documents; `sort_key` is unique,
+# so that every result has a distinct position for `search_after` pagination.
+DATE_SORT = [
+    {'sort_date': {'order': 'asc', 'unmapped_type': 'long'}},
+    {'sort_key': {'order': 'asc', 'unmapped_type': 'keyword'}},
+]
+RELEVANCE_SORT = [{'_score': {'order': 'desc'}}, *DATE_SORT]
+
 
 class ModulesSearchFilterBackend(filters.BaseFilterBackend):
     """
@@ -46,6 +55,7 @@ class ModulesSearchFilterBackend(filters.BaseFilterBackend):
 
         query_string = request.query_params.get(QUERY_PARAM, None)
         suppress_unverified = request.query_params.get(QUALITY_PARAM) == 'verified'
+        sort_by_date = request.query_params.get(SORT_BY_PARAM) == 'date'
 
         start_year = request.query_params.get(START_YEAR_PARAM, None)
         end_year = request.query_params.get(END_YEAR_PARAM, None)
@@ -71,6 +81,7 @@ class ModulesSearchFilterBackend(filters.BaseFilterBackend):
             'entity_ids': entity_ids,
             'topic_ids': topic_ids,
             'suppress_unverified': suppress_unverified,
+            'sort_by_date': sort_by_date,
         }
 
     @staticmethod
@@ -83,24 +94,29 @@ class ModulesSearchFilterBackend(filters.BaseFilterBackend):
         entity_ids: Optional[list[int]] = None,
         topic_ids: Optional[list[int]] = None,
         suppress_unverified: bool = True,
+        sort_by_date: bool = False,
     ):
 
         qs = qs.index(indexes)
 
-        # sorts by relevance, falls back to date sort when scores aren't available (i.e when there's no query)
-        qs = qs.sort('_score', 'date')
+        # Sort by relevance (breaking ties by date) if there is a query; otherwise, by date.
+        if query_string and not sort_by_date:
+            qs = qs.sort(*RELEVANCE_SORT)
+        else:
+            qs = qs.sort(*DATE_SORT)
 
         if query_string:
             query = Q('simple_query_string', query=query_string)
             qs = qs.query(query)
 
         if start_date or end_date:
-            date_range = {}
+            # Filter by signed years, which (unlike datetimes) are ordered correctly BCE.
+            year_range = {}
             if start_date:
-                date_range['gte'] = start_date
+                year_range['gte'] = start_date.astronomical_year
             if end_date:
-                date_range['lte'] = end_date
-            qs = qs.query('bool', filter=[Q('range', date=date_range)])
+                year_range['lte'] = end_date.astronomical_year
+            qs = qs.query('bool', filter=[Q('range', astronomical_year=year_range)])
 
         if entity_ids:
             qs = qs.query(
@@ -1,3 +1,7 @@
+import base64
+import json
+from typing import NamedTuple, Optional
+
 from django.core import paginator as django_paginator
 from django_elasticsearch_dsl_drf.pagination import PageNumberPagination, Paginator
 from rest_framework.exceptions import NotFound
@@ -6,12 +10,46 @@ from rest_framework.generics import ListAPIView
 from core.pagination import TotalPagesMixin
 
 
+class Cursor(NamedTuple):
+    """Position of a page of search results."""
+
+    # Sort values of the previous page's last result
+    search_after: list
+    # Position of the page's first result among all results
+    offset: int
+
+
+def encode_cursor(search_after: Optional[list], offset: int) -> Optional[str]:
+    """Return an opaque cursor string encoding `search_after` sort values and an offset."""
+    if not search_after:
+        return None
+    cursor = {'search_after': search_after, 'offset': offset}
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Return the `search_after` sort values and offset encoded in a cursor string."""
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        search_after, offset = data['search_after'], data['offset']
+    except (ValueError, TypeError, KeyError):
+        raise NotFound('Invalid cursor.')
+    if not isinstance(search_after, list) or not search_after:
+        raise NotFound('Invalid cursor.')
+    if not isinstance(offset, int) or offset < 0:
+        raise NotFound('Invalid cursor.')
+    return Cursor(search_after, offset)
+
+
 class Page(django_paginator.Page):
     """Page for Elasticsearch."""
 
-    def __init__(self, object_list, number, paginator, facets, count):
+    def __init__(self, object_list, number, paginator, facets, count, next_cursor=None):
         self.facets = facets
         self.count = count
+        self.next_cursor = next_cursor
         super().__init__(object_list, number, paginator)
 
 
@@ -19,32 +57,53 @@ class ElasticPaginator(Paginator):
     """Paginator for Elasticsearch."""
 
     view: ListAPIView
+    cursor: Optional[Cursor] = None
 
     def page(self, number):
         """Returns a Page object for the given 1-based page number.
 
+        The page (including orphans) is retrieved with a single query, in the
+        order determined by Elasticsearch. If a cursor is set, its `search_after`
+        sort values are used (instead of an offset) to locate the page, and its
+        offset determines the page number.
+
         :param number:
         :return:
         """
-        bottom = (number - 1) * self.per_page
-        top = bottom + self.per_page
-
-        object_list, count = self.object_list[bottom:top].to_queryset(self.view)
+        if self.cursor:
+            bottom = self.cursor.offset
+            number = bottom // self.per_page + 1
+            search_after = self.cursor.search_after
+        else:
+            bottom = (number - 1) * self.per_page
+            search_after = None
+        search = self.object_list.paginate(
+            bottom, self.per_page, orphans=self.orphans, search_after=search_after
+        )
+
+        object_list, count = self.resolve(search)
         object_list = self.apply_filters(object_list)
 
         self.count = count
-
-        if self.count > top and self.count - top <= self.orphans:
-            # Fetch the additional orphaned nodes
-            orphans = self.object_list[top : self.count].to_queryset(self.view)
-            orphans = self.apply_filters(orphans)
-            object_list = list(object_list) + list(orphans)
         number = self.validate_number(number)
         __facets = getattr(object_list, 'aggregations', None)
-        return self._get_page(object_list, number, self, facets=__facets, count=count)
+        return self._get_page(
+            object_list,
+            number,
+            self,
+            facets=__facets,
+            count=count,
+            next_cursor=encode_cursor(search.next_search_after, bottom + self.per_page),
+        )
+
+    def resolve(self, search):
+        """Return the results of the search, along with the total count of hits."""
+        if getattr(self.view, 'source_only', False):
+            return search.to_payloads(self.view)
+        return search.to_queryset(self.view)
 
     def apply_filters(self, object_list):
-        for backend in self.view.post_resolve_filters:
+        for backend in self.view.get_post_resolve_filters():
             object_list = backend().filter_queryset(self.view.request, object_list, self.view)
         return object_list
 
@@ -74,6 +133,7 @@ class ElasticPageNumberPagination(TotalPagesMixin, PageNumberPagination):
     django_paginator_class = ElasticPaginator
     page_size_query_param = 'page_size'
     orphans_query_param = 'orphans'
+    cursor_query_param = 'cursor'
 
     def paginate_queryset(self, queryset, request, view=None):
         """Paginate a queryset.
@@ -93,6 +153,7 @@ class ElasticPageNumberPagination(TotalPagesMixin, PageNumberPagination):
         orphans = min(int(request.query_params.get(self.orphans_query_param, 0)), page_size)
         paginator = self.django_paginator_class(queryset, page_size, orphans=orphans)
         paginator.view = view
+        paginator.cursor = decode_cursor(request.query_params.get(self.cursor_query_param))
 
         page_number = int(request.query_params.get(self.page_query_param, 1))
         if page_number in self.last_page_strings:
@@ -110,3 +171,9 @@ class ElasticPageNumberPagination(TotalPagesMixin, PageNumberPagination):
 
         self.request = request
         return list(self.page)
+
+    def get_paginated_response(self, data):
+        """Add the cursor for retrieving the next page to the response."""
+        response = super().get_paginated_response(data)
+        response.data['next_cursor'] = self.page.next_cursor
+        return response
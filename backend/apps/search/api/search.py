@@ -1,15 +1,17 @@
 import logging
-from itertools import chain
-from typing import TYPE_CHECKING, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from elasticsearch_dsl import Search as DSLSearch
 
+from apps.search.api.serializers import ELASTICSEARCH_META_FIELDS_TO_CLEAN
 from apps.search.documents.entity import EntityDocument
 from apps.search.documents.image import ImageDocument
 from apps.search.documents.occurrence import OccurrenceDocument
 from apps.search.documents.proposition import PropositionDocument
 from apps.search.documents.quote import QuoteDocument
 from apps.search.documents.source import SourceDocument
+from core.profiling import ELASTICSEARCH, timed
+from core.utils.models import serialize_instances
 
 if TYPE_CHECKING:
     from apps.search.models.searchable_model import SearchableModel
@@ -25,19 +27,54 @@ SEARCHABLE_DOCUMENTS = {
 }
 
 
+PAYLOAD_FIELD = 'payload'
+
+
 class Search(DSLSearch):
     results_count: int
     results_by_id: Optional[dict]
-
-    def to_queryset(self, view) -> tuple[Union[Sequence['SearchableModel'], chain], int]:
-        """Resolve results from ElasticSearch to Django model instances."""
-        response = self
+    # Sort values of the last result, for retrieving the next page with `search_after`
+    next_search_after: Optional[list] = None
+
+    # Pagination state; see `paginate`.
+    page_start: int = 0
+    page_size: Optional[int] = None
+    orphans: int = 0
+
+    def paginate(
+        self,
+        page_start: int,
+        page_size: int,
+        orphans: int = 0,
+        search_after: Optional[list] = None,
+    ) -> 'Search':
+        """
+        Return a search for a page of results, including orphans.
+
+        The page and its orphans (i.e., the remaining results, if there are no
+        more than `orphans` of them) are retrieved with a single query. If sort
+        values of the previous page's last result are given, the page is retrieved
+        with `search_after` rather than `from`, so deep pages are as cheap as the first.
+        """
+        size = page_size + orphans
+        if search_after:
+            search = self.extra(search_after=search_after)[0:size]
+        else:
+            search = self[page_start : page_start + size]
+        search.page_start = page_start
+        search.page_size = page_size
+        search.orphans = orphans
+        return search
+
+    def get_hits(self, **source_kwargs) -> list:
+        """Execute the search (once) and return the hits of the requested page."""
+        response = getattr(self, '_response', None)
 
         # Do not query again if the es result is already cached
-        if not hasattr(self, '_response'):
-            # We only need the meta fields with the models ids
-            response = self.source(excludes=['*']).extra(track_scores=True)
-            response = response.execute()
+        if response is None:
+            response = self.source(**source_kwargs).extra(track_scores=True)
+            with timed(ELASTICSEARCH):
+                response = response.execute()
 
         self.results_count = int(response.hits.total.value)
         self._response = response
@@ -46,17 +83,34 @@ class Search(DSLSearch):
             f'ES Search took {response.took} ms and returned n={self.results_count} results'
         )
 
-        # group results by index name
-        result_groups = {}
+        hits = list(response)
+        if self.page_size is not None:
+            remaining_count = self.results_count - (self.page_start + self.page_size)
+            if remaining_count > self.orphans:
+                # There are too many remaining results to append them as orphans.
+                hits = hits[: self.page_size]
+        self.next_search_after = None
+        if hits and self.page_start + len(hits) < self.results_count:
+            self.next_search_after = list(hits[-1].meta.sort)
+
         self.results_by_id = {}
-        for result in response:
-            index = result.meta.index
-            result_groups.setdefault(index, []).append(result)
-            key = f'{index}_{result.meta.id}'
+        for result in hits:
+            key = f'{result.meta.index}_{result.meta.id}'
             self.results_by_id[key] = result
+        return hits
+
+    def to_queryset(self, view) -> tuple[Sequence['SearchableModel'], int]:
+        """Resolve results from ElasticSearch to Django model instances, in order."""
+        # We only need the meta fields with the models ids
+        hits = self.get_hits(excludes=['*'])
+
+        # group results by index name
+        result_groups = {}
+        for result in hits:
+            result_groups.setdefault(result.meta.index, []).append(result)
 
-        # build queryset chain for each result group by resolving es results to django models
-        qs = chain()
+        # resolve es results to django models, one query per result group
+        model_instances = {}
         for index, result_group in result_groups.items():
             document = SEARCHABLE_DOCUMENTS.get(index)
             if not document:
@@ -68,10 +122,62 @@ class Search(DSLSearch):
 
             queryset = model.objects.filter(pk__in=pks)
             queryset = self.apply_filters(view, queryset, model)
-            qs = chain(qs, queryset)
+            for model_instance in queryset:
+                model_instances[f'{index}_{model_instance.pk}'] = model_instance
 
         view.search = self
-        return qs, self.results_count
+        # Results are returned in the order determined by ElasticSearch.
+        ordered_model_instances = [
+            model_instances[key] for key in self.results_by_id if key in model_instances
+        ]
+        return ordered_model_instances, self.results_count
+
+    def to_payloads(self, view) -> tuple[list[dict], int]:
+        """
+        Return serialized results from the `_source` of ElasticSearch hits.
+
+        Hits indexed without a payload (e.g., before source-only results were
+        enabled) are resolved and serialized from the database instead.
+        """
+        hits = self.get_hits(includes=[PAYLOAD_FIELD])
+
+        payloads: list[Optional[dict]] = []
+        unresolved: dict[str, dict] = {}
+        for position, result in enumerate(hits):
+            payload = getattr(result, PAYLOAD_FIELD, None)
+            if payload:
+                payloads.append(payload.to_dict() | {'meta': self.get_meta(result)})
+            else:
+                payloads.append(None)
+                unresolved.setdefault(result.meta.index, {})[result.meta.id] = position
+
+        unresolved_instances = {}
+        for index, positions in unresolved.items():
+            document = SEARCHABLE_DOCUMENTS.get(index)
+            if not document:
+                logging.error(f"Couldn't find document definition for this index = {index}")
+                continue
+            model = document.django.model
+            queryset = model.objects.filter(pk__in=list(positions))
+            queryset = self.apply_filters(view, queryset, model)
+            for model_instance in queryset:
+                position = positions[str(model_instance.pk)]
+                model_instance.meta = hits[position].meta
+                unresolved_instances[position] = model_instance
+        serialized_instances = serialize_instances(unresolved_instances.values())
+        for position, payload in zip(unresolved_instances, serialized_instances):
+            payloads[position] = payload
+
+        view.search = self
+        return [payload for payload in payloads if payload is not None], self.results_count
+
+    @staticmethod
+    def get_meta(result) -> dict:
+        """Return the cleaned meta info (e.g., score and highlight) of a search hit."""
+        meta = result.meta.to_dict()
+        for key in ELASTICSEARCH_META_FIELDS_TO_CLEAN:
+            meta.pop(key, None)
+        return meta
 
     @staticmethod
     def apply_filters(view, queryset, model):
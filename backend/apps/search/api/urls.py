@@ -6,5 +6,6 @@ app_name = 'search'
 
 urlpatterns = [
     path('instant/', views.InstantSearchApiView.as_view()),
+    path('indexing/metrics/', views.IndexingMetricsApiView.as_view()),
     path('', views.ElasticSearchResultsAPIView.as_view()),
 ]
@@ -1,23 +1,54 @@
+from django.conf import settings
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.utils.models import serialize_instances
+
+from .. import indexing, instant
+from ..caching import (
+    cache_response,
+    get_cached_response,
+    get_response_cache_key,
+    response_caching_is_enabled,
+)
 from ..documents import instant_search_documents_map
+from .filters import elastic_filters
 from .filters.elastic_filters import ModulesSearchFilterBackend
-from .filters.post_resolve_filters import ApplyMetaFilterBackend, SortByFilterBackend
+from .filters.post_resolve_filters import ApplyMetaFilterBackend
 from .filters.pre_resolve_filters import PreResolveFilterBackend
 from .pagination import ElasticPageNumberPagination
 from .search import Search
 
 QUERY_PARAM = 'query'
 
+# Parameters that determine the search results response (and hence its cache key)
+RESULTS_CACHE_KEY_PARAMS = (
+    elastic_filters.QUERY_PARAM,
+    elastic_filters.START_YEAR_PARAM,
+    elastic_filters.START_YEAR_TYPE_PARAM,
+    elastic_filters.END_YEAR_PARAM,
+    elastic_filters.END_YEAR_TYPE_PARAM,
+    elastic_filters.ENTITIES_PARAM,
+    elastic_filters.TOPICS_PARAM,
+    elastic_filters.QUALITY_PARAM,
+    elastic_filters.SORT_BY_PARAM,
+    'content_types',
+    ElasticPageNumberPagination.page_query_param,
+    ElasticPageNumberPagination.page_size_query_param,
+    ElasticPageNumberPagination.orphans_query_param,
+    ElasticPageNumberPagination.cursor_query_param,
+)
+
 
 class SearchResultsSerializer:
     """Serializer for search results."""
 
     def __init__(self, queryset, *args, **kwargs):
-        self.data = [instance.serialize() for instance in queryset]
+        # Results read from ElasticSearch `_source` are already serialized.
+        self.data = serialize_instances(queryset)
 
 
 class ElasticSearchResultsAPIView(ListAPIView):
@@ -31,9 +62,15 @@ class ElasticSearchResultsAPIView(ListAPIView):
     pre_resolve_filters = [PreResolveFilterBackend]
 
     # These filters are applied after the search results resolved to models
-    # applying meta filter backend should be first because sort and future
+    # applying meta filter backend should be first because future
     # filters might depend on meta field.
-    post_resolve_filters = [ApplyMetaFilterBackend, SortByFilterBackend]
+    # Results are already sorted by ElasticSearch.
+    post_resolve_filters = [ApplyMetaFilterBackend]
+
+    # When enabled, results are rendered from the payloads stored in ES documents
+    # (with their meta info already attached), rather than resolved from the database.
+    source_only = settings.ELASTICSEARCH_SOURCE_ONLY_RESULTS
+    source_only_post_resolve_filters: list = []
 
     suppress_unverified: bool
     search: Search
@@ -43,6 +80,29 @@ class ElasticSearchResultsAPIView(ListAPIView):
 
         return self.search
 
+    def list(self, request, *args, **kwargs):
+        """Return the search results, from the cache if possible."""
+        if not response_caching_is_enabled():
+            return super().list(request, *args, **kwargs)
+        params = {
+            param: request.query_params.getlist(param) for param in RESULTS_CACHE_KEY_PARAMS
+        }
+        params['source_only'] = str(self.source_only)
+        indexes = ModulesSearchFilterBackend.get_filter_params(request)['indexes']
+        cache_key = get_response_cache_key('results', params, indexes.split(','))
+        data = get_cached_response(cache_key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        cache_response(cache_key, response.data)
+        return response
+
+    def get_post_resolve_filters(self) -> list:
+        """Return the filters to be applied after search results are resolved."""
+        if self.source_only:
+            return self.source_only_post_resolve_filters
+        return self.post_resolve_filters
+
 
 class InstantSearchApiView(APIView):
     """API view used by search-as-you-type fields."""
@@ -63,13 +123,13 @@ class InstantSearchApiView(APIView):
             return Response([])
 
         document = instant_search_documents_map[model]
-        search = document.search()
+        return Response(instant.get_results(document, query, filters))
+
 
-        if filters:
-            search = search.filter('term', **filters)
+class IndexingMetricsApiView(APIView):
+    """API view reporting the depth and lag of the search indexing queue."""
 
-        results = search.query(
-            'multi_match', query=query, fields=document.search_fields
-        ).source(document.search_fields)
+    permission_classes = [IsAdminUser]
 
-        return Response([{'id': result.meta.id} | result.to_dict() for result in results])
+    def get(self, request):
+        return Response(indexing.get_metrics())
@@ -0,0 +1,118 @@
+"""Caching of search responses, invalidated by writes to search indexes."""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django_elasticsearch_dsl.registries import registry
+from elasticsearch.exceptions import ElasticsearchException
+from elasticsearch_dsl.connections import connections
+
+RESPONSE_KEY_PREFIX = 'search_response'
+INDEX_VERSION_KEY_PREFIX = 'search_index_version'
+
+
+def get_index_version_key(index: str) -> str:
+    """Return the cache key of an index's version counter."""
+    return f'{INDEX_VERSION_KEY_PREFIX}:{index}'
+
+
+def get_index_versions(indexes: Iterable[str]) -> dict[str, int]:
+    """Return the current version of each index, initializing missing versions."""
+    keys = {index: get_index_version_key(index) for index in indexes}
+    versions = cache.get_many(keys.values())
+    for index, key in keys.items():
+        if key not in versions:
+            # Start from an arbitrary (time-based) value rather than zero, so that
+            # responses cached before a version counter was evicted are not reused.
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return {index: versions[key] for index, key in keys.items()}
+
+
+def bump_index_versions(indexes: Iterable[str]):
+    """Increment the versions of indexes, invalidating responses cached for them."""
+    for index in set(indexes):
+        key = get_index_version_key(index)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def refresh_indexes(indexes: Iterable[str]):
+    """Make the writes to indexes searchable (auto-refresh is disabled)."""
+    indexes = sorted(set(indexes))
+    if not indexes:
+        return
+    try:
+        connections.get_connection().indices.refresh(
+            index=','.join(indexes), ignore_unavailable=True
+        )
+    except ElasticsearchException as error:
+        logging.error(f'Failed to refresh {", ".join(indexes)}: {error}')
+
+
+def invalidate_indexes(indexes: Iterable[str]):
+    """
+    Invalidate the responses cached for indexes after they are written to.
+
+    The indexes are refreshed first; otherwise, a response could be cached
+    (under the bumped versions) before the writes are visible to searches.
+    """
+    indexes = set(indexes)
+    refresh_indexes(indexes)
+    bump_index_versions(indexes)
+
+
+def get_instance_indexes(instance) -> set[str]:
+    """Return the names of the indexes affected by writes to a model instance."""
+    indexes = set()
+    for document in registry.get_documents():
+        django = document.django
+        related_models = getattr(django, 'related_models', None) or []
+        if isinstance(instance, (django.model, *related_models)):
+            indexes.add(document._index._name)
+    return indexes
+
+
+def normalize_params(params: dict) -> dict:
+    """Return request parameters in a canonical form, for use in cache keys."""
+    normalized_params = {}
+    for key, values in sorted(params.items()):
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        values = sorted(' '.join(str(value).split()) for value in values)
+        values = [value for value in values if value]
+        if values:
+            normalized_params[key] = values
+    return normalized_params
+
+
+def get_response_cache_key(namespace: str, params: dict, indexes: Iterable[str]) -> str:
+    """Return the cache key of a search response, including the queried indexes' versions."""
+    components = {
+        'params': normalize_params(params),
+        'versions': sorted(get_index_versions(indexes).items()),
+    }
+    digest = hashlib.md5(json.dumps(components, sort_keys=True).encode()).hexdigest()
+    return f'{RESPONSE_KEY_PREFIX}:{namespace}:{digest}'
+
+
+def response_caching_is_enabled() -> bool:
+    """Return whether search responses should be cached."""
+    return bool(settings.SEARCH_RESPONSE_CACHE_TIMEOUT)
+
+
+def get_cached_response(key: str) -> Optional[object]:
+    """Return cached response data, if any."""
+    return cache.get(key)
+
+
+def cache_response(key: str, data):
+    """Cache response data."""
+    cache.set(key, data, timeout=settings.SEARCH_RESPONSE_CACHE_TIMEOUT)
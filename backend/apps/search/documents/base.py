@@ -1,32 +1,124 @@
-from typing import Type
+import logging
+from typing import Optional, Type
 
+from django.conf import settings
 from django_elasticsearch_dsl import Document as ESDocument
 from django_elasticsearch_dsl import fields
 from django_elasticsearch_dsl.registries import registry
+from elasticsearch_dsl import SearchAsYouType
 
+from apps.dates.structures import HistoricDateTime
 from apps.search.documents.config import DEFAULT_INDEX_SETTINGS, instant_search_analyzer
 from core.models import ExtendedModel
 from core.models.module import Module
 
+# Date positions are scaled so that month and day offsets (multiples of 1/12
+# and 1/366 of a year) become integers.
+DATE_POSITION_SCALE = 12 * 366
+
+
+def get_date(instance) -> Optional[HistoricDateTime]:
+    """Return the date of a model instance, as used in search results."""
+    get_instance_date = getattr(instance, 'get_date', None)
+    return get_instance_date() if get_instance_date else getattr(instance, 'date', None)
+
+
+def get_astronomical_year(instance) -> Optional[int]:
+    """Return the signed year of a model instance's date (1 BCE is year 0)."""
+    astronomical_year = getattr(instance, 'astronomical_year', None)
+    if astronomical_year is None:
+        date = get_date(instance)
+        astronomical_year = date.astronomical_year if date else None
+    return astronomical_year
+
+
+def get_sort_date(instance) -> int:
+    """
+    Return the position of a model instance in date-ordered search results.
+
+    The value is derived from the date position persisted by dated models (or
+    computed from the date of other models), so that results are ordered
+    chronologically, including those dated BCE.
+    """
+    date_position = getattr(instance, 'date_position', None)
+    if date_position is None:
+        date = get_date(instance)
+        if not date:
+            logging.error(
+                f'{instance} has no date attribute but is included in search results.'
+            )
+            return 0
+        date_position = date.chronological_position
+    sort_date = round(date_position * DATE_POSITION_SCALE) * 2
+    # Display precise dates before ranges, e.g., "1500" before "1500 – 2000"
+    if getattr(instance, 'end_date', None):
+        sort_date += 1
+    return sort_date
+
 
 class Document(ESDocument):
 
     verified = fields.BooleanField()
     date = fields.DateField()
+    # Signed year of the date, for range filters that include dates BCE
+    astronomical_year = fields.IntegerField()
+    # The serialized search result, returned as-is when results are read from `_source`.
+    # It is stored but not indexed (i.e., not searchable).
+    payload = fields.ObjectField(enabled=False)
+    # Sort values, precomputed so that results can be ordered (and paginated
+    # with `search_after`) by ElasticSearch.
+    sort_date = fields.LongField()
+    sort_key = fields.KeywordField()
 
     @staticmethod
     def prepare_date(instance):
         return instance.get_date()
 
+    @staticmethod
+    def prepare_astronomical_year(instance) -> Optional[int]:
+        return get_astronomical_year(instance)
+
+    @staticmethod
+    def prepare_sort_date(instance) -> int:
+        return get_sort_date(instance)
+
+    @staticmethod
+    def prepare_sort_key(instance) -> str:
+        # Unique across indexes, to break ties between results with the same date.
+        return f'{instance._meta.label_lower}.{instance.pk}'
+
+    @staticmethod
+    def prepare_payload(instance) -> Optional[dict]:
+        if not settings.ELASTICSEARCH_SOURCE_ONLY_RESULTS:
+            return None
+        return instance.serialize()
+
     @classmethod
     def get_index_name(cls, index=None):
         return cls._default_index(index)
 
 
+class SearchAsYouTypeField(fields.DEDField, SearchAsYouType):
+    """A `search_as_you_type` field of a Django model document."""
+
+
+# Sizes of the shingle subfields (e.g., `name._2gram`) of `search_as_you_type` fields
+SHINGLE_SIZES = (2, 3)
+
+
 class InstantSearchDocument(ESDocument):
     search_fields: list[str]
     filter_fields: list[str]
 
+    @classmethod
+    def get_query_fields(cls) -> list[str]:
+        """Return the (sub)fields queried to match prefixes of the search fields."""
+        return [
+            query_field
+            for field in cls.search_fields
+            for query_field in [field, *(f'{field}._{size}gram' for size in SHINGLE_SIZES)]
+        ]
+
 
 def InstantSearchDocumentFactory(
     model: Type[ExtendedModel],
@@ -37,7 +129,8 @@ def InstantSearchDocumentFactory(
 ):
     """Returns an ElasticSearch Document class for the given module class.
 
-    All fields are analyzed as instant-search text fields.
+    Search fields are indexed as `search_as_you_type` fields, so that prefixes of
+    their words and phrases can be matched without scoring n-gram matches.
     The generated document is automatically registered by default.
     """
     filter_fields = filter_fields or []
@@ -55,8 +148,10 @@ def InstantSearchDocumentFactory(
             raise AttributeError(f'Model {model} does not have attribute "{field}"')
 
     instant_search_fields = {
-        field: fields.TextField(
-            analyzer=instant_search_analyzer, **(field_kwargs.get(field) or {})
+        field: SearchAsYouTypeField(
+            analyzer=instant_search_analyzer,
+            max_shingle_size=max(SHINGLE_SIZES),
+            **(field_kwargs.get(field) or {}),
         )
         for field in search_fields
     }
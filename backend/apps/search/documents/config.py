@@ -1,4 +1,4 @@
-from elasticsearch_dsl import analyzer, char_filter, tokenizer
+from elasticsearch_dsl import analyzer, char_filter
 
 html_field_analyzer = analyzer(
     'html_strip',
@@ -7,9 +7,11 @@ html_field_analyzer = analyzer(
     char_filter=['html_strip'],
 )
 
+# Analyzer of `search_as_you_type` fields, which index shingles and edge n-grams
+# of the analyzed words (rather than every 1- and 2-character n-gram)
 instant_search_analyzer = analyzer(
-    'custom',
-    tokenizer=tokenizer('mono_bi_gram', 'ngram', min_gram=1, max_gram=2),
+    'instant_search',
+    tokenizer='standard',
     filter=['lowercase', 'asciifolding'],
     char_filter=[
         char_filter('punctuation', 'pattern_replace', pattern=r'[^\w\s]', replacement='')
@@ -0,0 +1,271 @@
+"""
+Coalescing queue of search index updates.
+
+Saves of indexed model instances are recorded in a Redis hash (keyed by model
+and primary key), so that repeated saves of an instance within the indexing
+window result in a single update. The queue is flushed by a Celery task, which
+fans out updates of related documents and writes every affected document to
+Elasticsearch with one bulk request per chunk of documents.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Model
+from django.utils import timezone
+from django_elasticsearch_dsl.registries import registry
+from django_redis import get_redis_connection
+from elasticsearch.helpers import streaming_bulk
+from elasticsearch_dsl.connections import connections
+
+from apps.search.caching import invalidate_indexes
+from core.utils.sync import apply_async
+
+if TYPE_CHECKING:
+    from django_elasticsearch_dsl import Document
+
+PENDING_KEY = 'search_indexing:pending'
+SCHEDULED_KEY = 'search_indexing:scheduled'
+METRICS_KEY = 'search_indexing:metrics'
+
+# If a scheduled flush is lost (e.g., because a worker died), a new flush is
+# scheduled once the scheduling flag expires after this many indexing windows.
+SCHEDULED_FLAG_WINDOWS = 10
+
+CHUNK_SIZE = 500
+
+# Entries queued within a `batch()` context, by thread
+_batch = threading.local()
+
+
+def get_redis():
+    """Return the Redis connection used for the indexing queue."""
+    return get_redis_connection('default')
+
+
+def get_synced_documents() -> list[type['Document']]:
+    """Return the documents that are updated on saves (i.e., that do not ignore signals)."""
+    return [
+        document
+        for document in registry.get_documents()
+        if not getattr(document.django, 'ignore_signals', False)
+    ]
+
+
+def get_model_documents(model: type[Model]) -> list[type['Document']]:
+    """Return the synced documents indexing instances of the model."""
+    return [document for document in get_synced_documents() if document.django.model is model]
+
+
+def get_related_documents(model: type[Model]) -> list[type['Document']]:
+    """Return the synced documents that include data from instances of the model."""
+    return [
+        document
+        for document in get_synced_documents()
+        if model in (getattr(document.django, 'related_models', None) or [])
+    ]
+
+
+def is_indexed(model: type[Model]) -> bool:
+    """Return whether saving an instance of the model affects any search index."""
+    return bool(get_model_documents(model) or get_related_documents(model))
+
+
+def get_queue_entry(instance: Model) -> str:
+    """Return the queue entry (e.g., "quotes.quote:1") for a model instance."""
+    return f'{instance._meta.label_lower}:{instance.pk}'
+
+
+def enqueue(instance: Model):
+    """
+    Queue an update of the documents affected by a model instance.
+
+    The instance is only queued once (with the time it was first queued) until
+    the queue is flushed. A flush is scheduled at the end of the indexing window,
+    unless one is already scheduled. Within a `batch()` context, the instance is
+    queued when the context exits.
+    """
+    entries = getattr(_batch, 'entries', None)
+    if entries is not None:
+        entries.add(get_queue_entry(instance))
+        return
+    enqueue_entries([get_queue_entry(instance)])
+
+
+def enqueue_entries(entries: Iterable[str]):
+    """Queue updates of the documents affected by the specified queue entries."""
+    from apps.search.tasks import flush_index_queue
+
+    entries = list(entries)
+    if not entries:
+        return
+    redis = get_redis()
+    queued_at = time.time()
+    with redis.pipeline() as pipeline:
+        for entry in entries:
+            pipeline.hsetnx(PENDING_KEY, entry, queued_at)
+        pipeline.execute()
+    window = settings.SEARCH_INDEXING_WINDOW
+    if redis.set(SCHEDULED_KEY, 1, nx=True, ex=window * SCHEDULED_FLAG_WINDOWS):
+        apply_async(flush_index_queue, args=(), countdown=window)
+
+
+@contextmanager
+def batch():
+    """
+    Queue the instances saved within the context in a single batch.
+
+    This is used for bulk writes (e.g., the application of approved changes),
+    so that the queue is written to once rather than once per saved instance.
+    """
+    if getattr(_batch, 'entries', None) is not None:
+        # Nested batches are queued with the outermost batch.
+        yield
+        return
+    _batch.entries = set()
+    try:
+        yield
+    finally:
+        entries, _batch.entries = _batch.entries, None
+        enqueue_entries(entries)
+
+
+def pop_pending() -> dict[str, float]:
+    """Remove and return all queued entries, mapped to the times they were queued."""
+    with get_redis().pipeline() as pipeline:
+        pipeline.hgetall(PENDING_KEY)
+        pipeline.delete(PENDING_KEY)
+        entries, _deleted = pipeline.execute()
+    return {entry.decode(): float(queued_at) for entry, queued_at in entries.items()}
+
+
+def get_pks_by_model(entries: Iterable[str]) -> dict[type[Model], set[str]]:
+    """Return the primary keys of queued instances, grouped by model."""
+    pks_by_model: dict[type[Model], set[str]] = defaultdict(set)
+    for entry in entries:
+        label, pk = entry.rsplit(':', 1)
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            logging.error(f'Ignoring index update of unknown model: {entry}')
+            continue
+        pks_by_model[model].add(pk)
+    return pks_by_model
+
+
+def get_pks_by_document(
+    pks_by_model: dict[type[Model], set[str]]
+) -> dict[type['Document'], set]:
+    """Return the primary keys of the instances to be indexed, grouped by document."""
+    pks_by_document: dict[type['Document'], set] = defaultdict(set)
+    for model, pks in pks_by_model.items():
+        for document in get_model_documents(model):
+            pks_by_document[document] |= pks
+        related_documents = get_related_documents(model)
+        if not related_documents:
+            continue
+        # Fan out updates to the documents of related instances, as sets.
+        for instance in model._default_manager.filter(pk__in=pks):
+            for document in related_documents:
+                related_instances = document().get_instances_from_related(instance)
+                if related_instances is None:
+                    continue
+                if isinstance(related_instances, Model):
+                    related_instances = [related_instances]
+                pks_by_document[document] |= {
+                    str(related_instance.pk) for related_instance in related_instances
+                }
+    return pks_by_document
+
+
+def iter_actions(pks_by_document: dict[type['Document'], set]) -> Iterator[dict]:
+    """Yield bulk index actions for the documents of the specified instances."""
+    for document, pks in pks_by_document.items():
+        document_instance = document()
+        queryset = document_instance.get_queryset().filter(pk__in=pks)
+        for instance in queryset.iterator():
+            yield {
+                '_op_type': 'index',
+                '_index': document._index._name,
+                '_id': document_instance.generate_id(instance),
+                '_source': document_instance.prepare(instance),
+            }
+
+
+def update_indexed_at(pks_by_model: dict[type[Model], set[str]], timestamp):
+    """Record when instances were indexed, for models with an `indexed_at` field."""
+    for model, pks in pks_by_model.items():
+        if any(field.name == 'indexed_at' for field in model._meta.concrete_fields):
+            model._base_manager.filter(pk__in=pks).update(indexed_at=timestamp)
+
+
+def flush() -> dict:
+    """Write the documents affected by all queued instances to Elasticsearch."""
+    redis = get_redis()
+    # Clear the flag first, so that instances queued during the flush schedule another.
+    redis.delete(SCHEDULED_KEY)
+    entries = pop_pending()
+    if not entries:
+        return {}
+    started_at = time.time()
+    pks_by_model = get_pks_by_model(entries)
+    pks_by_document = get_pks_by_document(pks_by_model)
+    indexed_count, errors = 0, []
+    results = streaming_bulk(
+        connections.get_connection(),
+        iter_actions(pks_by_document),
+        chunk_size=CHUNK_SIZE,
+        raise_on_error=False,
+        raise_on_exception=False,
+    )
+    for ok, result in results:
+        if ok:
+            indexed_count += 1
+            continue
+        errors.append(result)
+        # Each result maps the action's type (e.g., "index") to the item's info.
+        item = next(iter(result.values()))
+        logging.error(
+            f'Failed to index {item.get("_index")} document {item.get("_id")}: '
+            f'{item.get("error")}'
+        )
+    update_indexed_at(pks_by_model, timezone.now())
+    invalidate_indexes(document._index._name for document in pks_by_document)
+    finished_at = time.time()
+    metrics = {
+        'last_flushed_at': finished_at,
+        'last_flush_duration': finished_at - started_at,
+        'last_flush_queued': len(entries),
+        'last_flush_indexed': indexed_count,
+        'last_flush_errors': len(errors),
+        # Time between an instance being queued and its documents being indexed
+        'last_flush_max_lag': finished_at - min(entries.values()),
+    }
+    redis.hset(METRICS_KEY, mapping=metrics)
+    logging.info(
+        f'Indexed {indexed_count} documents for {len(entries)} queued instances '
+        f'with {len(errors)} errors.'
+    )
+    return metrics
+
+
+def get_metrics() -> dict:
+    """Return metrics for the indexing queue, e.g., its depth and indexing lag."""
+    redis = get_redis()
+    queued_at = [float(timestamp) for timestamp in redis.hvals(PENDING_KEY)]
+    metrics = {
+        key.decode(): float(value) for key, value in redis.hgetall(METRICS_KEY).items()
+    }
+    return {
+        'queue_depth': len(queued_at),
+        # Time since the oldest queued instance was queued
+        'current_lag': (time.time() - min(queued_at)) if queued_at else 0,
+        'flush_scheduled': bool(redis.exists(SCHEDULED_KEY)),
+        **metrics,
+    }
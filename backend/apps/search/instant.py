@@ -0,0 +1,103 @@
+"""
+Instant (search-as-you-type) search.
+
+Instant search documents index their search fields as `search_as_you_type` fields,
+which are matched with `bool_prefix` queries (so that the last word of the query
+is matched as a prefix). Results of popular prefixes are cached for a short time
+per model and filters, since autocomplete fields repeat the same prefixes (e.g.,
+"r", "ro", "rob") many times per second.
+"""
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.profiling import ELASTICSEARCH, timed
+
+if TYPE_CHECKING:
+    from apps.search.documents.base import InstantSearchDocument
+
+RESULTS_KEY_PREFIX = 'instant_search'
+HITS_KEY_PREFIX = 'instant_search_hits'
+
+# Maximum number of results returned for a query
+RESULTS_SIZE = 10
+
+
+def normalize_query(query: str) -> str:
+    """Return a query in the form in which it is searched and cached."""
+    return ' '.join(query.lower().split())
+
+
+def get_cache_key(
+    document: type['InstantSearchDocument'],
+    query: str,
+    filters: Optional[dict] = None,
+    source_fields: Optional[list[str]] = None,
+) -> str:
+    """Return the cache key of the results of a (normalized) query."""
+    components = {'filters': filters or {}, 'source_fields': source_fields}
+    digest = hashlib.md5(json.dumps(components, sort_keys=True).encode()).hexdigest()
+    return f'{RESULTS_KEY_PREFIX}:{document._index._name}:{digest}:{query}'
+
+
+def record_hit(key: str) -> bool:
+    """Record a search for a prefix; return whether the prefix is hot."""
+    hits_key = f'{HITS_KEY_PREFIX}:{key}'
+    cache.add(hits_key, 0, timeout=settings.INSTANT_SEARCH_CACHE_TIMEOUT)
+    try:
+        hits = cache.incr(hits_key)
+    except ValueError:
+        # The counter expired (or the cache is a dummy cache).
+        return False
+    return hits >= settings.INSTANT_SEARCH_HOT_PREFIX_HITS
+
+
+def search(
+    document: type['InstantSearchDocument'],
+    query: str,
+    filters: Optional[dict] = None,
+    source_fields: Optional[list[str]] = None,
+) -> list[dict]:
+    """Query Elasticsearch for instant search results."""
+    search = document.search()
+    for field, value in (filters or {}).items():
+        search = search.filter('term', **{field: value})
+    search = (
+        search.query(
+            'multi_match',
+            query=query,
+            type='bool_prefix',
+            fields=document.get_query_fields(),
+        )
+        .source(source_fields or document.search_fields)
+        .extra(size=RESULTS_SIZE)
+    )
+    with timed(ELASTICSEARCH):
+        response = search.execute()
+    return [{'id': result.meta.id} | result.to_dict() for result in response]
+
+
+def get_results(
+    document: type['InstantSearchDocument'],
+    query: str,
+    filters: Optional[dict] = None,
+    source_fields: Optional[list[str]] = None,
+) -> list[dict]:
+    """Return the instant search results for a query, from the cache if possible."""
+    query = normalize_query(query)
+    if not query:
+        return []
+    if not settings.INSTANT_SEARCH_CACHE_TIMEOUT:
+        return search(document, query, filters, source_fields)
+    key = get_cache_key(document, query, filters, source_fields)
+    results = cache.get(key)
+    if results is not None:
+        return results
+    results = search(document, query, filters, source_fields)
+    if record_hit(key):
+        cache.set(key, results, timeout=settings.INSTANT_SEARCH_CACHE_TIMEOUT)
+    return results
@@ -0,0 +1,95 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connections
+
+from core import warming
+
+
+def _warm_chunk(chunk: warming.Chunk, force: bool, run_id: str) -> int:
+    """Warm a chunk in a worker process (with its own database connection)."""
+    connections.close_all()
+    return warming.warm_chunk(
+        chunk.model_label, chunk.pks, force=force, run_id=run_id, index=chunk.index
+    )
+
+
+class Command(BaseCommand):
+    """Precompute the cached values (computed fields, citations, images, tags) of modules."""
+
+    help = __doc__
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            'models',
+            nargs='*',
+            help='labels of models to warm (e.g., "quotes.quote"); defaults to all',
+        )
+        parser.add_argument('--chunk-size', type=int, default=warming.DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            '--processes', type=int, default=1, help='number of worker processes'
+        )
+        parser.add_argument(
+            '--force', action='store_true', help='recompute values that are already cached'
+        )
+        parser.add_argument(
+            '--resume',
+            metavar='RUN_ID',
+            help='resume an interrupted run, warming only its pending chunks',
+        )
+        parser.add_argument(
+            '--use-celery',
+            action='store_true',
+            help='queue the chunks as Celery tasks instead of warming them here',
+        )
+
+    def handle(self, *args, **options):
+        force: bool = options['force']
+        if options['use_celery']:
+            from apps.search.tasks import warm_caches
+
+            warm_caches.delay(
+                options['models'],
+                chunk_size=options['chunk_size'],
+                force=force,
+                run_id=options['resume'],
+            )
+            self.stdout.write('Queued cache warming.')
+            return
+        if options['resume']:
+            run_id = options['resume']
+            try:
+                chunks = warming.get_pending_chunks(run_id)
+            except ValueError as error:
+                raise CommandError(error)
+        else:
+            run_id, chunks = warming.start_run(
+                warming.resolve_models(options['models']), chunk_size=options['chunk_size']
+            )
+        self.stdout.write(f'Warming {len(chunks)} chunk(s) in run {run_id}...')
+        if options['processes'] > 1:
+            count = self._warm_in_parallel(chunks, options['processes'], force, run_id)
+        else:
+            count = sum(
+                warming.warm_chunk(
+                    chunk.model_label,
+                    chunk.pks,
+                    force=force,
+                    run_id=run_id,
+                    index=chunk.index,
+                )
+                for chunk in chunks
+            )
+        self.stdout.write(self.style.SUCCESS(f'Warmed {count} instance(s).'))
+
+    def _warm_in_parallel(
+        self, chunks: list[warming.Chunk], processes: int, force: bool, run_id: str
+    ) -> int:
+        # Close inherited connections so that forked workers open their own.
+        connections.close_all()
+        count = 0
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_warm_chunk, chunk, force, run_id) for chunk in chunks]
+            for future in as_completed(futures):
+                count += future.result()
+        return count
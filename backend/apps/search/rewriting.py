@@ -0,0 +1,101 @@
+"""
+Single-pass rewriting of rendered HTML (for highlighting and entity linking).
+
+Rendered HTML is tokenized once into markup (tags, comments, character references,
+and the contents of script/style elements) and text. Query terms are matched
+against text only, with one compiled alternation of all the terms, so that
+markup is never modified and inserted highlights are never highlighted again.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Optional
+
+from django.urls import NoReverseMatch, reverse
+
+from core.fields.html_field import ENTITY_NAME_REGEX
+
+HIGHLIGHT_TEMPLATE = '<span class="highlighted">{}</span>'
+
+MARKUP_PATTERN = (
+    r'<(?P<raw_tag>script|style)\b[\s\S]*?</(?P=raw_tag)\s*>'
+    r'|<!--[\s\S]*?-->'
+    r'|<[^>]*>'
+    r'|&#?\w+;'
+)
+MARKUP_REGEX = re.compile(MARKUP_PATTERN, re.IGNORECASE)
+# Entity names are matched before other markup, so that they can be linked.
+ENTITY_OR_MARKUP_REGEX = re.compile(
+    rf'(?P<entity>{ENTITY_NAME_REGEX})|{MARKUP_PATTERN}', re.IGNORECASE
+)
+
+ENTITY_LINK_TEMPLATE = '<a href="{}{}{}" target="_blank">{}</a>'
+
+# Placeholder key used to resolve the entity detail URL prefix and suffix
+URL_KEY_PLACEHOLDER = '0'
+
+
+@lru_cache(maxsize=128)
+def get_terms_regex(text_to_highlight: str) -> Optional[re.Pattern]:
+    """Return a regex matching any of the (space-delimited) terms to highlight."""
+    terms = set(text_to_highlight.split())
+    if not terms:
+        return None
+    # Longer terms are listed first, so that they take precedence over their prefixes.
+    alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(alternatives, re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def get_entity_url_affixes() -> Optional[tuple[str, str]]:
+    """Return the parts of entity detail URLs that precede and follow the key."""
+    try:
+        url = reverse('entities:detail', args=[URL_KEY_PLACEHOLDER])
+    except NoReverseMatch as error:
+        logging.error(f'Entity names cannot be linked: {error}')
+        return None
+    prefix, suffix = url.rsplit(URL_KEY_PLACEHOLDER, 1)
+    return prefix, suffix
+
+
+def highlight_text(text: str, terms_regex: Optional[re.Pattern]) -> str:
+    """Highlight the terms in a text node."""
+    if not terms_regex or not text:
+        return text
+    return terms_regex.sub(lambda match: HIGHLIGHT_TEMPLATE.format(match.group(0)), text)
+
+
+def rewrite_html(
+    html: str, text_to_highlight: Optional[str] = None, link_entities: bool = False
+) -> str:
+    """
+    Highlight terms in and/or link entity names in HTML, in a single pass.
+
+    Only the first occurrence of each entity is linked.
+    """
+    terms_regex = get_terms_regex(text_to_highlight) if text_to_highlight else None
+    url_affixes = get_entity_url_affixes() if link_entities else None
+    if not terms_regex and not url_affixes:
+        return html
+    token_regex = ENTITY_OR_MARKUP_REGEX if url_affixes else MARKUP_REGEX
+    linked_keys: set[str] = set()
+    components: list[str] = []
+    position = 0
+    for match in token_regex.finditer(html):
+        components.append(highlight_text(html[position : match.start()], terms_regex))
+        position = match.end()
+        if url_affixes and match.group('entity'):
+            # The groups of `ENTITY_NAME_REGEX` follow the `entity` group.
+            key = match.group(2).strip()
+            if key in linked_keys:
+                components.append(rewrite_html(match.group(0), text_to_highlight))
+                continue
+            linked_keys.add(key)
+            entity_name = rewrite_html(match.group(3), text_to_highlight)
+            prefix, suffix = url_affixes
+            components.append(ENTITY_LINK_TEMPLATE.format(prefix, key, suffix, entity_name))
+        else:
+            components.append(match.group(0))
+    components.append(highlight_text(html[position:], terms_regex))
+    return ''.join(components)
@@ -0,0 +1,54 @@
+from typing import Optional, Sequence
+
+from celery import Task
+
+from apps.search import indexing
+from core import warming
+from core.celery import app
+
+
+@app.task(bind=True)
+def warm_cache_chunk(
+    self: Task,
+    model_label: str,
+    pks: list,
+    force: bool = False,
+    run_id: Optional[str] = None,
+    index: Optional[int] = None,
+) -> int:
+    """Compute the cached values of a chunk of model instances."""
+    return warming.warm_chunk(model_label, pks, force=force, run_id=run_id, index=index)
+
+
+@app.task(bind=True)
+def warm_caches(
+    self: Task,
+    model_labels: Optional[Sequence[str]] = None,
+    chunk_size: int = warming.DEFAULT_CHUNK_SIZE,
+    force: bool = False,
+    run_id: Optional[str] = None,
+) -> str:
+    """
+    Precompute the cached values of every instance of the specified models.
+
+    Each chunk of instances is warmed by a separate task, so that chunks are
+    spread across the Celery worker pool. If a run ID is specified, the pending
+    chunks of that (interrupted) run are queued. Return the run's ID.
+    """
+    if run_id:
+        chunks = warming.get_pending_chunks(run_id)
+    else:
+        run_id, chunks = warming.start_run(
+            warming.resolve_models(model_labels), chunk_size=chunk_size
+        )
+    for chunk in chunks:
+        warm_cache_chunk.delay(
+            chunk.model_label, chunk.pks, force=force, run_id=run_id, index=chunk.index
+        )
+    return run_id
+
+
+@app.task(bind=True)
+def flush_index_queue(self: Task) -> dict:
+    """Write the documents affected by queued instances to Elasticsearch in bulk."""
+    return indexing.flush()
@@ -1,13 +1,10 @@
-import logging
 from typing import Optional, Union
 
-import inflect
-from django.template import Library, loader
-from django.utils.html import format_html
+from django.template import Library
 from django.utils.safestring import SafeString
 
-from apps.search.templatetags.highlight import highlight
 from core.models.model import ExtendedModel
+from core.utils.models import get_html_for_view as get_html_for_view_
 
 register = Library()
 
@@ -20,35 +17,11 @@ def get_html_for_view(
 ) -> SafeString:
     """Return the HTML for the specified view of the model instance."""
     if isinstance(model_instance, dict):
-        try:
-            app_name, model_name = model_instance['model'].split('.')
-        except KeyError as e:
-            raise KeyError(f'{e} was not found in {model_instance}')
-    elif isinstance(model_instance, ExtendedModel):
-        model_name = f'{model_instance.__class__.__name__}'.lower()
-        app_name = model_instance.__class__._meta.app_label
-    else:
+        if 'model' not in model_instance:
+            raise KeyError(f"'model' was not found in {model_instance}")
+    elif not isinstance(model_instance, ExtendedModel):
         raise ValueError(
             'When rendering HTML for a serialized model instance, `template_name` '
             'must include the model name; e.g., "image/card" rather than "card"'
         )
-    template_directory_name = app_name
-    template_name = f'{template_directory_name}/_{view_name}.html'
-    context = {
-        model_name: model_instance,
-        'object': model_instance,
-    }
-    logging.debug(f'Rendering {template_name} for {model_instance}...')
-    template = loader.get_template(template_name)
-    try:
-        response = template.render(context)
-    except Exception as err:
-        logging.error(f'ERROR: {type(err)}: {err}')
-        template_directory_name = inflect.engine().plural(model_name)
-        template_name = f'{template_directory_name}/_{view_name}.html'
-        logging.debug(f'Rendering {template_name} for {model_instance}...')
-        template = loader.get_template(template_name)
-        response = template.render(context)
-    if text_to_highlight:
-        response = highlight(response, text_to_highlight=text_to_highlight)
-    return format_html(response)
+    return get_html_for_view_(model_instance, view_name, text_to_highlight=text_to_highlight)
@@ -0,0 +1,192 @@
+"""Tests for the search app."""
+
+from typing import Optional
+
+import pytest
+from django.core.cache import cache
+from elasticsearch_dsl.response import Response
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.quotes.factories import QuoteFactory
+from apps.search import caching, indexing, instant
+from apps.search.api.pagination import (
+    ElasticPageNumberPagination,
+    decode_cursor,
+    encode_cursor,
+)
+from apps.search.api.search import PAYLOAD_FIELD, Search
+from apps.search.api.views import ElasticSearchResultsAPIView
+from apps.search.documents import instant_search_documents_map
+from apps.search.documents.quote import QuoteDocument
+from apps.search.rewriting import rewrite_html
+
+N_RESULTS = 5
+
+
+def get_response_data(search: Search, n_results: int = N_RESULTS) -> dict:
+    """Return a stubbed ElasticSearch response for a page of a search."""
+    hits = [
+        {
+            '_index': QuoteDocument.get_index_name(),
+            '_id': str(position),
+            '_score': 1.0,
+            '_source': {PAYLOAD_FIELD: {'model': 'quotes.quote', 'pk': position}},
+            'sort': [1.0, position],
+        }
+        for position in range(n_results)
+    ]
+    search_data = search.to_dict()
+    search_after: Optional[list] = search_data.get('search_after')
+    start = search_after[1] + 1 if search_after else search_data.get('from', 0)
+    return {
+        'took': 1,
+        'timed_out': False,
+        'hits': {
+            'total': {'value': n_results, 'relation': 'eq'},
+            'max_score': 1.0,
+            'hits': hits[start : start + search_data['size']],
+        },
+    }
+
+
+class StubbedSearch(Search):
+    """Search whose pages are retrieved from a stubbed ElasticSearch response."""
+
+    def paginate(self, *args, **kwargs) -> Search:
+        search = super().paginate(*args, **kwargs)
+        search._response = Response(search, get_response_data(search))
+        return search
+
+
+def get_page(params: dict) -> tuple[list[dict], Optional[str]]:
+    """Return the source-only results and next cursor of a page of stubbed results."""
+    request = Request(APIRequestFactory().get('/', params))
+    view = ElasticSearchResultsAPIView()
+    view.request = request
+    view.source_only = True
+    pagination = ElasticPageNumberPagination()
+    results = pagination.paginate_queryset(StubbedSearch(), request, view=view)
+    return results, pagination.page.next_cursor
+
+
+class TestSearch:
+    """Test the search app."""
+
+    def test_cursor(self):
+        """Test encoding and decoding pagination cursors."""
+        cursor = decode_cursor(encode_cursor([1.0, 'quotes_1'], 20))
+        assert cursor.search_after == [1.0, 'quotes_1']
+        assert cursor.offset == 20
+        assert encode_cursor([], 20) is None
+        assert decode_cursor(None) is None
+        for invalid_cursor in ('invalid', encode_cursor([1.0], 20)[:-4]):
+            with pytest.raises(NotFound):
+                decode_cursor(invalid_cursor)
+
+    def test_search_after_pagination(self):
+        """Test paging through results with `search_after` cursors."""
+        search = Search().paginate(20, 10, search_after=[1.0, 'quotes_1'])
+        search_data = search.to_dict()
+        assert search_data['search_after'] == [1.0, 'quotes_1']
+        assert search_data.get('from', 0) == 0
+        assert search.page_start == 20
+
+        results, cursor = get_page({'page_size': 2})
+        assert [result['pk'] for result in results] == [0, 1]
+        pks = [result['pk'] for result in results]
+        while cursor:
+            # The page is located by the cursor, regardless of the page parameter.
+            results, cursor = get_page({'page_size': 2, 'page': 1, 'cursor': cursor})
+            pks += [result['pk'] for result in results]
+        assert pks == list(range(N_RESULTS))
+
+    def test_source_only_results(self):
+        """Test rendering results from the payloads of ElasticSearch hits."""
+        results, _cursor = get_page({'page_size': N_RESULTS})
+        assert results[0]['model'] == 'quotes.quote'
+        assert results[0]['meta']['sort'] == [1.0, 0]
+
+    def test_response_cache_keys(self):
+        """Test that cached responses are invalidated by writes to their indexes."""
+        indexes = [QuoteDocument.get_index_name()]
+        params = {'query': ['  foo   bar'], 'page': ['1']}
+        key = caching.get_response_cache_key('results', params, indexes)
+        assert key == caching.get_response_cache_key(
+            'results', {'page': '1', 'query': 'foo bar'}, indexes
+        )
+        caching.bump_index_versions(indexes)
+        assert key != caching.get_response_cache_key('results', params, indexes)
+
+    def test_instant_search_cache(self, settings, monkeypatch):
+        """Test caching the instant search results of hot prefixes."""
+        settings.INSTANT_SEARCH_CACHE_TIMEOUT = 30
+        settings.INSTANT_SEARCH_HOT_PREFIX_HITS = 2
+        cache.clear()
+        queries = []
+
+        def search(document, query, *args) -> list[dict]:
+            queries.append(query)
+            return [{'id': '1', 'name': query}]
+
+        monkeypatch.setattr(instant, 'search', search)
+        document = next(iter(instant_search_documents_map.values()))
+        for _ in range(3):
+            assert instant.get_results(document, ' Rob ') == [{'id': '1', 'name': 'rob'}]
+        # The prefix becomes hot (and is cached) on its second search.
+        assert queries == ['rob', 'rob']
+
+    @pytest.mark.django_db()
+    def test_index_queue(self, monkeypatch):
+        """Test coalescing repeated saves into a single bulk write per document."""
+        redis = indexing.get_redis()
+        redis.delete(indexing.PENDING_KEY, indexing.SCHEDULED_KEY)
+        scheduled_flushes, actions, invalidated_indexes = [], [], set()
+
+        def streaming_bulk(client, actions_iterator, **kwargs):
+            for action in actions_iterator:
+                actions.append((action['_index'], str(action['_id'])))
+                yield True, {}
+
+        monkeypatch.setattr(
+            indexing, 'apply_async', lambda *args, **kwargs: scheduled_flushes.append(args)
+        )
+        monkeypatch.setattr(indexing, 'streaming_bulk', streaming_bulk)
+        monkeypatch.setattr(indexing, 'invalidate_indexes', invalidated_indexes.update)
+        quote, other_quote = QuoteFactory.create(), QuoteFactory.create()
+        indexing.enqueue(quote)
+        indexing.enqueue(quote)
+        with indexing.batch():
+            indexing.enqueue(quote)
+            indexing.enqueue(other_quote)
+            # Instances saved within a batch are queued when the batch exits.
+            assert redis.hlen(indexing.PENDING_KEY) == 1
+        assert redis.hlen(indexing.PENDING_KEY) == 2
+        # A single flush is scheduled for the indexing window.
+        assert len(scheduled_flushes) == 1
+
+        metrics = indexing.flush()
+        assert metrics['last_flush_queued'] == 2
+        assert not redis.exists(indexing.PENDING_KEY)
+        # Each affected document is written once, however many times it was queued.
+        assert len(actions) == len(set(actions))
+        quote_index = QuoteDocument.get_index_name()
+        assert {pk for index, pk in actions if index == quote_index} == {
+            str(quote.pk),
+            str(other_quote.pk),
+        }
+        assert quote_index in invalidated_indexes
+        assert indexing.flush() == {}
+
+    def test_rewrite_html(self):
+        """Test highlighting terms and linking entities in a single pass."""
+        html = (
+            '<p class="foo"><span class="entity-name" data-entity-id="1">Foo</span> '
+            'and foo, <span class="entity-name" data-entity-id="1">Foo</span></p>'
+        )
+        rewritten_html = rewrite_html(html, text_to_highlight='foo', link_entities=True)
+        # Markup is never modified.
+        assert rewritten_html.startswith('<p class="foo">')
+        assert rewritten_html.count('<a href=') == 1
+        assert rewritten_html.count('<span class="highlighted">') == 3
@@ -52,7 +52,7 @@ class AbstractSourceAdmin(SearchableModelAdmin):
         AttributeeFilter,
         SourceTypeFilter,
     ]
-    ordering = ['date', 'citation_string']
+    ordering = ['date_position', 'citation_string']
     # https://docs.djangoproject.com/en/dev/ref/contrib/admin/#django.contrib.admin.ModelAdmin.list_per_page
     list_per_page = 10
     readonly_fields = SearchableModelAdmin.readonly_fields + [
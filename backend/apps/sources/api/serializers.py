@@ -65,6 +65,11 @@ class SourceSerializer(WritableNestedModelSerializer, ModuleSerializer):
 
     class Meta(ModuleSerializer.Meta):
         model = Source
+        prefetch_related = ModuleSerializer.Meta.prefetch_related + [
+            'file',
+            'attributions',
+            'source_containments',
+        ]
         fields = ModuleSerializer.Meta.fields + [
             'citation_html',
             'content',
@@ -0,0 +1,80 @@
+from django.db import migrations, models
+
+TIMELINE_FIELDS = ['astronomical_year', 'date_position', 'date_precision']
+
+BATCH_SIZE = 1000
+
+
+def populate_timeline_fields(apps, schema_editor):
+    """Populate the timeline fields from each source's date, as `Source.get_date` does."""
+    source_model = apps.get_model('sources', 'Source')
+    containment_model = apps.get_model('sources', 'SourceContainment')
+    # Undated sources are dated by the container of their first containment.
+    container_dates = {}
+    containments = (
+        containment_model.objects.filter(source__date=None)
+        .order_by('source_id', 'position', 'pk')
+        .values_list('source_id', 'container__date')
+    )
+    for source_id, container_date in containments.iterator():
+        container_dates.setdefault(source_id, container_date)
+    instances = []
+    for instance in source_model.objects.only('pk', 'date').iterator():
+        date = instance.date or container_dates.get(instance.pk)
+        if not date:
+            continue
+        instance.astronomical_year = date.astronomical_year
+        instance.date_position = date.chronological_position
+        instance.date_precision = date.precision
+        instances.append(instance)
+    source_model.objects.bulk_update(instances, TIMELINE_FIELDS, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sources', '0018_merge_20211025_2139'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='astronomical_year',
+            field=models.IntegerField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text='signed year of the date (1 BCE is year 0)',
+                null=True,
+                verbose_name='astronomical year',
+            ),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='date_position',
+            field=models.FloatField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text='position of the date on a continuous scale increasing with time',
+                null=True,
+                verbose_name='date position',
+            ),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='date_precision',
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                choices=[(1, 'year'), (2, 'season'), (3, 'month'), (4, 'day')],
+                editable=False,
+                null=True,
+                verbose_name='date precision',
+            ),
+        ),
+        migrations.AlterModelOptions(
+            name='source',
+            options={'ordering': ['-date_position']},
+        ),
+        migrations.RunPython(populate_timeline_fields, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,13 @@
 """Model class for citations."""
 
 import logging
-from typing import TYPE_CHECKING, Match, Optional, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Match, Optional, Union
 
 import regex
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import prefetch_related_objects
 from django.utils.html import format_html
 from django.utils.module_loading import import_string
 from django.utils.safestring import SafeString
@@ -124,10 +126,38 @@ class AbstractCitation(ModeratedPositionedRelation):
         """Return the citation HTML, escaped."""
         return format_html(self.citation_html)
 
-    # TODO: refactor
     @property  # type: ignore
     def html(self) -> SafeString:
-        """Return the citation's HTML representation."""
+        """
+        Return the citation's HTML representation.
+
+        If the citation was rendered in bulk (see `render_citations`), the
+        pre-rendered HTML is returned without querying the database.
+        """
+        prerendered_html: Optional[SafeString] = getattr(self, '_prerendered_html', None)
+        if prerendered_html is not None:
+            return prerendered_html
+        is_quoted, prior_citation = False, None
+        if self.pk and self.source.attributees.exists():
+            if getattr(self.content_object, 'attributees', None):
+                # Assume the content object is a quote.
+                quote: Quote = self.content_object
+                if quote.ordered_attributees != self.source.ordered_attributees:
+                    is_quoted = True
+                    prior_citation = quote.citations.filter(position__lt=self.position).last()
+        return self.get_html(is_quoted=is_quoted, prior_citation=prior_citation)
+
+    def get_html(
+        self, is_quoted: bool = False, prior_citation: Optional['AbstractCitation'] = None
+    ) -> SafeString:
+        """
+        Compose the citation's HTML representation.
+
+        `is_quoted` specifies whether the content object is a quote attributed to
+        someone other than the source's attributees, in which case the quote is
+        "quoted in" the source (or "also in" the source, if the prior citation
+        already specifies where it is quoted).
+        """
         html = f'{self.source.citation_html}'
         if self.primary_page_number:
             page_string = self.page_number_html or ''
@@ -138,27 +168,22 @@ class AbstractCitation(ModeratedPositionedRelation):
                 html = html.replace(default_page_string, page_string)
             else:
                 html = f'{html}, {page_string}'
-        if self.pk and self.source.attributees.exists():
-            if getattr(self.content_object, 'attributees', None):
-                # Assume the content object is a quote.
+        if is_quoted:
+            source_html = html
+            if prior_citation:
+                if 'quoted in' not in str(prior_citation):
+                    html = f'quoted in {source_html}'
+                else:
+                    html = f'also in {source_html}'
+            else:
                 quote: Quote = self.content_object
-                if quote.ordered_attributees != self.source.ordered_attributees:
-                    source_html = html
-                    if quote.citations.filter(position__lt=self.position).exists():
-                        prior_citations = quote.citations.filter(position__lt=self.position)
-                        prior_citation = prior_citations.last()
-                        if 'quoted in' not in str(prior_citation):
-                            html = f'quoted in {source_html}'
-                        else:
-                            html = f'also in {source_html}'
-                    else:
-                        html = components_to_html(
-                            [
-                                f'{quote.attributee_html or "Unidentified person"}',
-                                f'{quote.date_string}' if quote.date else '',
-                                f'quoted in {source_html}',
-                            ]
-                        )
+                html = components_to_html(
+                    [
+                        f'{quote.attributee_html or "Unidentified person"}',
+                        f'{quote.date_string}' if quote.date else '',
+                        f'quoted in {source_html}',
+                    ]
+                )
         html = f'<span class="citation">{html}</span>'
         return format_html(html)
 
@@ -255,7 +280,12 @@ class AbstractCitation(ModeratedPositionedRelation):
         return compose_link(page_number, href=url, klass='display-source', target='_blank')
 
     @classmethod
-    def get_object_html(cls, match: Match, use_preretrieved_html: bool = False) -> str:
+    def get_object_html(
+        cls,
+        match: Match,
+        use_preretrieved_html: bool = False,
+        model_instance: Optional['AbstractCitation'] = None,
+    ) -> str:
         """Return the object's HTML based on a placeholder in the admin."""
         if not regex.match(citation_placeholder_pattern, match.group(0)):
             raise ValueError(f'{match} does not match {citation_placeholder_pattern}')
@@ -266,7 +296,7 @@ class AbstractCitation(ModeratedPositionedRelation):
                 return str(preretrieved_html).strip()
         key = match.group(PlaceholderGroups.PK).strip()
         try:
-            citation = cls.objects.get(pk=key)
+            citation = model_instance or cls.objects.get(pk=key)
         except ObjectDoesNotExist:
             logging.error(f'Unable to retrieve citation: {key}')
             return ''
@@ -294,12 +324,16 @@ class AbstractCitation(ModeratedPositionedRelation):
         return citation_link
 
     @classmethod
-    def get_updated_placeholder(cls, match: Match) -> str:
+    def get_updated_placeholder(
+        cls, match: Match, model_instance: Optional['AbstractCitation'] = None
+    ) -> str:
         """Return an up-to-date placeholder for a citation included in an HTML field."""
         placeholder = match.group(0)
         appendage = match.group(7)
         updated_appendage = (
-            f'<span class="citation-placeholder">{cls.get_object_html(match)}</span>'
+            '<span class="citation-placeholder">'
+            f'{cls.get_object_html(match, model_instance=model_instance)}'
+            '</span>'
         )
         if appendage:
             updated_placeholder = placeholder.replace(appendage, updated_appendage)
@@ -307,3 +341,68 @@ class AbstractCitation(ModeratedPositionedRelation):
             stem = regex.sub(rf' ?{END_PATTERN}', '', placeholder)  # noqa: WPS360
             updated_placeholder = f'{stem}{updated_appendage} ]]'
         return updated_placeholder
+
+
+def get_attributee_ids(attributions: Iterable[models.Model]) -> list[int]:
+    """Return the IDs of the attributees of (prefetched) attributions, in order."""
+    attributions = sorted(
+        attributions, key=lambda attribution: (attribution.position, attribution.pk)
+    )
+    return [attribution.attributee_id for attribution in attributions]
+
+
+def render_citations(citations: Iterable[AbstractCitation]) -> list[SafeString]:
+    """
+    Render the HTML of citations of one or more content objects, in bulk.
+
+    The citations' sources (with their files and attributions) and content objects
+    (with their attributions) are retrieved with a fixed number of queries, and the
+    citations of each content object are rendered in a single pass, ordered by
+    position. The rendered HTML is also stored on the citations, so that it is
+    returned by their `html` properties (e.g., when they are serialized).
+    """
+    citations = list(citations)
+    citations_by_model: dict[type[AbstractCitation], list[AbstractCitation]] = defaultdict(
+        list
+    )
+    for citation in citations:
+        citations_by_model[citation.__class__].append(citation)
+    citations_by_content_object: dict[tuple, list[AbstractCitation]] = defaultdict(list)
+    for model, model_citations in citations_by_model.items():
+        prefetch_related_objects(
+            model_citations, 'source__file', 'source__attributions', 'content_object'
+        )
+        content_objects = {
+            citation.content_object_id: citation.content_object
+            for citation in model_citations
+        }
+        quotes = [
+            content_object
+            for content_object in content_objects.values()
+            if hasattr(content_object, 'attributees')
+        ]
+        prefetch_related_objects(quotes, 'attributions')
+        for citation in model_citations:
+            citations_by_content_object[(model, citation.content_object_id)].append(citation)
+    for content_object_citations in citations_by_content_object.values():
+        content_object_citations.sort(key=lambda citation: (citation.position, citation.pk))
+        # The prior citation is the last citation at a lower position.
+        prior_citation: Optional[AbstractCitation] = None
+        last_citation: Optional[AbstractCitation] = None
+        for citation in content_object_citations:
+            if last_citation and last_citation.position < citation.position:
+                prior_citation = last_citation
+            is_quoted = False
+            source_attributee_ids = get_attributee_ids(citation.source.attributions.all())
+            if citation.pk and source_attributee_ids:
+                content_object = citation.content_object
+                if hasattr(content_object, 'attributees'):
+                    quote_attributee_ids = get_attributee_ids(
+                        content_object.attributions.all()
+                    )
+                    is_quoted = quote_attributee_ids != source_attributee_ids
+            citation._prerendered_html = citation.get_html(
+                is_quoted=is_quoted, prior_citation=prior_citation
+            )
+            last_citation = citation
+    return [citation.html for citation in citations]
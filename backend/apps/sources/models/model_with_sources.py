@@ -8,12 +8,13 @@ from django.utils.html import format_html
 from django.utils.safestring import SafeString
 from django.utils.translation import ugettext_lazy as _
 
-from apps.sources.models.citation import AbstractCitation
+from apps.sources.models.citation import AbstractCitation, render_citations
 from core.celery import app
 from core.constants.strings import EMPTY_STRING
 from core.fields.custom_m2m_field import CustomManyToManyField
 from core.fields.html_field import HTMLField
 from core.models.model import ExtendedModel
+from core.utils.models import serialize_instances
 from core.utils.sync import delay
 
 
@@ -52,7 +53,7 @@ class ModelWithSources(ExtendedModel):
         citations = self.cache.get('citations', [])
         if citations or not self.sources.exists():
             return citations
-        citations = [citation.serialize() for citation in self.citations.all()]
+        citations = self.serialize_citations()
         delay(
             cache_citations,
             f'{self.__class__._meta.app_label}.{self.__class__.__name__.lower()}',
@@ -61,6 +62,15 @@ class ModelWithSources(ExtendedModel):
         )
         return citations
 
+    def serialize_citations(self) -> list:
+        """Return a list of dictionaries representing the instance's citations."""
+        citations = list(self.citations.all())
+        for citation in citations:
+            # Avoid retrieving the instance again for each citation.
+            citation.content_object = self
+        render_citations(citations)
+        return serialize_instances(citations)
+
     @property
     def citations(self):
         """
@@ -133,5 +143,4 @@ def cache_citations(model: str, instance_id: int, citations: list):
         logging.error(f'{Model} has no cache.')
         return
     model_instance: ModelWithSources = Model.objects.get(pk=instance_id)
-    model_instance.cache['citations'] = citations
-    model_instance.save(wipe_cache=False, moderate=False)
+    model_instance.write_cache(citations=citations)
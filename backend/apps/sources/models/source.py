@@ -8,7 +8,6 @@ from urllib.parse import urlparse
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
-from django.db.models.query import QuerySet
 from django.utils.html import format_html
 from django.utils.safestring import SafeString
 from django.utils.translation import ugettext_lazy as _
@@ -37,6 +36,7 @@ from core.utils.string import fix_comma_positions
 
 if TYPE_CHECKING:
     from apps.entities.models.entity import Entity
+    from apps.sources.models.source_attribution import SourceAttribution
     from apps.sources.models.source_containment import SourceContainment
 
 MAX_CITATION_STRING_LENGTH: int = 500
@@ -244,7 +244,7 @@ class Source(
     tags = TagsField(through=TopicRelation)
 
     class Meta:
-        ordering = ['-date']
+        ordering = ['-date_position']
 
     objects = SourceManager().from_queryset(SourceQuerySet)()
     searchable_fields = ['citation_string', 'tags__name', 'tags__aliases', 'description']
@@ -308,21 +308,21 @@ class Source(
     def get_attributee_html(self) -> str:
         """Return an HTML string representing the source's attributees."""
         # Avoid attempting to access a m2m relationship on a not-yet-saved source.
-        m2m_relation_exists = self.attributees.exists() if not self._state.adding else False
+        attributees = self.ordered_attributees if not self._state.adding else []
+        m2m_relation_exists = bool(attributees)
         if m2m_relation_exists or self.attributee_string:
             if self.attributee_string:
                 # Use attributee_string to generate attributee_html, if possible.
                 attributee_html = self.attributee_string
                 if m2m_relation_exists:
                     logging.debug('Generating attributee HTML from preset string...')
-                    for entity in self.attributees.all().iterator():
+                    for entity in attributees:
                         if entity.name in attributee_html:
                             attributee_html = attributee_html.replace(
                                 entity.name, entity.name_html
                             )
                 return format_html(attributee_html)
             # Generate attributee_html from attributees (m2m relationship).
-            attributees = self.ordered_attributees
             n_attributions = len(attributees)
             if n_attributions:
                 first_attributee = attributees[0]
@@ -358,9 +358,7 @@ class Source(
         if self._state.adding:
             logging.debug('Containments of an unsaved source cannot be accessed.')
             return ''
-        containments: QuerySet['SourceContainment'] = self.source_containments.select_related(
-            'container'
-        ).order_by('position')
+        containments = self.get_containments()
         container_strings: list[str] = []
         same_creator = True
         containment: SourceContainment
@@ -399,9 +397,9 @@ class Source(
             return self.date
         elif not self._state.adding and self.containers.exists():
             try:
-                containment: SourceContainment = (
-                    self.source_containments.first().select_related('container')
-                )
+                containment: SourceContainment = self.source_containments.select_related(
+                    'container'
+                ).first()
                 return containment.container.date
             except (ObjectDoesNotExist, AttributeError):
                 pass
@@ -500,11 +498,36 @@ class Source(
     def ordered_attributees(self) -> list['Entity']:
         """Return an ordered list of the source's attributees."""
         try:
-            attributions = self.attributions.select_related('attributee')
-            return [attribution.attributee for attribution in attributions]
+            return [attribution.attributee for attribution in self.get_attributions()]
         except (AttributeError, ObjectDoesNotExist):
             return []
 
+    def get_attributions(self) -> list['SourceAttribution']:
+        """
+        Return the source's attributions (with their attributees), ordered by position.
+
+        If the attributions were prefetched (see `apps.sources.recomputation`),
+        the database is not queried.
+        """
+        if 'attributions' in getattr(self, '_prefetched_objects_cache', {}):
+            attributions = self.attributions.all()
+        else:
+            attributions = self.attributions.select_related('attributee')
+        return sorted(attributions, key=lambda attribution: attribution.position)
+
+    def get_containments(self) -> list['SourceContainment']:
+        """
+        Return the source's containments (with their containers), ordered by position.
+
+        If the containments were prefetched (see `apps.sources.recomputation`),
+        the database is not queried.
+        """
+        if 'source_containments' in getattr(self, '_prefetched_objects_cache', {}):
+            containments = self.source_containments.all()
+        else:
+            containments = self.source_containments.select_related('container')
+        return sorted(containments, key=lambda containment: containment.position)
+
     def update_calculated_fields(self):
         """
         Update the source's calculated fields (e.g., citation_html).
@@ -531,9 +554,7 @@ class Source(
         # If needed (and possible), use the container's source file.
         if not self.file and not self._state.adding:
             try:
-                containment: SourceContainment = (
-                    self.source_containments.first().select_related('container')
-                )
+                containment: SourceContainment = self.get_containments()[0]
                 self.file = containment.container.file
             except Exception as err:
                 logging.debug(f'Could not set source file from container: {err}')
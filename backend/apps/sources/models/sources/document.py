@@ -61,7 +61,7 @@ class Collection(ModeratedModel, ModelWithCache):
         return soupify(self.html).get_text()
 
     @property  # type: ignore
-    @store(key='html', caster=format_html)
+    @store(key='html', caster=format_html, depends_on=('repository',))
     def html(self) -> SafeString:
         """Return the collection's HTML representation."""
         return format_html(self.__html__())
@@ -104,7 +104,7 @@ class Repository(ModeratedModel, ModelWithCache):
         return soupify(self.html).get_text()
 
     @property  # type: ignore
-    @store(key='html', caster=format_html)
+    @store(key='html', caster=format_html, depends_on=('location',))
     def html(self) -> SafeString:
         """Return the collection's HTML representation."""
         return format_html(self.__html__())
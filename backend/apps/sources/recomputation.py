@@ -0,0 +1,199 @@
+"""
+Coalescing, bulk recomputation of sources' calculated fields.
+
+The calculated fields of a source (e.g., `citation_html`) depend on its attributees
+and containers. When those change, the source's ID is recorded in a Redis set, so
+that repeated changes within the recomputation window result in a single update.
+The set is flushed by a Celery task, which recomputes the fields of the affected
+sources in batches (with their relations prefetched) and writes them with one bulk
+update per batch, bypassing moderation and signals (so the cached values of the
+updated sources are cleared, and their index updates are queued, explicitly).
+"""
+
+import logging
+from typing import TYPE_CHECKING, Iterable
+
+from django.conf import settings
+from django.db.models import Prefetch
+from django_redis import get_redis_connection
+
+from apps.search import indexing
+from core.models.model_with_cache import clear_cache_keys, get_stored_properties
+from core.utils.sync import apply_async
+
+if TYPE_CHECKING:
+    from apps.sources.models import Source
+
+DIRTY_KEY = 'source_recomputation:dirty'
+SCHEDULED_KEY = 'source_recomputation:scheduled'
+
+# If a scheduled flush is lost (e.g., because a worker died), a new flush is
+# scheduled once the scheduling flag expires after this many recomputation windows.
+SCHEDULED_FLAG_WINDOWS = 10
+
+BATCH_SIZE = 200
+
+# Maximum number of rounds of recomputation of the sources contained by
+# recomputed sources (whose containment HTML includes their containers' citations)
+MAX_ROUNDS = 10
+
+CALCULATED_FIELDS = [
+    'attributee_html',
+    'attributee_string',
+    'file',
+    'containment_html',
+    'citation_html',
+    'citation_string',
+]
+
+
+def get_redis():
+    """Return the Redis connection used for the recomputation queue."""
+    return get_redis_connection('default')
+
+
+def mark_dirty(source_ids: Iterable[int]):
+    """
+    Queue recomputation of the calculated fields of the specified sources.
+
+    A flush is scheduled at the end of the recomputation window, unless one is
+    already scheduled.
+    """
+    from apps.sources.tasks import recompute_sources
+
+    source_ids = [source_id for source_id in source_ids if source_id]
+    if not source_ids:
+        return
+    redis = get_redis()
+    redis.sadd(DIRTY_KEY, *source_ids)
+    window = settings.SOURCE_RECOMPUTATION_WINDOW
+    if redis.set(SCHEDULED_KEY, 1, nx=True, ex=window * SCHEDULED_FLAG_WINDOWS):
+        apply_async(recompute_sources, args=(), countdown=window)
+
+
+def mark_attributed_sources_dirty(entity_ids: Iterable[int]):
+    """Queue recomputation of the sources attributed to the specified entities."""
+    from apps.sources.models import SourceAttribution
+
+    mark_dirty(
+        SourceAttribution.objects.filter(attributee_id__in=entity_ids).values_list(
+            'source_id', flat=True
+        )
+    )
+
+
+def mark_contained_sources_dirty(container_ids: Iterable[int]):
+    """Queue recomputation of the sources contained by the specified sources."""
+    mark_dirty(get_contained_source_ids(container_ids))
+
+
+def get_contained_source_ids(container_ids: Iterable[int]) -> set[int]:
+    """Return the IDs of the sources contained by the specified sources."""
+    from apps.sources.models import SourceContainment
+
+    return set(
+        SourceContainment.objects.filter(container_id__in=container_ids).values_list(
+            'source_id', flat=True
+        )
+    )
+
+
+def pop_dirty() -> set[int]:
+    """Remove and return the IDs of all queued sources."""
+    with get_redis().pipeline() as pipeline:
+        pipeline.smembers(DIRTY_KEY)
+        pipeline.delete(DIRTY_KEY)
+        source_ids, _deleted = pipeline.execute()
+    return {int(source_id) for source_id in source_ids}
+
+
+def get_sources(source_ids: Iterable[int]) -> list['Source']:
+    """Return the specified sources, with the relations used by their calculated fields."""
+    from apps.sources.models import Source, SourceAttribution, SourceContainment
+
+    return list(
+        Source.objects.filter(pk__in=source_ids).prefetch_related(
+            'file',
+            Prefetch(
+                'attributions',
+                queryset=SourceAttribution.objects.select_related('attributee'),
+            ),
+            Prefetch(
+                'source_containments',
+                queryset=SourceContainment.objects.select_related(
+                    'container', 'container__file'
+                ),
+            ),
+        )
+    )
+
+
+def recompute(source_ids: Iterable[int]) -> set[int]:
+    """
+    Recompute and write the calculated fields of the specified sources, in batches.
+
+    Return the IDs of the sources whose citation HTML changed.
+    """
+    from apps.sources.models import Source
+
+    source_ids = sorted(source_ids)
+    changed_citation_ids: set[int] = set()
+    for index in range(0, len(source_ids), BATCH_SIZE):
+        sources = get_sources(source_ids[index : index + BATCH_SIZE])
+        updated_sources = []
+        for source in sources:
+            values = [getattr(source, field) for field in CALCULATED_FIELDS]
+            citation_html = source.citation_html
+            try:
+                source.update_calculated_fields()
+            except Exception as error:
+                logging.error(f'Failed to recompute fields of source {source.pk}: {error}')
+                continue
+            if [getattr(source, field) for field in CALCULATED_FIELDS] != values:
+                updated_sources.append(source)
+            if source.citation_html != citation_html:
+                changed_citation_ids.add(source.pk)
+        if not updated_sources:
+            continue
+        with indexing.batch():
+            Source._base_manager.bulk_update(updated_sources, CALCULATED_FIELDS)
+            # Values computed from the previous calculated fields are cleared (and the
+            # sources' content versions are incremented); index updates are queued,
+            # since signals are bypassed.
+            cache_keys = {
+                stored_property.cache_key
+                for model in {source.__class__ for source in updated_sources}
+                for stored_property in get_stored_properties(model)
+            }
+            clear_cache_keys(
+                Source._base_manager.filter(pk__in=[source.pk for source in updated_sources]),
+                cache_keys,
+            )
+            for source in updated_sources:
+                indexing.enqueue(source)
+    return changed_citation_ids
+
+
+def flush() -> int:
+    """
+    Recompute the calculated fields of all queued sources.
+
+    Sources contained by sources whose citation HTML changed are recomputed as
+    well. Return the number of sources recomputed.
+    """
+    redis = get_redis()
+    # Clear the flag first, so that sources queued during the flush schedule another.
+    redis.delete(SCHEDULED_KEY)
+    source_ids = pop_dirty()
+    recomputed_ids: set[int] = set()
+    for _round in range(MAX_ROUNDS):
+        if not source_ids:
+            break
+        changed_citation_ids = recompute(source_ids)
+        recomputed_ids |= source_ids
+        source_ids = get_contained_source_ids(changed_citation_ids)
+    else:
+        if source_ids:
+            logging.error(f'Source containments are too deeply nested: {source_ids}')
+    logging.info(f'Recomputed calculated fields of {len(recomputed_ids)} sources.')
+    return len(recomputed_ids)
@@ -1,60 +1,69 @@
 """
 Responders to Django signals for the sources app.
 
-The choice of using post_save and pre_delete receivers on intermediate models for
+The choice of using post_save and post_delete receivers on intermediate models for
 m2m relationships, as opposed to simply using receivers for the m2m_changed signal,
 is due to limitations of inline model admins. See:
 https://github.com/django/django/commit/9d104a21e20f9c5ec41d19fd919d0e808aa13dba
 """
 
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from typing import Union
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from apps.entities.models import Entity
 from apps.moderation.signals import process_relation_changes
-from apps.sources import models
-from apps.sources.tasks import update_source
-
-
-def process_post_save(source: models.Source):
-    """Respond to the saving of a source m2m relationship."""
-    source.update_calculated_fields()
-    source.save(moderate=False)  # TODO: is this OK?
-
-
-def process_pre_delete(source: models.Source):
-    """Respond to the deletion of a source m2m relationship."""
-    # TODO: Make this safer and better.
-    # Queue up a task to update the source after waiting 20 seconds (for the
-    # deletion of the containment to be complete, presumably).
-    update_source.apply_async(args=[source.pk], countdown=20)
+from apps.sources import models, recomputation
 
 
 @receiver(post_save, sender=models.SourceAttribution)
-def respond_to_source_attribution_save(sender, instance: models.SourceAttribution, **kwargs):
-    """Respond to creation/modification of a source-attributee relationship."""
-    process_post_save(instance.source)
-
-
-@receiver(pre_delete, sender=models.SourceAttribution)
-def respond_to_source_attribution_deletion(
-    sender, instance: models.SourceAttribution, **kwargs
-):
-    """Respond to deletion of a source-attributee relationship."""
-    process_pre_delete(instance.source)
-
-
+@receiver(post_delete, sender=models.SourceAttribution)
 @receiver(post_save, sender=models.SourceContainment)
-def respond_to_source_containment_save(sender, instance: models.SourceContainment, **kwargs):
-    """Respond to creation/modification of a source-container relationship."""
-    process_post_save(instance.source)
-
-
-@receiver(pre_delete, sender=models.SourceContainment)
-def respond_to_source_containment_deletion(
-    sender, instance: models.SourceContainment, **kwargs
+@receiver(post_delete, sender=models.SourceContainment)
+def respond_to_source_relation_change(
+    sender, instance: Union[models.SourceAttribution, models.SourceContainment], **kwargs
 ):
-    """Respond to deletion of a source-container relationship."""
-    process_pre_delete(instance.source)
+    """Respond to creation/modification/deletion of a source attribution or containment."""
+    # The source's calculated fields are recomputed in bulk (see `apps.sources.recomputation`).
+    recomputation.mark_dirty([instance.source_id])
+
+
+# Fields of entities that are included in the calculated fields of attributed sources
+ATTRIBUTEE_FIELDS = ('name', 'aliases')
+
+
+@receiver(pre_save)
+def record_original_attributee_fields(sender, instance, **kwargs):
+    """Record the values (in the db) of the entity fields used by attributed sources."""
+    if isinstance(instance, Entity):
+        instance._original_attributee_values = None
+        if not instance._state.adding:
+            instance._original_attributee_values = (
+                sender._base_manager.filter(pk=instance.pk)
+                .values_list(*ATTRIBUTEE_FIELDS)
+                .first()
+            )
+
+
+@receiver(post_save)
+def respond_to_source_or_entity_save(sender, instance, created: bool = False, **kwargs):
+    """Respond to the saving of a source or entity."""
+    if isinstance(instance, models.Source):
+        # The containment HTML of contained sources includes the source's citation HTML.
+        recomputation.mark_contained_sources_dirty([instance.pk])
+    elif isinstance(instance, Entity) and not created:
+        # The attributee HTML of attributed sources includes the entity's name
+        # (or aliases), so they are only recomputed if those have changed.
+        # If the original values were not recorded (e.g., because the entity was
+        # saved without sending `pre_save`), the sources are recomputed regardless.
+        if not hasattr(instance, '_original_attributee_values'):
+            recomputation.mark_attributed_sources_dirty([instance.pk])
+            return
+        original_values = instance._original_attributee_values
+        values = tuple(getattr(instance, field) for field in ATTRIBUTEE_FIELDS)
+        if original_values is not None and tuple(original_values) != values:
+            recomputation.mark_attributed_sources_dirty([instance.pk])
 
 
 @receiver(m2m_changed, sender=models.SourceContainment)
@@ -1,10 +1,8 @@
-from apps.sources.models.source import Source
+from apps.sources import recomputation
 from core.celery import app
 
 
 @app.task
-def update_source(pk: int):
-    """Asynchronously update a source's calculated fields."""
-    source: Source = Source.objects.get(pk=pk)
-    source.update_calculated_fields()
-    source.save()
+def recompute_sources() -> int:
+    """Recompute the calculated fields of queued sources in bulk."""
+    return recomputation.flush()
@@ -1,7 +1,18 @@
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APIClient
 
+from apps.entities.factories import EntityFactory
+from apps.entities.models import Entity
+from apps.moderation.tasks import handle_approval
+from apps.search import indexing
+from apps.sources import recomputation
+from apps.sources.factories import SourceFactory
+from apps.sources.models import Source
+from apps.users.factories import UserFactory
+from core.utils.models import get_fragment_cache_key, get_html_for_view, get_html_for_views
+
 
 @pytest.mark.django_db()
 class TestSources:
@@ -13,3 +24,67 @@ class TestSources:
         url = reverse('sources_api:source-list')
         response = api_client.get(url)
         assert response.status_code == 200
+
+    def test_recomputation(self, monkeypatch):
+        """Test recomputing the calculated fields of sources in bulk."""
+        queued_entries = []
+        monkeypatch.setattr(indexing, 'enqueue_entries', queued_entries.extend)
+        source = Source.objects.get(pk=SourceFactory.create().pk)
+        citation_html = source.citation_html
+        assert citation_html
+        Source._base_manager.filter(pk=source.pk).update(citation_html='')
+        assert recomputation.recompute([source.pk]) == {source.pk}
+        recomputed_source = Source.objects.get(pk=source.pk)
+        assert recomputed_source.citation_html == citation_html
+        # The source's cached values (e.g., rendered HTML) are invalidated,
+        # and its index update is queued.
+        assert recomputed_source.content_version == source.content_version + 1
+        assert queued_entries == [indexing.get_queue_entry(source)]
+        # Sources whose fields are unchanged are not updated.
+        assert not recomputation.recompute([source.pk])
+        assert len(queued_entries) == 1
+
+    def test_attributee_changes(self, monkeypatch):
+        """Test that attributed sources are only recomputed when attributees are renamed."""
+        marked_entity_ids = []
+        monkeypatch.setattr(
+            recomputation, 'mark_attributed_sources_dirty', marked_entity_ids.extend
+        )
+        entity = EntityFactory.create()
+        entity.description = 'updated description'
+        entity.save(moderate=False)
+        assert not marked_entity_ids
+        entity.aliases = [*entity.aliases, 'new alias']
+        entity.save(moderate=False)
+        assert marked_entity_ids == [entity.pk]
+
+        # Renames applied by approving changes are also detected.
+        marked_entity_ids.clear()
+        entity = Entity.objects.get(pk=entity.pk)
+        entity.name = 'new name'
+        change = entity.save_change(contributor=UserFactory.create())
+        for _ in range(change.n_required_approvals):
+            approval = change.approve(moderator=UserFactory.create())
+            handle_approval(approval.pk)
+        assert Entity.objects.get(pk=entity.pk).name == 'new name'
+        assert marked_entity_ids == [entity.pk]
+
+    def test_fragment_cache(self):
+        """Test caching the rendered card HTML of sources by content version."""
+        source = Source.objects.get(pk=SourceFactory.create().pk)
+        cache.clear()
+        key = get_fragment_cache_key(source, 'card')
+        assert key
+        html = get_html_for_views([source], 'card')[0]
+        assert cache.get(key) == html
+        assert get_html_for_view(source, 'card') == html
+        # Saving the source changes its content version (and hence its key).
+        content_version = source.content_version
+        source.save(moderate=False)
+        assert source.content_version == content_version + 1
+        assert get_fragment_cache_key(source, 'card') != key
+        # Versions are incremented in the db, even when saved from stale instances.
+        stale_source = Source.objects.get(pk=source.pk)
+        source.save(moderate=False)
+        stale_source.save(moderate=False)
+        assert stale_source.content_version == content_version + 3
@@ -1,6 +1,7 @@
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.search import instant
 from apps.search.documents import TopicInstantSearchDocument
 from apps.topics.api.serializers import TopicSerializer
 from apps.topics.models.topic import Topic
@@ -25,9 +26,6 @@ class TopicInstantSearchAPIView(APIView):
         query = request.query_params.get('query', '')
         if len(query) == 0:
             return Response([])
-        results = (
-            TopicInstantSearchDocument.search()
-            .query('multi_match', query=query)
-            .source(['name'])
+        return Response(
+            instant.get_results(TopicInstantSearchDocument, query, source_fields=['name'])
         )
-        return Response([{'id': result.meta.id} | result.to_dict() for result in results])
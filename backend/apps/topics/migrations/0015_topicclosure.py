@@ -0,0 +1,67 @@
+# Generated by Django 3.2.7 on 2026-10-18 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+POPULATE_CLOSURE_SQL = '''
+WITH RECURSIVE traverse(ancestor_id, descendant_id, depth) AS (
+    SELECT edge.parent_id, edge.child_id, 1
+        FROM topics_topicedge AS edge
+        WHERE edge.deleted IS NULL
+UNION
+    SELECT traverse.ancestor_id, edge.child_id, traverse.depth + 1
+        FROM traverse
+        INNER JOIN topics_topicedge AS edge
+        ON edge.parent_id = traverse.descendant_id
+        WHERE edge.deleted IS NULL
+)
+INSERT INTO topics_topicclosure (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM traverse
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('topics', '0014_auto_20210912_2142'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopicClosure',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('depth', models.PositiveIntegerField()),
+                (
+                    'ancestor',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='descendant_paths',
+                        to='topics.topic',
+                    ),
+                ),
+                (
+                    'descendant',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='ancestor_paths',
+                        to='topics.topic',
+                    ),
+                ),
+            ],
+            options={
+                'abstract': False,
+                'unique_together': {('ancestor', 'descendant', 'depth')},
+                'index_together': {('descendant', 'ancestor')},
+            },
+        ),
+        migrations.RunSQL(POPULATE_CLOSURE_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -1 +1 @@
-from .topic import Topic, TopicEdge, TopicRelation
+from .topic import Topic, TopicClosure, TopicEdge, TopicRelation
@@ -95,7 +95,7 @@ class TaggableModel(models.Model):
         tags = cache.get('tags', [])
         if tags or not self.tags.exists():
             return tags
-        tags = [relation.topic.serialize() for relation in self.topic_relations.all()]
+        tags = self.serialize_tags()
         delay(
             cache_tags,
             f'{self.__class__._meta.app_label}.{self.__class__.__name__.lower()}',
@@ -104,6 +104,10 @@ class TaggableModel(models.Model):
         )
         return tags
 
+    def serialize_tags(self) -> list:
+        """Return a list of dictionaries representing the instance's tags."""
+        return [relation.topic.serialize() for relation in self.topic_relations.all()]
+
     @property  # type: ignore
     def tag_keys(self) -> Optional[list[str]]:
         """Return a list of tag keys (e.g., ['race', 'religion'])."""
@@ -138,6 +142,4 @@ def cache_tags(model: str, instance_id: int, tags: list):
         logging.error(f'{Model} has no cache.')
         return
     model_instance: 'ModelWithCache' = Model.objects.get(pk=instance_id)
-    model_instance.cache['tags'] = tags
-    model_instance.save(wipe_cache=False, moderate=False)
-    model_instance.refresh_from_db()
+    model_instance.write_cache(tags=tags)
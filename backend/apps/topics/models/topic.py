@@ -7,7 +7,7 @@ from django.db.models import CASCADE, ForeignKey, ManyToManyField
 from django.utils.translation import ugettext_lazy as _
 from rest_framework.serializers import Serializer
 
-from apps.topologies.models import edge_factory, node_factory
+from apps.topologies.models import closure_factory, edge_factory, node_factory
 from core.fields.array_field import ArrayField
 from core.fields.html_field import HTMLField
 from core.models.model_with_cache import store
@@ -52,7 +52,14 @@ class TopicRelation(ModeratedRelation):
         return f'{self.topic} ~ {self.related_topic}'
 
 
-Node: type['BaseNode'] = node_factory(edge_model=TopicEdge)
+Closure = closure_factory(node_model='topics.Topic')
+
+
+class TopicClosure(Closure):
+    """A path from an ancestor topic to a descendant topic."""
+
+
+Node: type['BaseNode'] = node_factory(edge_model=TopicEdge, closure_model=TopicClosure)
 
 
 class Topic(Node, Module):
@@ -107,7 +114,7 @@ class Topic(Node, Module):
         Module.post_save(self)
 
     @property  # type: ignore
-    @store(key='related_topics_string')
+    @store(key='related_topics_string', depends_on=('related_topics',))
     def tags_string(self) -> str:
         """Return a list of the topic's related topics as a string."""
         return TOPIC_STRING_DELIMITER.join(
@@ -1,6 +1,8 @@
 import pytest
 
-from apps.topics.models.topic import Topic
+from apps.moderation.tasks import handle_approval
+from apps.topics.models.topic import Topic, TopicClosure, TopicEdge
+from apps.users.factories import UserFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -85,6 +87,99 @@ def test_descendants():
     ]
 
 
+def test_closure():
+    """Test that the closure table is maintained as edges are added and removed."""
+    top = create_topic(name='Top')
+    science = create_topic(name='Science')
+    science.add_parent(top)
+    biology = create_topic(name='Biology')
+    biology.add_parent(science)
+    genetics = create_topic(name='Genetics')
+    genetics.add_parent(biology)
+    # Add a second (shorter) path from Top to Genetics.
+    genetics.add_parent(top)
+    assert genetics.ancestor_ids == [top.id, science.id, biology.id]
+    assert top.descendant_ids == [science.id, biology.id, genetics.id]
+    assert top.is_ancestor_of(genetics)
+    assert not genetics.is_ancestor_of(top)
+
+    science.remove_parent(top)
+    assert top.descendant_ids == [genetics.id]
+    assert genetics.ancestor_ids == [science.id, top.id, biology.id]
+    assert list(biology.ancestor_ids) == [science.id]
+
+    TopicClosure.rebuild(TopicEdge)
+    assert top.descendant_ids == [genetics.id]
+    assert genetics.ancestor_ids == [science.id, top.id, biology.id]
+
+
+def test_closure_after_edge_update():
+    """Test that the closure table is updated when an edge's endpoints are changed."""
+    top = create_topic(name='Top')
+    science = create_topic(name='Science')
+    science.add_parent(top)
+    biology = create_topic(name='Biology')
+    biology.add_parent(science)
+    genetics = create_topic(name='Genetics')
+    genetics.add_parent(biology)
+    sport = create_topic(name='Sport')
+
+    # Move Biology (and its descendants) from Science to Sport.
+    edge = TopicEdge.objects.get(parent=science, child=biology)
+    edge.parent = sport
+    edge.save(moderate=False)
+    assert genetics.ancestor_ids == [sport.id, biology.id]
+    assert top.descendant_ids == [science.id]
+    assert sport.descendant_ids == [biology.id, genetics.id]
+    assert not science.is_ancestor_of(genetics)
+
+    closure = set(TopicClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+    TopicClosure.rebuild(TopicEdge)
+    assert closure == set(
+        TopicClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth')
+    )
+
+
+def test_closure_after_moderated_edge_deletion():
+    """Test that the closure table is updated when an edge's deletion is approved."""
+    top = create_topic(name='Top')
+    science = create_topic(name='Science')
+    science.add_parent(top)
+    biology = create_topic(name='Biology')
+    biology.add_parent(science)
+    genetics = create_topic(name='Genetics')
+    genetics.add_parent(biology)
+
+    edge = TopicEdge.objects.get(parent=science, child=biology)
+    edge.delete(contributor=UserFactory.create())
+    change = edge.change_in_progress
+    # The closure table is unaffected until the deletion is approved.
+    assert top.descendant_ids == [science.id, biology.id, genetics.id]
+    for _ in range(change.n_required_approvals):
+        approval = change.approve(moderator=UserFactory.create())
+        handle_approval(approval.pk)
+    edge.refresh_from_db()
+    assert edge.deleted
+    assert top.descendant_ids == [science.id]
+    assert genetics.ancestor_ids == [biology.id]
+
+    closure = set(TopicClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth'))
+    TopicClosure.rebuild(TopicEdge)
+    assert closure == set(
+        TopicClosure.objects.values_list('ancestor_id', 'descendant_id', 'depth')
+    )
+
+
+def test_in_order_of():
+    """Test retrieving topics in the order of a list of ids."""
+    foo, bar, baz = (create_topic(name=name) for name in ('Foo', 'Bar', 'Baz'))
+    ids = [baz.id, foo.id, bar.id]
+    assert list(Topic.objects.in_order_of(ids)) == [baz, foo, bar]
+    assert list(Topic.objects.exclude(pk=foo.pk).in_order_of(ids)) == [baz, bar]
+    assert list(Topic.objects.in_order_of([str(bar.id), str(baz.id)])) == [bar, baz]
+    assert not Topic.objects.in_order_of([]).exists()
+
+
 # def test_ancestors():
 #     """Test accessing a topic's ancestors."""
 #     top = create_topic(name='Top')
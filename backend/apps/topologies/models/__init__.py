@@ -1,2 +1,2 @@
-from .dag import edge_factory, node_factory
+from .dag import closure_factory, edge_factory, node_factory
 from .tree import TreeModel
@@ -7,6 +7,11 @@ The graph traversal queries use Postgresql's recursive CTEs to fetch an entire t
 of related node ids in a single query. These queries also topologically sort the ids
 by generation.
 
+Optionally, a node model can be given a closure table (see `closure_factory`),
+which holds a row for each (ancestor, descendant, depth) path in the graph.
+The closure table is maintained incrementally as edges are added, changed and
+removed, so that traversals and cycle checks become single indexed lookups.
+
 Inspired by:
 https://www.fusionbox.com/blog/detail/graph-algorithms-in-a-database-recursive-ctes-and-topological-sort-with-postgres/620/
 https://github.com/elpaso/django-dag
@@ -18,10 +23,12 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from django.core.exceptions import ValidationError
 from django.db import connection, models
-from django.db.models import Case, When
+from django.db.models import Max
 from django.db.models.base import Model
+from django.db.models.signals import post_delete, post_save
 
 from core.models.abstract import AbstractModel
+from core.models.manager import filter_in_order
 from core.models.model import ExtendedModel
 from core.models.relations.relation import Relation
 
@@ -66,17 +73,90 @@ ORDER BY MAX(depth), id ASC
 '''
 
 
+# Add the paths created by an edge: each of the parent's ancestors (and the parent)
+# becomes an ancestor of each of the child's descendants (and the child).
+CLOSURE_INSERT_QUERY = '''
+INSERT INTO {closure_table} (ancestor_id, descendant_id, depth)
+SELECT ancestors.id, descendants.id, ancestors.depth + descendants.depth + 1
+    FROM (
+        SELECT ancestor_id AS id, depth FROM {closure_table}
+        WHERE descendant_id = %(parent_id)s
+        UNION ALL SELECT %(parent_id)s, 0
+    ) AS ancestors
+    CROSS JOIN (
+        SELECT descendant_id AS id, depth FROM {closure_table}
+        WHERE ancestor_id = %(child_id)s
+        UNION ALL SELECT %(child_id)s, 0
+    ) AS descendants
+ON CONFLICT DO NOTHING
+'''
+
+# Remove the paths (from the specified ancestors to the specified descendants)
+# that might have passed through a removed edge.
+CLOSURE_DELETE_QUERY = '''
+DELETE FROM {closure_table}
+WHERE ancestor_id = ANY(%(ancestor_ids)s) AND descendant_id = ANY(%(descendant_ids)s)
+'''
+
+# Restore the paths from the specified ancestors to the specified descendants,
+# based on the remaining edges: paths starting with an edge from an ancestor (or
+# with a path from an ancestor to a node outside the descendants) are extended
+# through the edges between the descendants.
+CLOSURE_RESTORE_QUERY = '''
+INSERT INTO {closure_table} (ancestor_id, descendant_id, depth)
+WITH RECURSIVE traverse(ancestor_id, descendant_id, depth) AS (
+    SELECT * FROM (
+        SELECT edge.parent_id, edge.child_id, 1
+            FROM {relationship_table} AS edge
+            WHERE edge.parent_id = ANY(%(ancestor_ids)s)
+            AND edge.child_id = ANY(%(descendant_ids)s){edge_condition}
+        UNION
+        SELECT closure.ancestor_id, edge.child_id, closure.depth + 1
+            FROM {relationship_table} AS edge
+            INNER JOIN {closure_table} AS closure
+            ON closure.descendant_id = edge.parent_id
+            WHERE closure.ancestor_id = ANY(%(ancestor_ids)s)
+            AND edge.child_id = ANY(%(descendant_ids)s){edge_condition}
+    ) AS seed
+UNION
+    SELECT traverse.ancestor_id, edge.child_id, traverse.depth + 1
+        FROM traverse
+        INNER JOIN {relationship_table} AS edge
+        ON edge.parent_id = traverse.descendant_id
+        WHERE edge.child_id = ANY(%(descendant_ids)s){edge_condition}
+)
+SELECT ancestor_id, descendant_id, depth FROM traverse
+ON CONFLICT DO NOTHING
+'''
+
+# Condition excluding soft-deleted edges (of soft-deletable edge models)
+SOFT_DELETED_EDGE_CONDITION = ' AND edge.deleted IS NULL'
+
+# Rebuild the entire closure table from the edges.
+CLOSURE_REBUILD_QUERY = '''
+DELETE FROM {closure_table};
+WITH RECURSIVE traverse(ancestor_id, descendant_id, depth) AS (
+    SELECT edge.parent_id, edge.child_id, 1
+        FROM {relationship_table} AS edge
+        WHERE TRUE{edge_condition}
+UNION
+    SELECT traverse.ancestor_id, edge.child_id, traverse.depth + 1
+        FROM traverse
+        INNER JOIN {relationship_table} AS edge
+        ON edge.parent_id = traverse.descendant_id
+        WHERE TRUE{edge_condition}
+)
+INSERT INTO {closure_table} (ancestor_id, descendant_id, depth)
+SELECT ancestor_id, descendant_id, depth FROM traverse
+'''
+
+
 def filter_order(queryset, field_names, values):
     """Filter queryset where field_name in values, order results in the same order as values."""
     if not isinstance(field_names, list):
         field_names = [field_names]
-    case = []
-    for pos, value in enumerate(values):
-        when_condition = {field_names[0]: value, 'then': pos}
-        case.append(When(**when_condition))
-    order_by = Case(*case)
-    filter_condition = {field_name + '__in': values for field_name in field_names}
-    return queryset.filter(**filter_condition).order_by(order_by)
+    filter_condition = {field_name + '__in': values for field_name in field_names[1:]}
+    return filter_in_order(queryset.filter(**filter_condition), values, field_names[0])
 
 
 class Node(AbstractModel, ExtendedModel):
@@ -88,6 +168,7 @@ class Node(AbstractModel, ExtendedModel):
     """
 
     edge_model: type[ExtendedModel]
+    closure_model: Optional[type['Closure']] = None
     parents: 'QuerySet[Node]'
 
     class Meta:
@@ -122,6 +203,14 @@ class Node(AbstractModel, ExtendedModel):
     @property
     def ancestor_ids(self) -> list[int]:
         """Return a list of the ids of the node's ancestors."""
+        if self.closure_model:
+            return list(
+                self.closure_model.objects.filter(descendant_id=self.id)
+                .values('ancestor_id')
+                .annotate(max_depth=Max('depth'))
+                .order_by('-max_depth', 'ancestor_id')
+                .values_list('ancestor_id', flat=True)
+            )
         with connection.cursor() as cursor:
             cursor.execute(
                 ANCESTOR_QUERY.format(relationship_table=self.edge_model_table),
@@ -151,6 +240,15 @@ class Node(AbstractModel, ExtendedModel):
 
     @property
     def descendant_ids(self):
+        """Return a list of the ids of the node's descendants, by generation."""
+        if self.closure_model:
+            return list(
+                self.closure_model.objects.filter(ancestor_id=self.id)
+                .values('descendant_id')
+                .annotate(max_depth=Max('depth'))
+                .order_by('max_depth', 'descendant_id')
+                .values_list('descendant_id', flat=True)
+            )
         with connection.cursor() as cursor:
             cursor.execute(
                 DESCENDANT_QUERY.format(relationship_table=self.edge_model_table),
@@ -186,44 +284,147 @@ class Node(AbstractModel, ExtendedModel):
     def clan(self):
         return self.filter_order_ids(self.clan_ids)
 
+    def is_ancestor_of(self, node: 'Node') -> bool:
+        """Return whether the node is an ancestor of another node."""
+        if self.closure_model:
+            return self.closure_model.objects.filter(
+                ancestor_id=self.id, descendant_id=node.id
+            ).exists()
+        return self.id in node.ancestor_ids
+
+
+def is_soft_deletable(edge_model: type[Model]) -> bool:
+    """Return whether edges of a model can be soft-deleted."""
+    return any(field.name == 'deleted' for field in edge_model._meta.concrete_fields)
+
+
+def get_edge_condition(edge_model: type[Model]) -> str:
+    """Return the SQL condition for edges to be included in a closure table."""
+    return SOFT_DELETED_EDGE_CONDITION if is_soft_deletable(edge_model) else ''
+
+
+class Closure(AbstractModel):
+    """
+    A path from an ancestor to a descendant in a directed acyclic graph.
+
+    A row exists for each distinct depth (i.e., path length) at which the
+    descendant can be reached from the ancestor. Rather than inheriting
+    directly from this abstract model, use `closure_factory`.
+    """
+
+    depth = models.PositiveIntegerField()
+
+    @property
+    @abstractmethod
+    def ancestor(self) -> models.ForeignKey:
+        """Require `ancestor` to be implemented, as by `closure_factory`."""
+
+    @property
+    @abstractmethod
+    def descendant(self) -> models.ForeignKey:
+        """Require `descendant` to be implemented, as by `closure_factory`."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def add_edge(cls, edge: 'Edge'):
+        """Add the paths created by an edge."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                CLOSURE_INSERT_QUERY.format(closure_table=cls._meta.db_table),
+                {'parent_id': edge.parent_id, 'child_id': edge.child_id},
+            )
+
+    @classmethod
+    def remove_edge(cls, edge: 'Edge'):
+        """Remove the paths that passed (only) through a removed (or soft-deleted) edge."""
+        parent_id, child_id = edge.parent_id, edge.child_id
+        ancestor_ids = [
+            parent_id,
+            *cls.objects.filter(descendant_id=parent_id).values_list(
+                'ancestor_id', flat=True
+            ),
+        ]
+        descendant_ids = [
+            child_id,
+            *cls.objects.filter(ancestor_id=child_id)
+            .values_list('descendant_id', flat=True)
+            .distinct(),
+        ]
+        tables = {
+            'closure_table': cls._meta.db_table,
+            'relationship_table': edge._meta.db_table,
+            'edge_condition': get_edge_condition(type(edge)),
+        }
+        params = {'ancestor_ids': ancestor_ids, 'descendant_ids': descendant_ids}
+        with connection.cursor() as cursor:
+            cursor.execute(CLOSURE_DELETE_QUERY.format(**tables), params)
+            cursor.execute(CLOSURE_RESTORE_QUERY.format(**tables), params)
+
+    @classmethod
+    def rebuild(cls, edge_model: type['Edge']):
+        """Rebuild the closure table from the edges of the graph."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                CLOSURE_REBUILD_QUERY.format(
+                    closure_table=cls._meta.db_table,
+                    relationship_table=edge_model._meta.db_table,
+                    edge_condition=get_edge_condition(edge_model),
+                )
+            )
+
+
+def closure_factory(node_model: Union[str, type[Node]]) -> type[Closure]:
+    """Return a model inheriting from `Closure` and implementing `ancestor` and `descendant`."""
+
+    class _Closure(Closure):
+        ancestor = models.ForeignKey(
+            node_model,
+            related_name='descendant_paths',
+            on_delete=models.CASCADE,
+        )
+        descendant = models.ForeignKey(
+            node_model,
+            related_name='ancestor_paths',
+            on_delete=models.CASCADE,
+        )
+
+        class Meta:
+            abstract = True
+            unique_together = ['ancestor', 'descendant', 'depth']
+            index_together = ['descendant', 'ancestor']
+
+    return _Closure
+
 
 def node_factory(
     edge_model: type[ExtendedModel],
     children_null: bool = True,
+    closure_model: Optional[type[Closure]] = None,
 ) -> type[Node]:
-    """Return a model class that inherits from `DagNode` and implements `children`."""
-    edge_model_table = edge_model._meta.db_table
+    """
+    Return a model class that inherits from `DagNode` and implements `children`.
+
+    If a closure model is specified, it is used (rather than recursive CTEs)
+    to traverse the graph.
+    """
+    node_edge_model, node_closure_model = edge_model, closure_model
 
     class _Node(Node):
         children = models.ManyToManyField(
             'self',
             blank=children_null,
             symmetrical=False,
-            through=edge_model,
+            through=node_edge_model,
             related_name='parents',
         )
+        edge_model = node_edge_model
+        closure_model = node_closure_model
 
         class Meta:
             abstract = True
 
-        @property
-        def ancestor_ids(self):
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    ANCESTOR_QUERY.format(relationship_table=edge_model_table),
-                    {'id': self.id},
-                )
-                return [row[0] for row in cursor.fetchall()]
-
-        @property
-        def descendant_ids(self):
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    DESCENDANT_QUERY.format(relationship_table=edge_model_table),
-                    {'id': self.id},
-                )
-                return [row[0] for row in cursor.fetchall()]
-
     return _Node
 
 
@@ -259,8 +460,18 @@ class Edge(AbstractModel, Relation):
     def pre_save(self):
         super().pre_save()
         # Avoid circular ancestry.
-        if self.child.id in self.parent.self_and_ancestor_ids:
+        if self.child.id == self.parent.id or self.child.is_ancestor_of(self.parent):
             raise ValidationError('The child topic is an ancestor of the parent topic.')
+        # Record the endpoints (and deletion status) in the db, so that the closure
+        # table (if any) can be updated if they are changed.
+        self._original_state = None
+        if not self._state.adding:
+            fields = ['parent_id', 'child_id']
+            if is_soft_deletable(type(self)):
+                fields.append('deleted')
+            self._original_state = (
+                self.__class__._base_manager.filter(pk=self.pk).values(*fields).first()
+            )
 
 
 def edge_factory(
@@ -308,3 +519,54 @@ def edge_factory(
                     super_self.post_save()
 
     return _Edge
+
+
+def get_closure_model(edge: Edge) -> Optional[type[Closure]]:
+    """Return the closure model of the graph that an edge belongs to, if any."""
+    node_model = edge._meta.get_field('parent').related_model
+    return getattr(node_model, 'closure_model', None)
+
+
+def update_closure_after_save(sender, instance, created: bool = False, **kwargs):
+    """
+    Update the closure table after an edge is saved.
+
+    The paths through an edge are added when it is created or undeleted, removed
+    when it is soft-deleted, and replaced when its endpoints are changed.
+    """
+    if not isinstance(instance, Edge):
+        return
+    closure_model = get_closure_model(instance)
+    if not closure_model:
+        return
+    is_active = getattr(instance, 'deleted', None) is None
+    original_state = None if created else getattr(instance, '_original_state', None)
+    if original_state is None:
+        if created and is_active:
+            closure_model.add_edge(instance)
+        return
+    was_active = original_state.get('deleted') is None
+    original_endpoints = (original_state['parent_id'], original_state['child_id'])
+    endpoints_changed = original_endpoints != (instance.parent_id, instance.child_id)
+    if was_active and (endpoints_changed or not is_active):
+        original_parent_id, original_child_id = original_endpoints
+        closure_model.remove_edge(
+            type(instance)(parent_id=original_parent_id, child_id=original_child_id)
+        )
+    if is_active and (endpoints_changed or not was_active):
+        closure_model.add_edge(instance)
+
+
+def update_closure_after_delete(sender, instance, **kwargs):
+    """Remove the paths that passed through a deleted edge from the closure table."""
+    if not isinstance(instance, Edge):
+        return
+    closure_model = get_closure_model(instance)
+    if closure_model:
+        closure_model.remove_edge(instance)
+
+
+# Soft deletion and undeletion are handled on save, when they are applied
+# (rather than when they are proposed as changes).
+post_save.connect(update_closure_after_save, dispatch_uid='dag_closure_after_save')
+post_delete.connect(update_closure_after_delete, dispatch_uid='dag_closure_after_delete')
@@ -0,0 +1,12 @@
+"""
+Performance benchmarks of hot paths, with SQL query budgets.
+
+Query budgets are enforced whenever the benchmarks run (including by `inv test`).
+Timing regressions are detected by `inv benchmark`, which compares the results
+to a baseline saved in `benchmarks/baselines/<machine>/` by `inv benchmark --save`.
+Baselines are machine-specific; save one from the machine that runs `inv benchmark`
+(e.g., CI) and commit it, and save a new one when a slowdown is intended.
+"""
+
+# Number of instances created for benchmarks of operations on multiple instances
+N_INSTANCES = 25
@@ -0,0 +1,50 @@
+"""
+Fixtures for the performance benchmark suite.
+
+Each benchmark asserts a budget for the number of SQL queries made by the code
+it measures. Budgets are set below the number of instances being processed, so
+that a query per instance (i.e., an N+1 regression) exceeds the budget.
+
+Timings are measured with `pytest-benchmark` if it is installed; otherwise, the
+measured code is run once, so that the query budgets are still enforced.
+"""
+
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+if TYPE_CHECKING:
+    from pytest import FixtureRequest
+
+
+@pytest.fixture()
+def measure(request: 'FixtureRequest') -> Callable:
+    """
+    Return a function that benchmarks a callable and asserts its query budget.
+
+    The callable is run once before its queries are counted, so that values it
+    computes and caches (e.g., with `@store`) do not count against its budget.
+    """
+    try:
+        benchmark = request.getfixturevalue('benchmark')
+    except pytest.FixtureLookupError:
+        benchmark = None
+
+    def run(function: Callable, *args, max_queries: int, **kwargs):
+        function(*args, **kwargs)
+        with CaptureQueriesContext(connection) as context:
+            result = function(*args, **kwargs)
+        n_queries = len(context.captured_queries)
+        queries = '\n'.join(query['sql'] for query in context.captured_queries)
+        assert n_queries <= max_queries, (
+            f'{function.__name__} made {n_queries} queries '
+            f'(budget: {max_queries}):\n{queries}'
+        )
+        if benchmark is not None:
+            benchmark.extra_info['queries'] = n_queries
+            result = benchmark(function, *args, **kwargs)
+        return result
+
+    return run
@@ -0,0 +1,26 @@
+"""Benchmarks of historic datetime formatting."""
+
+from apps.dates.structures import HistoricDateTime
+
+DATES = [
+    HistoricDateTime(2000, 7, 4, 12, 30),
+    HistoricDateTime(1850, 1, 1),
+    HistoricDateTime(1492, 10, 1, second=1),
+    HistoricDateTime(33, 1, 1, second=1),
+]
+
+
+def format_dates() -> list[str]:
+    return [
+        f'{date.string} {date.year_string} {date.serialize()}'
+        for date in DATES
+        for _ in range(100)
+    ]
+
+
+class TestDateBenchmarks:
+    """Benchmarks of historic datetime formatting."""
+
+    def test_formatting(self, measure):
+        """Benchmark formatting historic datetimes."""
+        assert len(measure(format_dates, max_queries=0)) == 100 * len(DATES)
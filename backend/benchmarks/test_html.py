@@ -0,0 +1,28 @@
+"""Benchmarks of HTML field processing."""
+
+import pytest
+
+from apps.images.factories import ImageFactory
+from apps.quotes.factories import QuoteFactory
+from benchmarks import N_INSTANCES
+from core.fields.html_field import process
+
+# Quotes and images are retrieved with one query per model, and their HTML
+# is read from their caches.
+MAX_QUERIES = 4
+
+
+@pytest.mark.django_db()
+class TestHTMLBenchmarks:
+    """Benchmarks of HTML field processing."""
+
+    def test_placeholder_processing(self, measure):
+        """Benchmark replacing model instance placeholders with their HTML."""
+        quotes = QuoteFactory.create_batch(N_INSTANCES)
+        images = ImageFactory.create_batch(N_INSTANCES)
+        paragraphs = [
+            f'<p>Paragraph {index} [[ quote: {quote.pk} ]]</p><p>[[ image: {image.pk} ]]</p>'
+            for index, (quote, image) in enumerate(zip(quotes, images))
+        ]
+        html = measure(process, ''.join(paragraphs), max_queries=MAX_QUERIES)
+        assert '[[ quote' not in html
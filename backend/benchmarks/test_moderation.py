@@ -0,0 +1,45 @@
+"""Benchmarks of moderation."""
+
+import pytest
+
+from apps.dates.structures import HistoricDateTime
+from apps.moderation.diff import get_field_changes
+from apps.moderation.models.change import Change
+from apps.propositions.models import Proposition, TopicRelation
+from apps.topics.factories import TopicFactory
+from apps.users.factories import UserFactory
+from benchmarks import N_INSTANCES
+
+# The change and its constituent changes are retrieved with one query each, and
+# the relations of each m2m field with one query per field.
+MAX_QUERIES = 10
+
+
+@pytest.mark.django_db()
+class TestModerationBenchmarks:
+    """Benchmarks of moderation."""
+
+    def test_field_changes(self, measure):
+        """Benchmark computing the field changes of a change with many relation changes."""
+        proposition = Proposition(
+            type='propositions.conclusion',
+            title='title',
+            summary='summary',
+            elaboration='<p>elaboration</p>',
+            certainty=1,
+            date=HistoricDateTime(2000, 1, 1),
+            verified=True,
+        )
+        proposition.save()
+        proposition.summary = 'changed summary'
+        change = proposition.save_change(contributor=UserFactory.create())
+        for topic in TopicFactory.create_batch(N_INSTANCES):
+            TopicRelation(topic=topic, content_object=proposition).save_change(
+                parent_change=change
+            )
+
+        def get_changes():
+            return get_field_changes(Change.objects.get(pk=change.pk))
+
+        field_changes = measure(get_changes, max_queries=MAX_QUERIES)
+        assert field_changes['proposition__summary'].after == 'changed summary'
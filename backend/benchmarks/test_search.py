@@ -0,0 +1,65 @@
+"""Benchmarks of the resolution of search results."""
+
+import pytest
+from elasticsearch_dsl.response import Response
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.propositions.factories import PropositionFactory
+from apps.quotes.factories import QuoteFactory
+from apps.search.api.search import Search
+from apps.search.api.views import ElasticSearchResultsAPIView
+from apps.search.documents.proposition import PropositionDocument
+from apps.search.documents.quote import QuoteDocument
+from apps.search.documents.source import SourceDocument
+from apps.sources.factories import SourceFactory
+from benchmarks import N_INSTANCES
+
+# Results are resolved with one query per index.
+MAX_QUERIES = 3
+
+
+def get_stubbed_search(instances_by_index: dict[str, list]) -> Search:
+    """Return a search with a stubbed ElasticSearch response, so ES is not queried."""
+    hits = [
+        {'_index': index, '_id': str(instance.pk), '_score': 1.0}
+        for index, instances in instances_by_index.items()
+        for instance in instances
+    ]
+    search = Search()
+    search._response = Response(
+        search,
+        {
+            'took': 1,
+            'timed_out': False,
+            'hits': {
+                'total': {'value': len(hits), 'relation': 'eq'},
+                'max_score': 1.0,
+                'hits': hits,
+            },
+        },
+    )
+    return search
+
+
+@pytest.mark.django_db()
+class TestSearchBenchmarks:
+    """Benchmarks of the resolution of search results."""
+
+    def test_to_queryset(self, measure):
+        """Benchmark resolving search hits to model instances."""
+        instances_by_index = {
+            QuoteDocument.get_index_name(): QuoteFactory.create_batch(N_INSTANCES),
+            PropositionDocument.get_index_name(): PropositionFactory.create_batch(
+                N_INSTANCES
+            ),
+            SourceDocument.get_index_name(): SourceFactory.create_batch(N_INSTANCES),
+        }
+        view = ElasticSearchResultsAPIView()
+        view.request = Request(APIRequestFactory().get('/'))
+
+        def to_queryset():
+            return get_stubbed_search(instances_by_index).to_queryset(view)
+
+        instances, count = measure(to_queryset, max_queries=MAX_QUERIES)
+        assert count == len(instances) == 3 * N_INSTANCES
@@ -0,0 +1,47 @@
+"""Benchmarks of module serialization."""
+
+import pytest
+
+from apps.propositions.api.serializers import PropositionSerializer
+from apps.propositions.factories import PropositionFactory
+from apps.propositions.models import Proposition
+from apps.sources.api.serializers import SourceSerializer
+from apps.sources.factories import SourceFactory
+from apps.sources.models import Source
+from benchmarks import N_INSTANCES
+from core.models.model_with_cache import batched_cache_writes
+from core.utils.models import serialize_instances
+
+# Serializers' relations are prefetched with one query per relation.
+MAX_QUERIES = 20
+
+
+def serialize(instances: list) -> list[dict]:
+    """Serialize instances as they are serialized when handling a request."""
+    with batched_cache_writes():
+        return serialize_instances(instances)
+
+
+@pytest.mark.django_db()
+class TestSerializationBenchmarks:
+    """Benchmarks of module serialization."""
+
+    def test_proposition_serialization(self, measure):
+        """Benchmark serializing propositions with `PropositionSerializer`."""
+        pks = [proposition.pk for proposition in PropositionFactory.create_batch(N_INSTANCES)]
+        assert Proposition.get_serializer() is PropositionSerializer
+
+        def serialize_propositions():
+            return serialize(list(Proposition.objects.filter(pk__in=pks)))
+
+        assert len(measure(serialize_propositions, max_queries=MAX_QUERIES)) == N_INSTANCES
+
+    def test_source_serialization(self, measure):
+        """Benchmark serializing sources with `SourceSerializer`."""
+        pks = [source.pk for source in SourceFactory.create_batch(N_INSTANCES)]
+        assert Source.get_serializer() is SourceSerializer
+
+        def serialize_sources():
+            return serialize(list(Source.objects.filter(pk__in=pks)))
+
+        assert len(measure(serialize_sources, max_queries=MAX_QUERIES)) == N_INSTANCES
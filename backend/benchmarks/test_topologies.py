@@ -0,0 +1,43 @@
+"""Benchmarks of DAG traversal."""
+
+import pytest
+
+from apps.topics.models.topic import Topic
+from benchmarks import N_INSTANCES
+
+# IDs are retrieved with one query (from the closure table), and the nodes with another.
+MAX_QUERIES = 2
+
+
+def create_topic(name: str) -> Topic:
+    topic = Topic(name=name)
+    topic.verified = True
+    topic.save(moderate=False)
+    return topic
+
+
+def create_dag() -> tuple[Topic, Topic]:
+    """Create a DAG of topics in which each topic has two parents; return its root and leaf."""
+    topics = [create_topic(f'Topic {index}') for index in range(N_INSTANCES)]
+    for index, topic in enumerate(topics[1:], start=1):
+        topic.add_parent(topics[index - 1])
+        if index > 1:
+            topic.add_parent(topics[index - 2])
+    return topics[0], topics[-1]
+
+
+@pytest.mark.django_db()
+class TestTopologyBenchmarks:
+    """Benchmarks of DAG traversal."""
+
+    def test_ancestors(self, measure):
+        """Benchmark retrieving the ancestors of a node."""
+        _root, leaf = create_dag()
+        ancestors = measure(lambda: list(leaf.ancestors), max_queries=MAX_QUERIES)
+        assert len(ancestors) == N_INSTANCES - 1
+
+    def test_descendants(self, measure):
+        """Benchmark retrieving the descendants of a node."""
+        root, _leaf = create_dag()
+        descendants = measure(lambda: list(root.descendants), max_queries=MAX_QUERIES)
+        assert len(descendants) == N_INSTANCES - 1
@@ -1,6 +1,7 @@
 """See Invoke's documentation: http://docs.pyinvoke.org/en/stable/."""
 
 from glob import iglob
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Optional
 
 import django
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 django.setup()
 
+BENCHMARK_STORAGE = 'benchmarks/baselines'
+
 
 @command
 def autoformat(context: 'Context', filepaths: Optional[str] = None):
@@ -48,6 +51,9 @@ def test(
         '--maxfail=3',
         # '--hypothesis-show-statistics',
     ]
+    if find_spec('pytest_benchmark'):
+        # Run benchmarks once each, so that their query budgets are enforced.
+        pytest_args.append('--benchmark-disable')
     if fail_fast:
         pytest_args.append('-x')
     command = f'pytest {" ".join(pytest_args)}'
@@ -59,3 +65,34 @@ def test(
     context.run(command)
     if coverage:
         context.run('coverage combine')
+
+
+@command
+def benchmark(context: 'Context', save: bool = False, fail_threshold: str = 'mean:20%'):
+    """
+    Run benchmarks and compare their results to the saved baseline.
+
+    If `save` is true, the results are saved as the new baseline instead.
+    """
+    if not save and next(iglob(f'{BENCHMARK_STORAGE}/*/*_baseline.json'), None) is None:
+        # Without a baseline, `--benchmark-compare` would silently compare nothing.
+        raise SystemExit(
+            f'No benchmark baseline is saved in {BENCHMARK_STORAGE}; '
+            'run `inv benchmark --save` and commit the saved baseline.'
+        )
+    pytest_args = [
+        'benchmarks',
+        '--benchmark-only',
+        f'--benchmark-storage=file://{BENCHMARK_STORAGE}',
+        f'--benchmark-json={BENCHMARK_STORAGE}/latest.json',
+    ]
+    if save:
+        pytest_args.append('--benchmark-save=baseline')
+    else:
+        pytest_args += [
+            '--benchmark-compare',
+            f'--benchmark-compare-fail={fail_threshold}',
+        ]
+    command = f'pytest {" ".join(pytest_args)}'
+    print(command)
+    context.run(command)
@@ -58,3 +58,10 @@ CACHALOT_UNCACHABLE_TABLES = frozenset(
         'health_check_db_testmodel',
     )
 )
+
+# Number of seconds for which rendered card and detail HTML is cached (0 disables
+# the cache). Fragments are keyed by their instances' content versions, so they
+# do not need to be invalidated when the instances change.
+HTML_FRAGMENT_CACHE_TIMEOUT = config(
+    'HTML_FRAGMENT_CACHE_TIMEOUT', cast=int, default=24 * 60 * 60
+)
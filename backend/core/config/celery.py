@@ -1,3 +1,4 @@
+from celery.schedules import crontab
 from decouple import config
 
 from core.config.redis import REDIS_BASE_URL
@@ -12,3 +13,17 @@ CELERY_RESULT_SERIALIZER = 'json'
 # https://docs.celeryproject.org/en/stable/django/first-steps-with-django.html#django-celery-results-using-the-django-orm-cache-as-a-result-backend
 CELERY_RESULT_BACKEND = 'django-cache'
 CELERY_CACHE_BACKEND = 'default'
+
+# Periodic tasks, installed in the database by django-celery-beat's scheduler
+# https://docs.celeryproject.org/en/stable/userguide/periodic-tasks.html
+CELERY_BEAT_SCHEDULE = {
+    'cache-today-in-history': {
+        'task': 'apps.home.tasks.cache_today_in_history',
+        # Build the following day's feed shortly before midnight (UTC).
+        'schedule': crontab(hour=23, minute=45),
+    },
+}
+
+# Number of seconds for which changes affecting sources' calculated fields (e.g.,
+# `citation_html`) are coalesced before the fields are recomputed (in bulk).
+SOURCE_RECOMPUTATION_WINDOW = config('SOURCE_RECOMPUTATION_WINDOW', cast=int, default=10)
@@ -3,7 +3,9 @@
 import re
 from typing import TYPE_CHECKING
 
-from core.environment import TESTING
+from decouple import config
+
+from core.environment import IS_DEV, TESTING
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
@@ -19,19 +21,26 @@ SILKY_AUTHENTICATION = True  # User must login.
 SILKY_AUTHORISATION = True  # User must have permissions.
 SILKY_PERMISSIONS = lambda user: user.is_superuser  # noqa: E731
 
-PROFILE_ALL_REQUESTS = True
+# Silk is too expensive to profile all requests outside of development.
+PROFILE_ALL_REQUESTS = config('PROFILE_ALL_REQUESTS', cast=bool, default=IS_DEV)
+
+# Fraction of requests profiled by `core.middleware.ProfilingMiddleware`
+REQUEST_PROFILING_SAMPLE_RATE = config(
+    'REQUEST_PROFILING_SAMPLE_RATE', cast=float, default=0.0 if TESTING else 0.05
+)
+# Number of times a query shape must be executed in a request to be reported as repeated
+REQUEST_PROFILING_REPEATED_QUERY_THRESHOLD = 5
 
 
 def intercept(request: 'HttpRequest') -> bool:
     """Determine whether to intercept a request for profiling."""
-    qualifiers = (PROFILE_ALL_REQUESTS or request.user.is_superuser,)
-    disqualifiers = (
-        TESTING,
-        re.search(r'(?:healthcheck|graphiql)/', request.path),
-    )
-    if any(qualifiers) and not any(disqualifiers):
+    if TESTING or re.search(r'(?:healthcheck|graphiql)/', request.path):
+        return False
+    if PROFILE_ALL_REQUESTS:
         return True
-    return False
+    # Silk intercepts requests before `AuthenticationMiddleware` sets `request.user`.
+    user = getattr(request, 'user', None)
+    return bool(user and user.is_superuser)
 
 
 SILKY_INTERCEPT_FUNC = intercept
@@ -42,3 +42,29 @@ if USE_CELERY:
 
 # https://django-elasticsearch-dsl.readthedocs.io/en/latest/settings.html#elasticsearch-dsl-parallel
 ELASTICSEARCH_DSL_PARALLEL = config('USE_PARALLEL_INDEX_BUILDING', cast=bool, default=True)
+
+# Store each search result's serialized card payload in its ES document, so that
+# search results can be rendered from `_source` without querying the database.
+# Documents must be rebuilt (`manage.py search_index --rebuild`) after enabling.
+ELASTICSEARCH_SOURCE_ONLY_RESULTS = config(
+    'ELASTICSEARCH_SOURCE_ONLY_RESULTS', cast=bool, default=False
+)
+
+# Number of seconds for which search responses are cached. Cached responses are
+# invalidated when the indexes they depend on are written to by the Celery signal
+# processor, so response caching is only enabled when Celery is used.
+SEARCH_RESPONSE_CACHE_TIMEOUT = config(
+    'SEARCH_RESPONSE_CACHE_TIMEOUT', cast=int, default=60 * 60 if USE_CELERY else 0
+)
+
+# Number of seconds for which saves of indexed instances are coalesced before
+# the affected documents are written to Elasticsearch (in bulk).
+SEARCH_INDEXING_WINDOW = config('SEARCH_INDEXING_WINDOW', cast=int, default=10)
+
+# Number of seconds for which instant search results are cached. Since results
+# are not invalidated by index writes, the timeout is kept short.
+INSTANT_SEARCH_CACHE_TIMEOUT = config('INSTANT_SEARCH_CACHE_TIMEOUT', cast=int, default=30)
+
+# Number of times a prefix must be searched (within the cache timeout) before its
+# results are cached, so that one-off queries do not fill the cache
+INSTANT_SEARCH_HOT_PREFIX_HITS = config('INSTANT_SEARCH_HOT_PREFIX_HITS', cast=int, default=2)
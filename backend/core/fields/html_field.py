@@ -1,5 +1,7 @@
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Match, Optional, Pattern, Union
 
 import regex as re
 from aenum import Constant
@@ -64,6 +66,129 @@ logging.debug(f'Object placeholder pattern: {OBJECT_PLACEHOLDER_REGEX}')
 
 object_placeholder_regex = re.compile(OBJECT_PLACEHOLDER_REGEX)
 
+# Placeholder patterns (other than those of the models in `MODEL_CLASS_PATHS`)
+# that must be recognized when tokenizing HTML.
+EXTRA_PLACEHOLDER_PATTERN_PATHS = (
+    'apps.sources.models.citation.citation_placeholder_pattern',
+)
+
+citation_link_spacing_regex = re.compile(r'(\S)\ (<a [^>]+?citation-link)')
+
+Replacer = Callable[[type['ExtendedModel'], Match, Optional['ExtendedModel']], str]
+
+
+@lru_cache(maxsize=None)
+def compile_placeholder_pattern(pattern: str) -> Pattern:
+    """Return a compiled placeholder pattern (compiling each pattern only once)."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def get_model_class(content_type: str) -> Optional[type['ExtendedModel']]:
+    """Return the model class corresponding to a placeholder's content type."""
+    model_cls_str = MODEL_CLASS_PATHS.get(content_type)
+    if model_cls_str:
+        return import_string(model_cls_str)
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_placeholder_grammar() -> Pattern:
+    """
+    Return a compiled pattern matching placeholders of every type.
+
+    Specialized patterns (e.g., the citation pattern, which includes page numbers
+    and quotations) are tried before the generic object placeholder pattern.
+    """
+    patterns = [import_string(path) for path in EXTRA_PLACEHOLDER_PATTERN_PATHS]
+    for content_type in MODEL_CLASS_PATHS:
+        pattern = getattr(get_model_class(content_type), 'placeholder_regex', None)
+        if pattern:
+            patterns.append(pattern)
+    patterns.append(OBJECT_PLACEHOLDER_REGEX)
+    alternatives = '|'.join(f'(?:{pattern})' for pattern in dict.fromkeys(patterns))
+    return re.compile(alternatives)
+
+
+def get_placeholder_instances(
+    model_cls: type['ExtendedModel'], keys: Iterable[str]
+) -> dict[str, 'ExtendedModel']:
+    """Return a dictionary of the model instances referenced by placeholders, by key."""
+    try:
+        return {
+            str(instance.pk): instance for instance in model_cls.objects.filter(pk__in=keys)
+        }
+    except (ValueError, ValidationError) as error:
+        logging.error(f'Unable to retrieve {model_cls.__name__} instances {keys}: {error}')
+        return {}
+
+
+def replace_placeholders(
+    html: str,
+    replacer: Replacer,
+    content_types: Optional[Iterable[str]] = None,
+    requires_instance: Callable[[Match], bool] = lambda match: True,
+) -> str:
+    """
+    Replace the placeholders in an HTML string, in a single pass.
+
+    The HTML is tokenized once with the placeholder grammar; the model instances
+    referenced by placeholders (for which `requires_instance` returns True) are
+    retrieved with one query per model; and the output is rebuilt in one pass,
+    with each placeholder replaced by `replacer(model_cls, match, model_instance)`.
+    Placeholders with no corresponding model class are left unchanged.
+    """
+    if not html:
+        return html
+    matches: list[tuple[type['ExtendedModel'], Match]] = []
+    keys_by_model: dict[type['ExtendedModel'], set[str]] = defaultdict(set)
+    for match in get_placeholder_grammar().finditer(html):
+        content_type = match.group(PlaceholderGroups.MODEL_NAME)
+        if content_types is not None and content_type not in content_types:
+            continue
+        model_cls = get_model_class(content_type)
+        if not model_cls:
+            logging.info(f'ERROR: Unable to get model class string for {content_type}')
+            continue
+        logging.debug(f'Found {content_type} placeholder: {truncate(match.group(0))}')
+        matches.append((model_cls, match))
+        if requires_instance(match):
+            keys_by_model[model_cls].add(match.group(PlaceholderGroups.PK).strip())
+    if not matches:
+        return html
+    instances = {
+        model_cls: get_placeholder_instances(model_cls, keys)
+        for model_cls, keys in keys_by_model.items()
+    }
+    components: list[str] = []
+    position = 0
+    for model_cls, match in matches:
+        components.append(html[position : match.start()])
+        model_instance = instances.get(model_cls, {}).get(
+            match.group(PlaceholderGroups.PK).strip()
+        )
+        components.append(replacer(model_cls, match, model_instance))
+        position = match.end()
+    components.append(html[position:])
+    return ''.join(components)
+
+
+def _get_object_html(
+    model_cls: type['ExtendedModel'],
+    match: Match,
+    model_instance: Optional['ExtendedModel'],
+) -> str:
+    try:
+        object_html = model_cls.get_object_html(
+            match, use_preretrieved_html=True, model_instance=model_instance
+        )
+    except ObjectDoesNotExist:
+        raise ValidationError(
+            f'Could not get HTML for placeholder: {truncate(match.group(0))}'
+        )
+    logging.debug(f'Retrieved {model_cls.__name__} HTML: {truncate(object_html)}')
+    return object_html
+
 
 def process(html: str) -> str:
     """
@@ -72,41 +197,13 @@ def process(html: str) -> str:
     This involves replacing model instance placeholders with their HTML.
     """
     logging.debug(f'Processing HTML: {truncate(html)}')
-    model_classes: dict[str, type['ExtendedModel']] = {}
-    for match in object_placeholder_regex.finditer(html):
-        placeholder = match.group(0)
-        object_type = match.group(PlaceholderGroups.MODEL_NAME)
-        logging.debug(f'Found {object_type} placeholder: {truncate(placeholder)}')
-        model_cls_str = MODEL_CLASS_PATHS.get(object_type)
-        if model_cls_str:
-            model_cls: type['ExtendedModel'] = model_classes.get(
-                model_cls_str, import_string(model_cls_str)
-            )
-            if model_cls_str not in model_classes:
-                model_classes[model_cls_str] = model_cls
-            logging.debug(f'Processing {object_type} placeholder: {truncate(placeholder)}')
-            # TODO
-            object_match = model_cls.get_admin_placeholder_regex().match(placeholder)
-            if object_match:
-                try:
-                    object_html = model_cls.get_object_html(
-                        object_match, use_preretrieved_html=True
-                    )
-                    logging.debug(f'Retrieved {object_type} HTML: {truncate(object_html)}')
-                except ObjectDoesNotExist:
-                    raise ValidationError(
-                        f'Could not get HTML for placeholder: {truncate(placeholder)}'
-                    )
-                html = html.replace(placeholder, object_html)
-            else:
-                logging.error(
-                    f'ERROR: {model_cls.get_admin_placeholder_regex()} '
-                    f'did not match {placeholder}'
-                )
-        else:
-            logging.info(f'ERROR: Unable to get model class string for {object_type}')
-    # TODO: optimize
-    html = re.sub(r'(\S)\ (<a [^>]+?citation-link)', r'\g<1>\g<2>', html)
+    html = replace_placeholders(
+        html,
+        _get_object_html,
+        # Only placeholders without pre-retrieved HTML require db queries.
+        requires_instance=lambda match: not match.group(PlaceholderGroups.HTML),
+    )
+    html = citation_link_spacing_regex.sub(r'\g<1>\g<2>', html)
     logging.debug(f'Successfully processed {truncate(html)}')
     return html
 
@@ -315,29 +412,22 @@ class HTMLField(TextField):
         Including HTML in the placeholders (1) improves readability when editing
         and (2) reduces time to process search results.
         """
-        soup = soupify(html)
-        referenced_modules = soup.find_all('module')
-        for referenced_module in referenced_modules:
-            print(referenced_module)
-        for content_type in self.processable_content_types:
-            model_cls_str = MODEL_CLASS_PATHS.get(content_type)
-            if model_cls_str:
-                model_cls: type['ExtendedModel'] = import_string(model_cls_str)
-                for match in model_cls.get_admin_placeholder_regex().finditer(html):
-                    if match.group(PlaceholderGroups.MODEL_NAME) != content_type:
-                        logging.error(
-                            f'{match.group(0)} is not an instance of {content_type}.'
-                        )
-                        continue
-                    placeholder = match.group(0)
-                    try:
-                        updated_placeholder = model_cls.get_updated_placeholder(match)
-                        html = html.replace(placeholder, updated_placeholder)
-                    except ObjectDoesNotExist as err:
-                        raise ValueError(
-                            f'Unable to retrieve object matching {match.group(0)}'
-                        ) from err
-        return html
+        return replace_placeholders(
+            html,
+            self._get_updated_placeholder,
+            content_types=set(self.processable_content_types),
+        )
+
+    @staticmethod
+    def _get_updated_placeholder(
+        model_cls: type['ExtendedModel'],
+        match: Match,
+        model_instance: Optional['ExtendedModel'],
+    ) -> str:
+        try:
+            return model_cls.get_updated_placeholder(match, model_instance=model_instance)
+        except ObjectDoesNotExist as err:
+            raise ValueError(f'Unable to retrieve object matching {match.group(0)}') from err
 
     def deconstruct(self) -> tuple:
         """
@@ -0,0 +1,57 @@
+import random
+from typing import TYPE_CHECKING, Callable
+
+from django.conf import settings
+from django.urls import reverse
+
+from core import profiling
+from core.models.model_with_cache import batched_cache_writes
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest, HttpResponse
+    from django.template.response import SimpleTemplateResponse
+
+
+class BatchedCacheWritesMiddleware:
+    """
+    Middleware for batching the cache writes made while handling a request.
+
+    Values computed by `@store` properties during the request are written
+    with one UPDATE per model (rather than one save per computed value).
+    """
+
+    def __init__(self, get_response: Callable[['HttpRequest'], 'HttpResponse']):
+        self.get_response = get_response
+
+    def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
+        with batched_cache_writes():
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware for profiling a sample of requests.
+
+    The fraction of requests profiled is set by `REQUEST_PROFILING_SAMPLE_RATE`.
+    Unsampled requests are not instrumented, so the overhead is negligible.
+    """
+
+    def __init__(self, get_response: Callable[['HttpRequest'], 'HttpResponse']):
+        self.get_response = get_response
+        self.metrics_path = reverse('metrics')
+
+    def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
+        sample_rate = settings.REQUEST_PROFILING_SAMPLE_RATE
+        if request.path == self.metrics_path or random.random() >= sample_rate:  # noqa: S311
+            return self.get_response(request)
+        with profiling.profile_request() as profile:
+            response = self.get_response(request)
+        profiling.record_request(profiling.get_route(request), profile)
+        return response
+
+    def process_template_response(
+        self, request: 'HttpRequest', response: 'SimpleTemplateResponse'
+    ) -> 'SimpleTemplateResponse':
+        """Time the rendering of the response (which follows this hook)."""
+        response.add_post_render_callback(profiling.start_timer(profiling.RENDERING))
+        return response
@@ -1,11 +1,11 @@
 """Manager classes for ModularHistory's models."""
 
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
 
 from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import Case, IntegerField, QuerySet, When
-from django.db.models.expressions import Value
+from django.db.models import Func, IntegerField, QuerySet
+from django.db.models.expressions import F, Value
 from django.db.models.manager import Manager
 from django.utils.module_loading import import_string
 from elasticsearch_dsl import Q
@@ -17,6 +17,59 @@ if TYPE_CHECKING:
     from core.models.model import ExtendedModel
 
 
+class ArrayPosition(Func):
+    """
+    Position (1-based) of a field's value in an array of values.
+
+    The array is passed as a single query parameter and cast to the field's type,
+    so that the SQL does not grow with the number of values.
+    """
+
+    function = 'array_position'
+    output_field = IntegerField()
+
+    def __init__(self, values: list, field_name: str, db_field, **extra):
+        self.db_field = db_field
+        super().__init__(Value(values), F(field_name), **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        array, expression = self.get_source_expressions()
+        array_sql, array_params = compiler.compile(array)
+        expression_sql, expression_params = compiler.compile(expression)
+        db_type = self.db_field.rel_db_type(connection)
+        sql = f'{self.function}({array_sql}::{db_type}[], {expression_sql})'
+        return sql, (*array_params, *expression_params)
+
+
+def filter_in_order(
+    queryset: QuerySet, values: Iterable[Any], field_name: str = 'pk'
+) -> QuerySet:
+    """
+    Filter a queryset to instances with a field value in `values`, in the order of `values`.
+
+    E.g., `filter_in_order(Topic.objects.all(), [3, 1, 2])` returns topics 3, 1, and 2,
+    in that order.
+    """
+    values = list(values)
+    if not values:
+        return queryset.none()
+    opts = queryset.model._meta
+    field = opts.pk if field_name == 'pk' else opts.get_field(field_name)
+    db_field = field.target_field if field.is_relation else field
+    return queryset.filter(**{f'{field_name}__in': values}).order_by(
+        ArrayPosition(values, field_name, db_field)
+    )
+
+
+def get_date_position(datetime_value: Union[date, datetime, HistoricDateTime]) -> float:
+    """Return the position of a date on a continuous scale increasing with time."""
+    if not isinstance(datetime_value, HistoricDateTime):
+        datetime_value = HistoricDateTime(
+            datetime_value.year, datetime_value.month, datetime_value.day
+        )
+    return datetime_value.chronological_position
+
+
 class SearchableMixin:
     """Mixin for adding search capability to manager and queryset classes."""
 
@@ -33,6 +86,10 @@ class SearchableMixin:
         datetime_attr: str = 'date',
     ) -> 'ExtendedModel':
         """Return the model instance closest to the specified datetime_value."""
+        model_fields = {field.name for field in self.model._meta.concrete_fields}
+        if datetime_attr == 'date' and 'date_position' in model_fields:
+            # Compare persisted date positions, which are ordered correctly BCE.
+            return self.get_closest_to_date_position(get_date_position(datetime_value))
         greater = self.filter(date__gte=datetime_value).order_by(datetime_attr).first()
         lesser = self.filter(date__lte=datetime_value).order_by(f'-{datetime_attr}').first()
         if not greater and not lesser:  # TODO
@@ -43,6 +100,30 @@ class SearchableMixin:
             return greater if greater_diff < lesser_diff else lesser
         return greater or lesser
 
+    def get_closest_to_date_position(
+        self: Union[Manager, QuerySet], date_position: float
+    ) -> 'ExtendedModel':
+        """Return the dated model instance closest to the specified date position."""
+        greater = (
+            self.filter(date_position__gte=date_position).order_by('date_position').first()
+        )
+        lesser = (
+            self.filter(date_position__lte=date_position).order_by('-date_position').first()
+        )
+        if not greater and not lesser:  # TODO
+            return self.first()
+        elif greater and lesser:
+            greater_diff = greater.date_position - date_position
+            lesser_diff = date_position - lesser.date_position
+            return greater if greater_diff < lesser_diff else lesser
+        return greater or lesser
+
+    def in_order_of(
+        self: Union[Manager, QuerySet], values: Iterable[Any], field_name: str = 'pk'
+    ) -> QuerySet['ExtendedModel']:
+        """Return the instances with a field value in `values`, in the order of `values`."""
+        return filter_in_order(self.all(), values, field_name=field_name)
+
     def search(
         self: Union[Manager, QuerySet],
         term: str,
@@ -64,13 +145,11 @@ class SearchableMixin:
                     print(err)
             if elastic and index:
                 query = Q('simple_query_string', query=term)
-                results: QuerySet = index.search().query(query).to_queryset()
+                hits = index.search().query(query).source(excludes=['*'])
                 # If the calling object is a queryset (rather than a manager),
-                # ensure the search results don't include model instances that
+                # the search results don't include model instances that
                 # were already filtered out of the queryset.
-                if isinstance(self, QuerySet):
-                    base_ids = self.values_list('pk', flat=True)
-                    results = results.filter(pk__in=base_ids)
+                results = self.in_order_of(hit.meta.id for hit in hits)
             else:
                 # Use Postgres full-text search.
                 weights = ['A', 'B', 'C', 'D']
@@ -94,15 +173,7 @@ class SearchableMixin:
                 )
                 if guarantee_distinct_results:
                     result_ids = {result.pk: result.rank for result in results}.keys()
-                    return self.filter(pk__in=result_ids).order_by(
-                        Case(
-                            *[
-                                When(pk=pk, then=Value(pos))
-                                for pos, pk in enumerate(result_ids)
-                            ],
-                            output_field=IntegerField(),
-                        )
-                    )
+                    return self.in_order_of(result_ids)
         else:
             results = self.all()
         return results
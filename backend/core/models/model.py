@@ -4,7 +4,6 @@ import inspect
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, Match, Optional, Pattern, Type, Union
 
-import regex
 from aenum import Constant
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
@@ -14,7 +13,12 @@ from django.utils.safestring import SafeString
 from rest_framework import serializers
 from rest_framework.serializers import Serializer
 
-from core.fields.html_field import OBJECT_PLACEHOLDER_REGEX, TYPE_GROUP, PlaceholderGroups
+from core.fields.html_field import (
+    OBJECT_PLACEHOLDER_REGEX,
+    TYPE_GROUP,
+    PlaceholderGroups,
+    compile_placeholder_pattern,
+)
 from core.models.manager import SearchableManager, SearchableQuerySet
 from core.utils.models import get_html_for_view as get_html_for_view_
 from core.utils.string import truncate
@@ -60,7 +64,7 @@ class ExtendedModel(Model):
                 rf'(?P<{PlaceholderGroups.MODEL_NAME}>{content_type})',
             )
             logging.debug(f'Calculated placeholder regex for {content_type}: {pattern}')
-        return regex.compile(pattern)
+        return compile_placeholder_pattern(pattern)
 
     @classmethod
     def get_natural_key_fields(cls) -> list:
@@ -197,10 +201,12 @@ class ExtendedModel(Model):
         cls,
         match: Match,
         use_preretrieved_html: bool = False,
+        model_instance: Optional['ExtendedModel'] = None,
     ) -> str:
         """Return a model instance's HTML based on a placeholder in the admin."""
-        if not cls.get_admin_placeholder_regex().match(match.group(0)):
-            raise ValueError(f'{match} does not match {cls.get_admin_placeholder_regex()}')
+        placeholder_regex = cls.get_admin_placeholder_regex()
+        if not placeholder_regex.match(match.group(0)):
+            raise ValueError(f'{match} does not match {placeholder_regex}')
 
         if use_preretrieved_html:
             # Return the pre-retrieved HTML (already included in placeholder)
@@ -215,7 +221,7 @@ class ExtendedModel(Model):
         key = match.group(PlaceholderGroups.PK).strip()
         logging.info(f'Retrieving object HTML for {cls.__name__} {key}...')
         try:
-            model_instance = cls.objects.get(pk=key)
+            model_instance = model_instance or cls.objects.get(pk=key)
             object_html = getattr(model_instance, 'html', '')
             logging.debug(f'Retrieved object HTML: {object_html}')
         except ObjectDoesNotExist as e:
@@ -224,7 +230,9 @@ class ExtendedModel(Model):
         return object_html
 
     @classmethod
-    def get_updated_placeholder(cls, match: Match) -> str:
+    def get_updated_placeholder(
+        cls, match: Match, model_instance: Optional['ExtendedModel'] = None
+    ) -> str:
         """Return a placeholder for a model instance depicted in an HTML field."""
         if not match:
             logging.error(
@@ -234,7 +242,7 @@ class ExtendedModel(Model):
         placeholder = match.group(0)
         logging.debug(f'Looking at {truncate(placeholder)}')
         extant_html = match.group(PlaceholderGroups.HTML)
-        html = cls.get_object_html(match)
+        html = cls.get_object_html(match, model_instance=model_instance)
         if extant_html:
             logging.debug(
                 f'Replacing extant HTML in {truncate(placeholder)}\n'
@@ -275,8 +283,16 @@ class ModelSerializer(serializers.ModelSerializer):
         """Return the model name of the instance."""
         return get_model_name(instance)
 
+    @classmethod
+    def get_prefetch_lookups(cls) -> list[str]:
+        """Return the lookups of the relations read when serializing instances."""
+        return list(getattr(cls.Meta, 'prefetch_related', []))
+
     class Meta:
         fields = ['pk', 'model']
+        # Relations to prefetch when serializing instances in bulk;
+        # see `core.utils.models.serialize_instances`.
+        prefetch_related: list[str] = []
 
 
 class TypedModelSerializerMixin(serializers.ModelSerializer):
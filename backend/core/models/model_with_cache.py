@@ -2,12 +2,47 @@
 
 import json
 import logging
-from functools import wraps
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pprint import pformat
-from typing import Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from django.apps import apps
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Case, F, Func, Value, When
+from django.db.models.functions import Cast, Coalesce
 
 from core.fields.json_field import JSONField
 from core.models.model import ExtendedModel
+from core.profiling import record_store_access
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+CACHE_FIELD_NAME = 'cache'
+# Name of the (optional) field holding a counter of changes to a row's content
+CONTENT_VERSION_FIELD_NAME = 'content_version'
+
+# Registry entries take the form `(owner model, cache key, lookup from owner to dependency)`.
+CacheDependency = tuple[type['ModelWithCache'], str, str]
+
+
+class JSONBConcat(Func):
+    """Merge the keys of a JSONB value into another JSONB value (`a || b`)."""
+
+    arg_joiner = ' || '
+    template = '%(expressions)s'
+
+
+class JSONBRemoveKeys(Func):
+    """Remove keys from a JSONB value (`a - text[]`)."""
+
+    arg_joiner = ' - '
+    template = '%(expressions)s'
 
 
 class ModelWithCache(ExtendedModel):
@@ -25,10 +60,13 @@ class ModelWithCache(ExtendedModel):
 
         By default, this method wipes the instance's computations. This way,
         when the instance is updated and saved from the admin (or via a script),
-        properties will be recomputed when next accessed.  TODO: do better.
+        properties will be recomputed when next accessed.  Values computed
+        before the save (and still waiting to be written) are discarded.
         """
         if wipe_cache:
             self.cache = {}  # type: ignore
+            if self.pk:
+                _discard_pending_cache_writes(self.__class__, pk=self.pk)
         super().save(*args, **kwargs)  # type: ignore
 
     def pre_save(self):
@@ -42,43 +80,183 @@ class ModelWithCache(ExtendedModel):
         """Return prettified JSON string of computations, for debugging/admin."""
         return json.dumps(self.cache, indent=4)
 
+    def write_cache(self, **values) -> None:
+        """
+        Write computed values to the instance's cache.
+
+        Only the specified keys are written (with a JSONB partial update); the save
+        pipeline (cleaning, HTML processing, moderation, signals, etc.) is bypassed.
+        If cache writes are being batched (see `batched_cache_writes`), the values
+        are queued and written when the batch is flushed.
+        """
+        if not self.pk:
+            return
+        if self.cache is None:
+            self.cache = {}  # type: ignore
+        self.cache.update(values)
+        buffer: Optional[dict] = getattr(_cache_write_buffers, 'pending', None)
+        if buffer is not None:
+            buffer[_get_cache_model(self.__class__)][self.pk].update(values)
+        else:
+            write_cache_values(self.__class__, {self.pk: values})
+
+
+def _get_cache_model(model: type['Model']) -> type['Model']:
+    """Return the concrete model whose table holds the cache column."""
+    return model._meta.concrete_model
+
+
+def write_cache_values(model: type['Model'], values_by_pk: dict) -> int:
+    """
+    Merge computed values into the cache of one or more rows, in a single UPDATE.
+
+    `values_by_pk` maps primary keys to dictionaries of cache keys and values.
+    Keys that are not included are left untouched, and no signals are sent.
+    """
+    values_by_pk = {pk: values for pk, values in values_by_pk.items() if values}
+    if not values_by_pk:
+        return 0
+    model = _get_cache_model(model)
+    patches = [
+        When(
+            pk=pk,
+            then=Cast(Value(json.dumps(values)), output_field=models.JSONField()),
+        )
+        for pk, values in values_by_pk.items()
+    ]
+    empty_json = Cast(Value('{}'), output_field=models.JSONField())
+    return model._base_manager.filter(pk__in=values_by_pk.keys()).update(
+        **{
+            CACHE_FIELD_NAME: JSONBConcat(
+                Coalesce(F(CACHE_FIELD_NAME), empty_json, output_field=models.JSONField()),
+                Case(*patches, default=empty_json, output_field=models.JSONField()),
+                output_field=models.JSONField(),
+            )
+        }
+    )
+
+
+def clear_cache_keys(queryset: 'models.QuerySet', keys: Iterable[str]) -> int:
+    """
+    Remove the specified keys from the cache of each row in the queryset.
+
+    The content versions of the rows (if the model has them) are incremented.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return 0
+    _discard_pending_cache_writes(queryset.model, keys=keys)
+    updates = {
+        CACHE_FIELD_NAME: JSONBRemoveKeys(
+            F(CACHE_FIELD_NAME),
+            Cast(
+                Value(keys, output_field=ArrayField(models.TextField())),
+                output_field=ArrayField(models.TextField()),
+            ),
+            output_field=models.JSONField(),
+        )
+    }
+    if has_content_version(queryset.model):
+        updates[CONTENT_VERSION_FIELD_NAME] = F(CONTENT_VERSION_FIELD_NAME) + 1
+    return queryset.update(**updates)
+
+
+def has_content_version(model: type['Model']) -> bool:
+    """Return whether a model has a content version field."""
+    try:
+        model._meta.get_field(CONTENT_VERSION_FIELD_NAME)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+_cache_write_buffers = threading.local()
+
+
+@contextmanager
+def batched_cache_writes() -> Iterator[None]:
+    """
+    Batch cache writes made in the block, flushing them when the block exits.
+
+    All values computed for rows of the same model are written with one UPDATE.
+    Nested blocks are merged into the outermost block.
+    """
+    if getattr(_cache_write_buffers, 'pending', None) is not None:
+        yield
+        return
+    _cache_write_buffers.pending = defaultdict(lambda: defaultdict(dict))
+    try:
+        yield
+    finally:
+        pending = _cache_write_buffers.pending
+        _cache_write_buffers.pending = None
+        for model, values_by_pk in pending.items():
+            try:
+                write_cache_values(model, values_by_pk)
+            except Exception as error:
+                logging.error(f'Failed to write cached values for {model.__name__}: {error}')
+
+
+def _discard_pending_cache_writes(
+    model: type['Model'], pk: Optional[int] = None, keys: Optional[Sequence[str]] = None
+):
+    """Drop queued cache writes that are about to be invalidated."""
+    pending: Optional[dict] = getattr(_cache_write_buffers, 'pending', None)
+    if not pending:
+        return
+    values_by_pk = pending.get(_get_cache_model(model))
+    if not values_by_pk:
+        return
+    for row_pk in [pk] if pk is not None else list(values_by_pk):
+        if keys is None:
+            values_by_pk.pop(row_pk, None)
+        else:
+            for key in keys:
+                values_by_pk.get(row_pk, {}).pop(key, None)
+
 
 def store(
     _func=None,
     *,
     key: Optional[str] = None,
     caster: Optional[Callable] = None,
+    depends_on: Sequence[str] = (),
 ):
     """
     Cause a property of ModelWithCache to only be computed if necessary.
 
     If a previously computed value can be retrieved, return that value; otherwise,
-    compute the property value and save it in the `computations` JSON field (so
+    compute the property value and save it in the `cache` JSON field (so
     that it can subsequently be retrieved without recalculation).
 
     `store` can be used as a decorator on methods/properties of
     ModelWithCache. The point is to reduce expensive computation and db queries.
 
-    The optional decorator param `attribute_name` specifies the attribute name to
-    search for in the JSON value. If it is not specified, the JSON value will be
-    queried for a key with the same name as the decorated property/method name.
+    The optional decorator param `key` specifies the key to search for in the
+    JSON value. If it is not specified, the JSON value will be queried for a key
+    with the same name as the decorated property/method name.
 
     The optional decorator param `caster` specifies a callable to use to cast a value
     retrieved from JSON to the intended Python type (e.g., `format_html` to cast a
     string to SafeString).
 
+    The optional decorator param `depends_on` specifies lookups (from the model to
+    related models) on which the computed value depends. When an instance of a
+    related model is saved or deleted, the key is cleared from the affected rows.
+    Lookups that do not exist on a particular model are ignored.
+
     Examples:
     ``
     @property
-    @store(attribute_name='html', caster=format_html)
+    @store(key='html', caster=format_html)
     def html(self):
         html = self.related_object.html + '...'
         return html
 
-    @store(attribute_name='categorization_string')
-    def get_categorization_string(self, date: Optional[DateTime] = None):
-        categorization_string = ...
-        return categorization_string
+    @property
+    @store(key='serialized_entities', depends_on=('related_entities', 'entity_relations'))
+    def serialized_entities(self):
+        return [entity.serialize() for entity in self.related_entities.all()]
     ``
 
     For a primer on Python decorators, see:
@@ -86,6 +264,8 @@ def store(
     """
 
     def wrap(model_property):  # noqa: ANN201,WPS430
+        property_name = key or model_property.__name__
+
         @wraps(model_property)  # noqa: ANN201,WPS430
         def wrapped_property(
             model_instance: Union[ModelWithCache, ExtendedModel], *args, **kwargs
@@ -93,19 +273,19 @@ def store(
             # Avoid recursion errors when creating new model instances
             if model_instance.pk:
                 if isinstance(model_instance, ModelWithCache):
-                    property_name = key or model_property.__name__
                     # If the computation result is None, the key will be added to the
                     # JSON but its value will be None. Therefore, to check for a
                     # previous computation result, we must explicitly check for the
                     # key in the JSON rather than relying on `get`.
-                    if property_name in model_instance.cache:
+                    if model_instance.cache and property_name in model_instance.cache:
+                        record_store_access(hit=True)
                         saved_value = model_instance.cache[property_name]
                         property_value = '' if saved_value is None else saved_value
                         if caster and callable(caster):
                             property_value = caster(property_value)
                     else:
+                        record_store_access(hit=False)
                         property_value = model_property(model_instance, *args, **kwargs)
-                        model_instance.cache[property_name] = property_value
                         logging.info(
                             # Do not use the model instance's __str__ method;
                             # it may cause a recursion error.
@@ -113,8 +293,7 @@ def store(
                             f'{model_instance.__class__.__name__} ({model_instance.pk}) '
                             f'with value: {pformat(property_value)}'
                         )
-                        # Specify `wipe_cache=False` to properly update the JSON value
-                        model_instance.save(wipe_cache=False, moderate=False)  # type: ignore
+                        model_instance.write_cache(**{property_name: property_value})
                     return property_value
                 logging.error(
                     f'{model_instance.__class__.__name__} uses @store '
@@ -123,8 +302,99 @@ def store(
                 )
             return None
 
+        wrapped_property.cache_key = property_name
+        wrapped_property.cache_dependencies = tuple(depends_on)
         return wrapped_property
 
     if _func is None:
         return wrap
     return wrap(_func)
+
+
+def get_stored_properties(model: type[ModelWithCache]) -> Iterator[Callable]:
+    """Yield the `@store`-decorated callables of a model class."""
+    for klass in model.__mro__:
+        for attribute in vars(klass).values():
+            if isinstance(attribute, property):
+                attribute = attribute.fget
+            if hasattr(attribute, 'cache_key'):
+                yield attribute
+
+
+def _resolve_lookup(model: type['Model'], lookup: str) -> Optional[type['Model']]:
+    """Return the model reached by following a lookup from a model, if possible."""
+    related_model: Optional[type['Model']] = model
+    for field_name in lookup.split('__'):
+        try:
+            related_model = related_model._meta.get_field(field_name).related_model
+        except Exception:
+            return None
+        if related_model is None:
+            return None
+    return _get_cache_model(related_model)
+
+
+@lru_cache(maxsize=None)
+def get_cache_dependencies() -> dict[type['Model'], list[CacheDependency]]:
+    """Return a map of models to the cached values (of other models) that depend on them."""
+    dependencies: dict[type['Model'], list[CacheDependency]] = defaultdict(list)
+    for model in apps.get_models():
+        if not issubclass(model, ModelWithCache) or model._meta.proxy:
+            continue
+        for stored_property in get_stored_properties(model):
+            for lookup in stored_property.cache_dependencies:
+                dependency = _resolve_lookup(model, lookup)
+                if dependency is None:
+                    continue
+                entry = (model, stored_property.cache_key, lookup)
+                if entry not in dependencies[dependency]:
+                    dependencies[dependency].append(entry)
+    return dict(dependencies)
+
+
+def invalidate_dependent_caches(instance: 'Model'):
+    """Clear cached values that depend on the instance from only the affected rows."""
+    if not apps.ready:
+        return
+    dependents = get_cache_dependencies().get(_get_cache_model(instance.__class__))
+    if not dependents:
+        return
+    keys_by_lookup: dict[tuple[type['Model'], str], set[str]] = defaultdict(set)
+    for owner, cache_key, lookup in dependents:
+        keys_by_lookup[(owner, lookup)].add(cache_key)
+    for (owner, lookup), keys in keys_by_lookup.items():
+        clear_cache_keys(owner._base_manager.filter(**{lookup: instance.pk}), keys)
+
+
+def _handle_dependency_change(sender, instance, **kwargs):
+    if kwargs.get('raw'):
+        return
+    invalidate_dependent_caches(instance)
+
+
+def _handle_m2m_change(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if not apps.ready or action not in {'post_add', 'post_remove', 'pre_clear'}:
+        return
+    dependencies = get_cache_dependencies()
+    dependents = [
+        *dependencies.get(_get_cache_model(sender), []),
+        *dependencies.get(_get_cache_model(model), []),
+        *dependencies.get(_get_cache_model(instance.__class__), []),
+    ]
+    for owner, cache_key, _lookup in dependents:
+        if isinstance(instance, owner):
+            clear_cache_keys(owner._base_manager.filter(pk=instance.pk), [cache_key])
+        elif pk_set and issubclass(model, owner):
+            clear_cache_keys(owner._base_manager.filter(pk__in=pk_set), [cache_key])
+
+
+models.signals.post_save.connect(
+    _handle_dependency_change, dispatch_uid='invalidate_dependent_caches_on_save'
+)
+# Use `pre_delete` so that the affected rows can still be found through the relation.
+models.signals.pre_delete.connect(
+    _handle_dependency_change, dispatch_uid='invalidate_dependent_caches_on_delete'
+)
+models.signals.m2m_changed.connect(
+    _handle_m2m_change, dispatch_uid='invalidate_dependent_caches_on_m2m_change'
+)
@@ -3,18 +3,25 @@
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, Match, Optional, Pattern, Sequence
 
-import regex
 from aenum import Constant
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.db.models.expressions import Combinable
 from django.urls import NoReverseMatch, reverse
 from django.utils.safestring import SafeString
+from django.utils.translation import ugettext_lazy as _
 
 from apps.moderation.models.searchable import (
     SearchableModeratedManager,
     SearchableModeratedModel,
 )
-from core.fields.html_field import OBJECT_PLACEHOLDER_REGEX, TYPE_GROUP, PlaceholderGroups
+from core.fields.html_field import (
+    OBJECT_PLACEHOLDER_REGEX,
+    TYPE_GROUP,
+    PlaceholderGroups,
+    compile_placeholder_pattern,
+)
 from core.models.model_with_cache import ModelWithCache
 from core.models.slugged import SluggedModel
 from core.models.typed import TypedModel, TypedModelManager
@@ -47,6 +54,14 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
     class Meta:
         abstract = True
 
+    # Incremented when the instance is saved (or when values cached for it are
+    # invalidated), so that HTML rendered for previous versions is not reused
+    content_version = models.PositiveIntegerField(
+        verbose_name=_('content version'),
+        default=0,
+        editable=False,
+    )
+
     objects: 'Manager' = ModuleManager()
     searchable_fields: ClassVar[Optional[FieldList]] = None
     placeholder_regex: Optional[str] = None
@@ -61,8 +76,13 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
         ModelWithCache.pre_save(self)
         SluggedModel.pre_save(self)
         SearchableModeratedModel.pre_save(self)
+        # Increment the version in the db rather than from the in-memory value,
+        # which may be stale (e.g., if it was deserialized from a change).
+        self.content_version = 1 if self._state.adding else models.F('content_version') + 1
 
     def post_save(self):
+        if isinstance(self.content_version, Combinable):
+            self.refresh_from_db(fields=['content_version'])
         ModelWithCache.post_save(self)
         SluggedModel.post_save(self)
         SearchableModeratedModel.post_save(self)
@@ -80,7 +100,7 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
                 rf'(?P<{PlaceholderGroups.MODEL_NAME}>{content_type})',
             )
             logging.debug(f'Calculated placeholder regex for {content_type}: {pattern}')
-        return regex.compile(pattern)
+        return compile_placeholder_pattern(pattern)
 
     @classmethod
     def get_natural_key_fields(cls) -> list:
@@ -178,10 +198,12 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
         cls,
         match: Match,
         use_preretrieved_html: bool = False,
+        model_instance: Optional['Module'] = None,
     ) -> str:
         """Return a model instance's HTML based on a placeholder in the admin."""
-        if not cls.get_admin_placeholder_regex().match(match.group(0)):
-            raise ValueError(f'{match} does not match {cls.get_admin_placeholder_regex()}')
+        placeholder_regex = cls.get_admin_placeholder_regex()
+        if not placeholder_regex.match(match.group(0)):
+            raise ValueError(f'{match} does not match {placeholder_regex}')
         if use_preretrieved_html:
             # Return the pre-retrieved HTML (already included in placeholder)
             preretrieved_html = match.group(PlaceholderGroups.HTML)
@@ -195,7 +217,7 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
         key = match.group(PlaceholderGroups.PK).strip()
         logging.info(f'Retrieving object HTML for {cls.__name__} {key}...')
         try:
-            model_instance = cls.objects.get(pk=key)
+            model_instance = model_instance or cls.objects.get(pk=key)
             object_html = getattr(model_instance, 'html', '')
             logging.debug(f'Retrieved object HTML: {object_html}')
         except ObjectDoesNotExist as e:
@@ -204,7 +226,9 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
         return object_html
 
     @classmethod
-    def get_updated_placeholder(cls, match: Match) -> str:
+    def get_updated_placeholder(
+        cls, match: Match, model_instance: Optional['Module'] = None
+    ) -> str:
         """Return a placeholder for a model instance depicted in an HTML field."""
         if not match:
             logging.error(
@@ -214,7 +238,7 @@ class Module(SearchableModeratedModel, SluggedModel, ModelWithCache):
         placeholder = match.group(0)
         logging.debug(f'Looking at {truncate(placeholder)}')
         extant_html = match.group(PlaceholderGroups.HTML)
-        html = cls.get_object_html(match)
+        html = cls.get_object_html(match, model_instance=model_instance)
         if extant_html:
             logging.debug(
                 f'Replacing extant HTML in {truncate(placeholder)}\n'
@@ -0,0 +1,249 @@
+"""
+Lightweight, sampled profiling of requests.
+
+A sampled request is profiled by wrapping the execution of its SQL queries and
+by timing the code paths instrumented with `timed` (e.g., Elasticsearch queries
+and template rendering). Its metrics are aggregated in memory, by route, and are
+exposed by the `metrics` view. Metrics are aggregated per (worker) process.
+
+Queries are fingerprinted by their shape (i.e., their SQL with literal values
+and `IN` lists collapsed), so that a shape executed repeatedly in a single
+request (i.e., an N+1 query pattern) can be identified.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import connections
+from django.http import JsonResponse
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+ELASTICSEARCH = 'elasticsearch'
+RENDERING = 'rendering'
+
+# Maximum number of repeated query shapes tracked per route
+MAX_FINGERPRINTS_PER_ROUTE = 20
+# Maximum length of the query shapes included in metrics
+MAX_FINGERPRINT_LENGTH = 500
+
+UNRESOLVED_ROUTE = '<unresolved>'
+
+LITERAL_REGEX = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+IN_LIST_REGEX = re.compile(r'\bIN \((?:\?|%s)(?:, (?:\?|%s))*\)', re.IGNORECASE)
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+
+def get_fingerprint(sql: str) -> str:
+    """Return the shape of a SQL query, with its literal values collapsed."""
+    sql = LITERAL_REGEX.sub('?', sql)
+    sql = IN_LIST_REGEX.sub('IN (...)', sql)
+    return WHITESPACE_REGEX.sub(' ', sql).strip()
+
+
+class RequestProfile:
+    """Metrics recorded while handling a single request."""
+
+    def __init__(self):
+        self.n_queries = 0
+        self.query_time = 0.0
+        self.fingerprints: Counter = Counter()
+        self.store_hits = 0
+        self.store_misses = 0
+        self.times: Counter = Counter()
+        # Categories currently being timed, so that nested timing is not double-counted
+        self.active_categories: set[str] = set()
+
+    def record_query(
+        self, execute: Callable, sql: str, params, many: bool, context: dict
+    ) -> Any:
+        """Execute a query, recording its shape and duration."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_time += time.perf_counter() - start
+            self.n_queries += 1
+            self.fingerprints[get_fingerprint(sql)] += 1
+
+
+@dataclass
+class RouteMetrics:
+    """Metrics aggregated over the profiled requests to a route."""
+
+    requests: int = 0
+    queries: int = 0
+    max_queries: int = 0
+    query_time: float = 0.0
+    store_hits: int = 0
+    store_misses: int = 0
+    times: Counter = field(default_factory=Counter)
+    # Maps repeated query shapes to the number of requests in which they were repeated
+    repeated_queries: Counter = field(default_factory=Counter)
+    # Maps repeated query shapes to the most times they were repeated in a request
+    max_repetitions: dict[str, int] = field(default_factory=dict)
+
+    def add(self, profile: RequestProfile):
+        """Add the metrics of a request."""
+        self.requests += 1
+        self.queries += profile.n_queries
+        self.max_queries = max(self.max_queries, profile.n_queries)
+        self.query_time += profile.query_time
+        self.store_hits += profile.store_hits
+        self.store_misses += profile.store_misses
+        self.times.update(profile.times)
+        threshold = settings.REQUEST_PROFILING_REPEATED_QUERY_THRESHOLD
+        for fingerprint, count in profile.fingerprints.items():
+            if count < threshold:
+                continue
+            tracked = fingerprint in self.repeated_queries
+            if not tracked and len(self.repeated_queries) >= MAX_FINGERPRINTS_PER_ROUTE:
+                continue
+            self.repeated_queries[fingerprint] += 1
+            self.max_repetitions[fingerprint] = max(
+                self.max_repetitions.get(fingerprint, 0), count
+            )
+
+    def serialize(self) -> dict:
+        """Return the metrics in a JSON-compatible format."""
+
+        def mean(total: float) -> float:
+            return round(total / self.requests, 2) if self.requests else 0.0
+
+        return {
+            'requests': self.requests,
+            'queries': {'mean': mean(self.queries), 'max': self.max_queries},
+            'query_time_ms': mean(self.query_time * 1000),
+            'store': {'hits': self.store_hits, 'misses': self.store_misses},
+            'elasticsearch_time_ms': mean(self.times[ELASTICSEARCH] * 1000),
+            'rendering_time_ms': mean(self.times[RENDERING] * 1000),
+            'repeated_queries': [
+                {
+                    'sql': fingerprint[:MAX_FINGERPRINT_LENGTH],
+                    'requests': n_requests,
+                    'max_repetitions': self.max_repetitions[fingerprint],
+                }
+                for fingerprint, n_requests in self.repeated_queries.most_common()
+            ],
+        }
+
+
+_local = threading.local()
+_lock = threading.Lock()
+_metrics_by_route: dict[str, RouteMetrics] = {}
+_started_at = datetime.now()
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    """Return the profile of the request being handled, if it is profiled."""
+    return getattr(_local, 'profile', None)
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """Profile the queries and instrumented code paths executed in the block."""
+    profile = RequestProfile()
+    _local.profile = profile
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile.record_query))
+            yield profile
+    finally:
+        _local.profile = None
+
+
+def record_store_access(hit: bool):
+    """Record a retrieval (hit) or computation (miss) of a `@store` property value."""
+    profile = get_current_profile()
+    if profile is None:
+        return
+    if hit:
+        profile.store_hits += 1
+    else:
+        profile.store_misses += 1
+
+
+def start_timer(category: str) -> Callable[..., None]:
+    """
+    Start timing a category in the current profile, if any.
+
+    Return a callback that stops the timer. Nested timing of a category is
+    ignored, so that time is not counted twice.
+    """
+    profile = get_current_profile()
+    if profile is None or category in profile.active_categories:
+        return lambda *args: None
+    profile.active_categories.add(category)
+    start = time.perf_counter()
+
+    def stop(*args):
+        profile.times[category] += time.perf_counter() - start
+        profile.active_categories.discard(category)
+
+    return stop
+
+
+@contextmanager
+def timed(category: str) -> Iterator[None]:
+    """Add the time taken by the block to the current profile, if any."""
+    stop = start_timer(category)
+    try:
+        yield
+    finally:
+        stop()
+
+
+def record_request(route: str, profile: RequestProfile):
+    """Add the metrics of a profiled request to the metrics of its route."""
+    with _lock:
+        route_metrics = _metrics_by_route.get(route)
+        if route_metrics is None:
+            route_metrics = _metrics_by_route[route] = RouteMetrics()
+        route_metrics.add(profile)
+    threshold = settings.REQUEST_PROFILING_REPEATED_QUERY_THRESHOLD
+    repeated = [count for count in profile.fingerprints.values() if count >= threshold]
+    if repeated:
+        logging.warning(
+            f'{route} repeated {len(repeated)} query shape(s) '
+            f'up to {max(repeated)} times in {profile.n_queries} queries.'
+        )
+
+
+def get_route(request: 'HttpRequest') -> str:
+    """Return the route (i.e., URL pattern) to which a request was resolved."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return UNRESOLVED_ROUTE
+    return f'{request.method} /{match.route}' if match.route else match.view_name
+
+
+def get_metrics() -> dict:
+    """Return the aggregated metrics, with routes ordered by mean query count."""
+    with _lock:
+        routes = {route: metrics.serialize() for route, metrics in _metrics_by_route.items()}
+    return {
+        'pid': os.getpid(),
+        'since': _started_at.isoformat(),
+        'sample_rate': settings.REQUEST_PROFILING_SAMPLE_RATE,
+        'routes': dict(
+            sorted(routes.items(), key=lambda item: item[1]['queries']['mean'], reverse=True)
+        ),
+    }
+
+
+@staff_member_required
+def metrics(request: 'HttpRequest') -> JsonResponse:
+    """Return the profiling metrics aggregated by this process."""
+    return JsonResponse(get_metrics())
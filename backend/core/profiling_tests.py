@@ -0,0 +1,95 @@
+"""Tests for request profiling."""
+
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.urls import reverse
+
+from core import profiling
+from core.config import debugging
+from core.middleware import ProfilingMiddleware
+
+
+def test_fingerprint():
+    """Test collapsing the literal values of queries into their shapes."""
+    assert (
+        profiling.get_fingerprint(
+            "SELECT *  FROM t1\n WHERE id = 12 AND name = 'O''Brien' AND x > 1.5"
+        )
+        == 'SELECT * FROM t1 WHERE id = ? AND name = ? AND x > ?'
+    )
+    # Queries differing only in the lengths of their `IN` lists have the same shape.
+    assert (
+        profiling.get_fingerprint('SELECT * FROM t WHERE id IN (1, 2, 3)')
+        == profiling.get_fingerprint('SELECT * FROM t WHERE id IN (%s)')
+        == 'SELECT * FROM t WHERE id IN (...)'
+    )
+
+
+def test_repeated_queries(settings):
+    """Test reporting the query shapes repeated in requests to a route."""
+    settings.REQUEST_PROFILING_REPEATED_QUERY_THRESHOLD = 3
+    metrics = profiling.RouteMetrics()
+    for n_repetitions in (3, 4, 2):
+        profile = profiling.RequestProfile()
+        profile.fingerprints = Counter({'SELECT ?': n_repetitions, 'SELECT 1': 1})
+        profile.n_queries = n_repetitions + 1
+        metrics.add(profile)
+    serialized_metrics = metrics.serialize()
+    assert serialized_metrics['requests'] == 3
+    assert serialized_metrics['queries'] == {'mean': 4.0, 'max': 5}
+    # Shapes executed fewer times than the threshold in a request are not reported.
+    assert serialized_metrics['repeated_queries'] == [
+        {'sql': 'SELECT ?', 'requests': 2, 'max_repetitions': 4}
+    ]
+
+
+@pytest.mark.django_db()
+def test_profiling_middleware(rf, settings, monkeypatch):
+    """Test profiling a sample of requests."""
+    recorded_profiles = []
+    monkeypatch.setattr(
+        profiling,
+        'record_request',
+        lambda route, profile: recorded_profiles.append((route, profile)),
+    )
+
+    def get_response(request):
+        for _ in range(2):
+            get_user_model().objects.count()
+        return HttpResponse()
+
+    middleware = ProfilingMiddleware(get_response)
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 0.0
+    middleware(rf.get('/'))
+    assert not recorded_profiles
+
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 1.0
+    middleware(rf.get('/'))
+    [(route, profile)] = recorded_profiles
+    assert route == profiling.UNRESOLVED_ROUTE
+    assert profile.n_queries == 2
+    assert list(profile.fingerprints.values()) == [2]
+    assert profiling.get_current_profile() is None
+    # Requests for the metrics are not profiled.
+    middleware(rf.get(reverse('metrics')))
+    assert len(recorded_profiles) == 1
+
+
+def test_silk_interception(rf, monkeypatch):
+    """Test choosing the requests that Silk profiles."""
+    monkeypatch.setattr(debugging, 'TESTING', False)
+    monkeypatch.setattr(debugging, 'PROFILE_ALL_REQUESTS', False)
+    # Silk may intercept requests before their users are set.
+    request = rf.get('/')
+    assert not debugging.intercept(request)
+    request.user = SimpleNamespace(is_superuser=False)
+    assert not debugging.intercept(request)
+    request.user = SimpleNamespace(is_superuser=True)
+    assert debugging.intercept(request)
+    assert not debugging.intercept(rf.get('/healthcheck/'))
+    monkeypatch.setattr(debugging, 'PROFILE_ALL_REQUESTS', True)
+    assert debugging.intercept(rf.get('/'))
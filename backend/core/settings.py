@@ -191,6 +191,8 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     # https://github.com/jazzband/django-silk
     'silk.middleware.SilkyMiddleware',
+    # Profile a sample of requests (more cheaply than Silk):
+    'core.middleware.ProfilingMiddleware',
     # Update cache:
     # https://docs.djangoproject.com/en/dev/topics/cache/#order-of-middleware
     'django.middleware.cache.UpdateCacheMiddleware',
@@ -217,6 +219,8 @@ MIDDLEWARE = [
     # 'defender.middleware.FailedLoginMiddleware',  # TODO
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Write values computed by `@store` properties in batches:
+    'core.middleware.BatchedCacheWritesMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
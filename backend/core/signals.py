@@ -1,11 +1,9 @@
-from celery import shared_task
-from django.db import models, transaction
-from django.utils import timezone
+from django.db import models
 from django_elasticsearch_dsl.apps import DEDConfig
-from django_elasticsearch_dsl.registries import registry
 from django_elasticsearch_dsl.signals import BaseSignalProcessor
 
-from core.utils import models as utils
+from apps.search import indexing
+from apps.search.caching import get_instance_indexes, invalidate_indexes
 
 
 class CelerySignalProcessor(BaseSignalProcessor):
@@ -13,53 +11,29 @@ class CelerySignalProcessor(BaseSignalProcessor):
     Celery signal processor for ElasticSearch DSL.
 
     Allows automatic updates on the index as delayed background tasks using Celery.
+    Saves are queued (see `apps.search.indexing`), so that repeated saves of an instance
+    within the indexing window result in a single update.
 
     Note: Processing deletes is still handled synchronously, since by the time the Celery
     worker would pick up the delete job, the model instance would already be deleted.
-    """
 
-    NO_INDEXED_AT_FIELD = -1
+    Whenever an index is written to, it is refreshed and its version is bumped,
+    invalidating the search responses that were cached for it.
+    """
 
     def handle_save(self, sender, instance, **kwargs):
         if not DEDConfig.autosync_enabled():
             return
 
-        if instance.__class__ not in registry.get_models():
-            return
-
-        serialized_sender = utils.serialize_model(sender)
-        serialized_instance = utils.serialize_model_instance(instance)
-        return self.async_handle_save.apply_async(
-            (
-                serialized_sender,
-                serialized_instance,
-                getattr(instance, 'indexed_at', self.NO_INDEXED_AT_FIELD),
-            ),
-            countdown=10,
-        )
-
-    @staticmethod
-    def perform_elastic_update(instance):
-        registry.update(instance)
-        registry.update_related(instance)
-
-    @shared_task(bind=True)
-    def async_handle_save(self, sender, instance, indexed_at):
-        deserialized_sender = utils.deserialize_model(sender)  # noqa
-
-        if indexed_at == CelerySignalProcessor.NO_INDEXED_AT_FIELD:
-            instance = utils.deserialize_model_instance(instance)
-            CelerySignalProcessor.perform_elastic_update(instance)
+        if not indexing.is_indexed(instance.__class__):
             return
 
-        with transaction.atomic():
-            time_of_retrieval = timezone.now()
-            instance = utils.deserialize_model_instance(instance, select_for_update=True)
-            if utils.has_been_indexed_since(instance, timestamp=indexed_at):
-                return
+        # Saves are coalesced and the affected documents are updated in bulk.
+        indexing.enqueue(instance)
 
-            CelerySignalProcessor.perform_elastic_update(instance)
-            utils.update_indexed_at(instance, timestamp=time_of_retrieval)
+    def handle_delete(self, sender, instance, **kwargs):
+        super().handle_delete(sender, instance, **kwargs)
+        invalidate_indexes(get_instance_indexes(instance))
 
     def setup(self):
         """Set up listeners."""
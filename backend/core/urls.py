@@ -31,7 +31,7 @@ from watchman.views import bare_status
 
 from apps.admin.model_admin import admin_site
 from apps.users.api.views import set_csrf_token
-from core import errors
+from core import errors, profiling
 from core.environment import IS_DEV
 from core.sitemap import sitemaps
 
@@ -116,6 +116,8 @@ urlpatterns = [
     re_path(r'api/errors/(?P<error_code>\d+)/?$', errors.error),  # API error trigger
     # https://github.com/jazzband/django-silk
     path('silk/', include('silk.urls', namespace='silk')),
+    # Sampled request profiling metrics
+    path('metrics/', profiling.metrics, name='metrics'),
     # Graphviz model graph
     path('model-graph/', ModelGraphView.as_view()),
     # ---------------------------------
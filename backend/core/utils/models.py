@@ -1,128 +1,139 @@
 import logging
-from datetime import datetime
-from typing import Dict, Optional, Union
+from collections import defaultdict
+from typing import Iterable, Optional, Union
 
-from django.apps import apps
-from django.db.models import Model
-from django.db.models.base import ModelBase
+import inflect
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, prefetch_related_objects
 from django.template import loader
-from django.utils import dateparse
-from django.utils.html import format_html
-from django.utils.safestring import SafeString
+from django.utils.safestring import SafeString, mark_safe
 
 from apps.search.templatetags.highlight import highlight
+from core.profiling import RENDERING, timed
 
 
-def get_html_for_view(
-    model_instance: Union[dict, Model],
-    template_name: str,
-    text_to_highlight: Optional[str] = None,
-) -> SafeString:
-    """Return the HTML for the specified view of the model instance."""
+FRAGMENT_KEY_PREFIX = 'html_fragment'
+
+
+def get_template_names(model_instance: Union[dict, Model], template_name: str) -> list[str]:
+    """Return the names of the templates (in order of preference) for a view."""
     if isinstance(model_instance, dict):
         app_name, model_name = model_instance['model'].split('.')
     else:
         model_cls: type[Model] = model_instance.__class__
         app_name = model_cls._meta.app_label
         model_name = model_cls.__name__.lower()
-    template_directory_name = app_name
-    template_name = f'{template_directory_name}/_{template_name}.html'
-    logging.debug(f'Rendering {template_name} for {model_instance}...')
-    template = loader.get_template(template_name)
+    return [
+        f'{app_name}/_{template_name}.html',
+        f'{inflect.engine().plural(model_name)}/_{template_name}.html',
+    ]
+
+
+def render_html_for_view(model_instance: Union[dict, Model], template_name: str) -> str:
+    """Render the HTML for the specified view of the model instance."""
+    if isinstance(model_instance, dict):
+        model_name = model_instance['model'].split('.')[1]
+    else:
+        model_name = model_instance.__class__.__name__.lower()
     context = {
         model_name: model_instance,
         'object': model_instance,
     }
-    response = template.render(context)
-    if text_to_highlight:
-        response = highlight(response, text_to_highlight=text_to_highlight)
-    return format_html(response)
+    template_names = get_template_names(model_instance, template_name)
+    logging.debug(f'Rendering {template_names[0]} for {model_instance}...')
+    with timed(RENDERING):
+        template = loader.select_template(template_names)
+        return template.render(context)
 
 
-def serialize_model(model: Optional[ModelBase]) -> Optional[Dict[str, str]]:
-    """
-    Accepts a django.db.models.Model class and returns a serialized dict of
-    it, so it may be sent to Celery workers over HTTP.
+def get_fragment_cache_key(
+    model_instance: Union[dict, Model], template_name: str
+) -> Optional[str]:
     """
-    if model and isinstance(model, ModelBase):
-        return {'app': model._meta.app_label, 'model': model._meta.model_name}
-    return None
+    Return the cache key of the HTML rendered for a view of a model instance.
 
-
-def deserialize_model(serialized_model: Optional[Dict[str, str]]) -> Optional[Model]:
-    """
-    Accepts a serialized django.db.models.Model class and returns the class.
+    The key includes the instance's content version, so that HTML rendered for
+    a previous version is never reused. Serialized instances (dictionaries) and
+    instances without content versions are not cached.
     """
-    if not serialized_model:
+    if not settings.HTML_FRAGMENT_CACHE_TIMEOUT or isinstance(model_instance, dict):
         return None
-    app = serialized_model.get('app')
-    model = serialized_model.get('model')
-    if app and model:
-        return apps.get_model(app, model)
-    return None
+    content_version = getattr(model_instance, 'content_version', None)
+    if content_version is None or not model_instance.pk:
+        return None
+    label = model_instance._meta.label_lower
+    return (
+        f'{FRAGMENT_KEY_PREFIX}:{label}:{model_instance.pk}:{template_name}:{content_version}'
+    )
 
 
-def serialize_model_instance(instance: Optional[Model]) -> Optional[Dict[str, str]]:
-    """
-    Accept an django.db.models.Model instance and serializes it to a dictionary,
-    so it may be serialized and sent to Celery workers over HTTP
+def get_html_for_views(
+    model_instances: Iterable[Union[dict, Model]],
+    template_name: str,
+    text_to_highlight: Optional[str] = None,
+) -> list[SafeString]:
     """
-    if not instance:
-        return None
+    Return the HTML for the specified view of each model instance, in order.
 
-    deserialized = serialize_model(instance.__class__)
-    deserialized['id'] = str(instance.id)
-    return deserialized
+    Cached fragments are retrieved with a single multi-get; only the missing
+    fragments are rendered, and they are cached with a single multi-set.
+    """
+    model_instances = list(model_instances)
+    keys = [get_fragment_cache_key(instance, template_name) for instance in model_instances]
+    cached_fragments = cache.get_many([key for key in keys if key]) if any(keys) else {}
+    fragments: list[str] = []
+    rendered_fragments: dict[str, str] = {}
+    for model_instance, key in zip(model_instances, keys):
+        fragment = cached_fragments.get(key) if key else None
+        if fragment is None:
+            fragment = render_html_for_view(model_instance, template_name)
+            if key:
+                rendered_fragments[key] = fragment
+        fragments.append(fragment)
+    if rendered_fragments:
+        cache.set_many(rendered_fragments, timeout=settings.HTML_FRAGMENT_CACHE_TIMEOUT)
+    if text_to_highlight:
+        fragments = [
+            highlight(fragment, text_to_highlight=text_to_highlight) for fragment in fragments
+        ]
+    return [mark_safe(fragment) for fragment in fragments]
 
 
-def deserialize_model_instance(
-    serialized_instance: Optional[Dict[str, str]], *, select_for_update: bool = False
-):
-    """
-    Accepts a serialized version of a Django model, and returns the instance.
-    set kwargs select_for_update=True to lock the table row, preventing other
-    threads from updating the instance while we work on it.
-    """
-    if not serialized_instance or not serialized_instance.get('id'):
-        return None
-    model = deserialize_model(serialized_instance)
-    if not model:
-        return None
-    if select_for_update:
-        return (
-            model.objects.filter(id=serialized_instance.get('id')).select_for_update().first()
-        )
-    return model.objects.filter(id=serialized_instance.get('id')).first()
+def get_html_for_view(
+    model_instance: Union[dict, Model],
+    template_name: str,
+    text_to_highlight: Optional[str] = None,
+) -> SafeString:
+    """Return the HTML for the specified view of the model instance."""
+    return get_html_for_views(
+        [model_instance], template_name, text_to_highlight=text_to_highlight
+    )[0]
 
 
-def has_been_indexed_since(instance: Model, *, timestamp: Optional[datetime]):
+def serialize_instances(instances: Iterable[Union[dict, Model]]) -> list[dict]:
     """
-    If instance has attribute indexed_at, we use this to determine if
-    the instance has been indexed between the time the task was called
-    was called, and now.
+    Serialize a (possibly heterogeneous) list of model instances, in order.
 
-    If it has been, reindexing is unnecessary.
-    """
-    if not instance:
-        return False
-    if not getattr(instance, 'indexed_at', None):
-        return False
-    if not timestamp and not instance.indexed_at:
-        return False
-    if not timestamp and instance.indexed_at:
-        return True
-    if isinstance(timestamp, str):
-        timestamp = dateparse.parse_datetime(timestamp)
-    return instance.indexed_at > timestamp
-
-
-def update_indexed_at(instance: Model, *, timestamp: Optional[datetime]):
-    """
-    Updates attribute indexed_at (if it exists) without triggering
-    save_handler(). This prevents a loop from occuring
+    Instances are grouped by model, and each group is serialized by a single
+    serializer, after the relations read by the serializer are prefetched (with
+    one query per relation). Dictionaries (i.e., instances that are already
+    serialized) are returned as-is.
     """
-    if not hasattr(instance, 'indexed_at'):
-        return
-    if not hasattr(instance.__class__, 'objects'):
-        return
-    instance.__class__.objects.filter(pk=instance.pk).update(indexed_at=timestamp)
+    instances = list(instances)
+    serialized_instances: list[Optional[dict]] = [None] * len(instances)
+    positions_by_model: dict[type[Model], list[int]] = defaultdict(list)
+    for position, instance in enumerate(instances):
+        if isinstance(instance, dict):
+            serialized_instances[position] = instance
+        else:
+            positions_by_model[instance.__class__].append(position)
+    for model, positions in positions_by_model.items():
+        group = [instances[position] for position in positions]
+        serializer = model.get_serializer()
+        lookups = serializer.get_prefetch_lookups()
+        if lookups:
+            prefetch_related_objects(group, *lookups)
+        for position, data in zip(positions, serializer(group, many=True).data):
+            serialized_instances[position] = data
+    return serialized_instances
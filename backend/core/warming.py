@@ -0,0 +1,230 @@
+"""
+Bulk precomputation of the values cached by modules (and other models with caches).
+
+Each warming run plans the chunks of every model to warm when it starts, and
+records the completion of each chunk under the run's ID, so that an interrupted
+run can be resumed (by its ID) without its chunks shifting as rows are added.
+A run's checkpoints are cleared when its last chunk is completed; new runs
+always warm every chunk.
+"""
+
+import logging
+import uuid
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Sequence
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+
+from apps.images.models.model_with_images import ModelWithImages
+from apps.sources.models.model_with_sources import ModelWithSources
+from apps.topics.models.taggable import TaggableModel
+from core.models.model_with_cache import (
+    ModelWithCache,
+    batched_cache_writes,
+    get_stored_properties,
+)
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+DEFAULT_CHUNK_SIZE = 200
+CHECKPOINT_KEY_PREFIX = 'cache_warming'
+# Checkpoints of runs that are never completed expire after a week.
+CHECKPOINT_TIMEOUT = 7 * 24 * 60 * 60
+
+# Cached relations (outside of `@store` properties), mapped to
+# the method used to compute them and the lookup to prefetch.
+CACHED_RELATIONS: dict[str, tuple[type['Model'], str, str]] = {
+    'citations': (ModelWithSources, 'serialize_citations', 'citations__source'),
+    'images': (ModelWithImages, 'serialize_images', 'image_relations__image'),
+    'tags': (TaggableModel, 'serialize_tags', 'topic_relations__topic'),
+}
+
+
+def get_models_with_cache() -> list[type[ModelWithCache]]:
+    """Return the concrete models with computed values stored in a cache."""
+    return [
+        model
+        for model in apps.get_models()
+        if issubclass(model, ModelWithCache) and not model._meta.proxy
+    ]
+
+
+def get_model_label(model: type['Model']) -> str:
+    """Return the label (e.g., "quotes.quote") of a model."""
+    return f'{model._meta.app_label}.{model._meta.model_name}'
+
+
+def get_prefetch_lookups(model: type['Model']) -> list[str]:
+    """Return the lookups to prefetch to compute a model's cached values in bulk."""
+    lookups: list[str] = []
+    for stored_property in get_stored_properties(model):
+        for lookup in stored_property.cache_dependencies:
+            try:
+                model._meta.get_field(lookup.split('__')[0])
+            except FieldDoesNotExist:
+                continue
+            lookups.append(lookup)
+    for base_model, _method_name, lookup in CACHED_RELATIONS.values():
+        if issubclass(model, base_model):
+            lookups.append(lookup)
+    return list(dict.fromkeys(lookups))
+
+
+def iter_chunks(model: type['Model'], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list]:
+    """Yield lists of primary keys, in order, for all rows of the model."""
+    pks = list(model._base_manager.order_by('pk').values_list('pk', flat=True))
+    for index in range(0, len(pks), chunk_size):
+        yield pks[index : index + chunk_size]
+
+
+class Chunk(NamedTuple):
+    """A chunk of model instances to be warmed in a run."""
+
+    model_label: str
+    index: int
+    pks: list
+
+
+def get_run_key(run_id: str, suffix: str) -> str:
+    """Return the key of a value recording the state of a warming run."""
+    return f'{CHECKPOINT_KEY_PREFIX}:{run_id}:{suffix}'
+
+
+def get_checkpoint_key(run_id: str, model_label: str, index: int) -> str:
+    """Return the key of the checkpoint recording a chunk's completion in a run."""
+    return get_run_key(run_id, f'{model_label}:{index}')
+
+
+def get_chunks(plan: dict[str, list[list]]) -> list[Chunk]:
+    """Return the chunks of a run's plan, which maps model labels to lists of pks."""
+    return [
+        Chunk(model_label, index, pks)
+        for model_label, model_chunks in plan.items()
+        for index, pks in enumerate(model_chunks)
+    ]
+
+
+def start_run(
+    models: Sequence[type['Model']], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> tuple[str, list[Chunk]]:
+    """Plan the chunks of a new warming run, returning the run's ID and chunks."""
+    run_id = uuid.uuid4().hex[:12]
+    plan = {
+        get_model_label(model): list(iter_chunks(model, chunk_size=chunk_size))
+        for model in models
+    }
+    chunks = get_chunks(plan)
+    if chunks:
+        cache.set_many(
+            {get_run_key(run_id, 'plan'): plan, get_run_key(run_id, 'pending'): len(chunks)},
+            timeout=CHECKPOINT_TIMEOUT,
+        )
+    return run_id, chunks
+
+
+def get_pending_chunks(run_id: str) -> list[Chunk]:
+    """Return the chunks of a run that have yet to be completed."""
+    plan: Optional[dict[str, list[list]]] = cache.get(get_run_key(run_id, 'plan'))
+    if plan is None:
+        raise ValueError(f'Cache warming run {run_id} does not exist or is complete.')
+    chunks = get_chunks(plan)
+    completed = cache.get_many(
+        [get_checkpoint_key(run_id, chunk.model_label, chunk.index) for chunk in chunks]
+    )
+    return [
+        chunk
+        for chunk in chunks
+        if get_checkpoint_key(run_id, chunk.model_label, chunk.index) not in completed
+    ]
+
+
+def clear_run(run_id: str):
+    """Remove the plan and checkpoints of a run."""
+    plan: dict[str, list[list]] = cache.get(get_run_key(run_id, 'plan')) or {}
+    keys = [
+        get_checkpoint_key(run_id, chunk.model_label, chunk.index)
+        for chunk in get_chunks(plan)
+    ]
+    cache.delete_many([*keys, get_run_key(run_id, 'plan'), get_run_key(run_id, 'pending')])
+
+
+def complete_chunk(run_id: str, model_label: str, index: int, count: int):
+    """Record a chunk's completion, clearing the run's checkpoints if it was the last."""
+    checkpoint_key = get_checkpoint_key(run_id, model_label, index)
+    # Chunks that are warmed again (e.g., by retried tasks) are only counted once.
+    if not cache.add(checkpoint_key, count, timeout=CHECKPOINT_TIMEOUT):
+        return
+    try:
+        pending = cache.decr(get_run_key(run_id, 'pending'))
+    except ValueError:
+        # The run has already been cleared.
+        return
+    if pending <= 0:
+        clear_run(run_id)
+
+
+def warm_instance(instance: ModelWithCache):
+    """Compute (and queue writes of) every missing cached value of a model instance."""
+    for stored_property in get_stored_properties(type(instance)):
+        try:
+            stored_property(instance)
+        except Exception as error:
+            logging.error(
+                f'Failed to compute `{stored_property.cache_key}` for '
+                f'{instance.__class__.__name__} ({instance.pk}): {error}'
+            )
+    for key, (base_model, method_name, _lookup) in CACHED_RELATIONS.items():
+        if not isinstance(instance, base_model) or instance.cache.get(key):
+            continue
+        try:
+            instance.write_cache(**{key: getattr(instance, method_name)()})
+        except Exception as error:
+            logging.error(
+                f'Failed to compute `{key}` for '
+                f'{instance.__class__.__name__} ({instance.pk}): {error}'
+            )
+
+
+def warm_chunk(
+    model_label: str,
+    pks: Sequence,
+    force: bool = False,
+    run_id: Optional[str] = None,
+    index: Optional[int] = None,
+) -> int:
+    """
+    Compute the cached values of a chunk of model instances.
+
+    Related objects are prefetched for the whole chunk, and the computed values
+    are written with one UPDATE. If the chunk belongs to a run, its completion
+    is recorded. Return the number of instances warmed.
+    """
+    model = apps.get_model(model_label)
+    queryset = model._base_manager.filter(pk__in=pks).prefetch_related(
+        *get_prefetch_lookups(model)
+    )
+    count = 0
+    with batched_cache_writes():
+        for instance in queryset:
+            if force or instance.cache is None:
+                instance.cache = {}
+            warm_instance(instance)
+            count += 1
+    if run_id is not None and index is not None:
+        complete_chunk(run_id, model_label, index, count)
+    return count
+
+
+def resolve_models(
+    model_labels: Optional[Sequence[str]] = None,
+) -> list[type[ModelWithCache]]:
+    """Return the models specified by label, or all models with caches."""
+    if not model_labels:
+        return get_models_with_cache()
+    models = [apps.get_model(label)._meta.concrete_model for label in model_labels]
+    for model in models:
+        if not issubclass(model, ModelWithCache):
+            raise ValueError(f'{get_model_label(model)} has no cache.')
+    return list(dict.fromkeys(models))